@@ -0,0 +1,80 @@
+"""
+Compare the notebook's thread-per-symbol streaming with the single-threaded engine.
+
+Usage: python -m benchmarks.bench_engine [ticks.csv]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+from strategy.Strategies_template import Strategy_template
+from tradeSim import StrategyHandler
+from tradeSim import TradeSim
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_TICKS = os.path.join(ROOT, "marketInfo", "ticks", "2025-10-20.csv")
+
+
+class every_nth_tick(Strategy_template):
+    """Buys on every 500th tick of a symbol and sells the position 250 ticks later."""
+
+    def __init__(self, handler):
+        super().__init__("BENCH", "every_nth_tick", handler)
+        self.count = 0
+
+    def on_data(self, row):
+        self.count += 1
+        if self.count % 500 == 0:
+            self.handler.create_order_to_limit(100, row["LastPrice"], "Buy", row["ShareCode"])
+        elif self.count % 500 == 250 and self.handler.check_port_has_stock(row["ShareCode"], 100):
+            self.handler.create_order_to_limit(100, row["LastPrice"], "Sell", row["ShareCode"])
+
+
+def run_threaded(df, team):
+    sim = TradeSim.tradeSim(team, load_existing=False)
+    runner = sim.get_strategy_runner()
+
+    def stream_symbol(data):
+        handler = StrategyHandler.StrategyHandler(every_nth_tick, runner)
+        for _, row in data.iterrows():
+            handler.process_row(row)
+            if not sim.isOrderbooksEmpty():
+                sim.isMatch(row)
+            sim.update_market_prices({row["ShareCode"]: row["LastPrice"]})
+
+    threads = [threading.Thread(target=stream_symbol, args=(g,)) for _, g in df.groupby("ShareCode")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return sim
+
+
+def run_engine(df, team):
+    sim = TradeSim.tradeSim(team, load_existing=False)
+    sim.get_engine(every_nth_tick).stream(df)
+    return sim
+
+
+def main():
+    ticks = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TICKS
+    df = pd.read_csv(ticks)
+    df["TradeDateTime"] = pd.to_datetime(df["TradeDateTime"])
+
+    os.chdir(tempfile.mkdtemp(prefix="bench_engine_"))
+    for name, fn in (("threads", run_threaded), ("engine", run_engine)):
+        start = time.perf_counter()
+        sim = fn(df, f"bench_{name}")
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:>8}: {elapsed:7.2f}s  {len(df) / elapsed:10,.0f} ticks/s  "
+            f"NAV {sim.portfolio.get_nav():,.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Fill throughput: limit orders that match on the tick they are placed.
+
+Every round buys one board lot and sells it again, so each round books two fills
+into the portfolio (a new lot, then a sell of the oldest lot).
+
+Usage: python -m benchmarks.bench_fills
+"""
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from tradeSim import TradeSim
+
+SYMBOL = "PTT"
+ROUNDS = 5000
+
+
+def mock_row(price):
+    return {
+        "ShareCode": SYMBOL,
+        "LastPrice": price,
+        "Volume": 1000,
+        "Flag": "Sell",
+        "TradeDateTime": pd.Timestamp("2025-10-20 10:00:00"),
+    }
+
+
+def fills_per_second(holding):
+    sim = TradeSim.tradeSim(f"bench_fills_{holding}", load_existing=False)
+    row = mock_row(30.0)
+    # lots already held, so the sells do not empty the position
+    for _ in range(holding):
+        sim.create_order_to_limit(100, 30.0, "Buy", SYMBOL, 10 ** 9, 10 ** 9, row)
+        sim.isMatch(row)
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        sim.create_order_to_limit(100, 30.0, "Buy", SYMBOL, 10 ** 9, 10 ** 9, row)
+        sim.isMatch(row)
+        sim.create_order_to_limit(100, 30.0, "Sell", SYMBOL, 10 ** 9, 10 ** 9, row)
+        sim.isMatch(row)
+    elapsed = time.perf_counter() - start
+    assert sim.portfolio.get_total_stock_volume_by_symbol(SYMBOL) == holding * 100
+    return 2 * ROUNDS / elapsed
+
+
+def main():
+    os.chdir(tempfile.mkdtemp(prefix="bench_fills_"))
+    for holding in (1, 100):
+        print(f"{holding:>4} lots held: {fills_per_second(holding):10,.0f} fills/s")
+
+
+if __name__ == "__main__":
+    main()
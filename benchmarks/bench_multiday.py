@@ -0,0 +1,112 @@
+"""
+Multi-day backtest: saving and reloading the portfolio every day (``main.run_day``)
+against one in-memory simulation rolled over from day to day (``MultiDay.multiDayRunner``).
+
+The sample day is replayed as DAYS consecutive days by a strategy that keeps buying, so
+the portfolio and its JSON file grow from day to day. The day boundary alone is then
+timed for portfolios of LOTS lots: a save and reload of the JSON against a rollover.
+
+Usage: python -m benchmarks.bench_multiday [ticks.csv]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from main import run_day
+from strategy.Strategies_template import Strategy_template
+from tradeSim import MultiDay
+from tradeSim import Portfolio
+from tradeSim import Stock
+from tradeSim import TickStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_TICKS = os.path.join(ROOT, "marketInfo", "ticks", "2025-10-20.csv")
+DAYS = 20
+LOTS = (1000, 10000, 50000)
+
+
+class keep_buying(Strategy_template):
+    """Buys 100 shares (IOC) on every 1000th tick of a symbol and never sells."""
+
+    def __init__(self, handler):
+        super().__init__("BENCH", "keep_buying", handler)
+        self.count = 0
+
+    def on_data(self, row):
+        self.count += 1
+        if self.count % 1000 == 0:
+            self.handler.create_order_to_limit(100, row["LastPrice"], "Buy", row["ShareCode"], time_in_force="IOC")
+
+
+def write_days(ticks, folder):
+    df = pd.read_csv(ticks)
+    df["TradeDateTime"] = pd.to_datetime(df["TradeDateTime"])
+    paths = []
+    for day in range(DAYS):
+        shifted = df.assign(TradeDateTime=df["TradeDateTime"] + pd.Timedelta(days=day))
+        paths.append(TickStore.tickStore.write_frame(shifted, os.path.join(folder, f"day{day:02d}.ticks")))
+    return paths, len(df)
+
+
+def report(name, elapsed, ticks_per_day):
+    total = sum(elapsed)
+    print(f"  {name:>10}: {total:7.2f}s  {ticks_per_day * len(elapsed) / total:10,.0f} ticks/s  "
+          f"first day {elapsed[0]:.2f}s, last day {elapsed[-1]:.2f}s")
+
+
+def day_boundary(lots):
+    owner = "bench_rollover"
+    stocks = [Stock.stock("PTT", 100, 30.0, 30.0, 1760925600.0 + n) for n in range(lots)]
+    portfolio = Portfolio.portfolio(owner, stocksList=stocks, cashbalance=10 ** 9)
+    portfolio.update_market_prices({"PTT": 31.0})
+
+    start = time.perf_counter()
+    portfolio.save_to_file(owner)
+    Portfolio.portfolio.load_from_file(owner)
+    saved = time.perf_counter() - start
+
+    start = time.perf_counter()
+    portfolio.roll_over_day()
+    rolled = time.perf_counter() - start
+    print(f"  {lots:>6} lots: save and reload {saved * 1000:9.1f} ms, rollover {rolled * 1000:7.3f} ms")
+
+
+def main():
+    ticks = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TICKS
+    folder = tempfile.mkdtemp(prefix="bench_multiday_")
+    teams = ("bench_daily", "bench_continuous")
+    try:
+        days, ticks_per_day = write_days(ticks, folder)
+
+        elapsed = []
+        for day in days:
+            start = time.perf_counter()
+            run_day(teams[0], keep_buying, day)
+            elapsed.append(time.perf_counter() - start)
+        report("daily", elapsed, ticks_per_day)
+
+        runner = MultiDay.multiDayRunner(teams[1], keep_buying, load_existing=False)
+        elapsed = []
+        for day in days:
+            start = time.perf_counter()
+            runner.run_day(day)
+            elapsed.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        runner.checkpoint()
+        elapsed[-1] += time.perf_counter() - start
+        report("continuous", elapsed, ticks_per_day)
+
+        for lots in LOTS:
+            day_boundary(lots)
+    finally:
+        shutil.rmtree(folder)
+        for team in (*teams, "bench_rollover"):
+            shutil.rmtree(os.path.join("result", team), ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
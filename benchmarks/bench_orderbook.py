@@ -0,0 +1,51 @@
+"""
+Per-tick matching cost as the number of resting orders grows.
+
+Every resting order is a buy far below the market on the ticked symbol, so each
+tick has to decide that none of them is marketable.
+
+Usage: python -m benchmarks.bench_orderbook
+"""
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from tradeSim import TradeSim
+
+SYMBOL = "PTT"
+TICKS = 20000
+
+
+def mock_row(price):
+    return {
+        "ShareCode": SYMBOL,
+        "LastPrice": price,
+        "Volume": 1000,
+        "Flag": "Sell",
+        "TradeDateTime": pd.Timestamp("2025-10-20 10:00:00"),
+    }
+
+
+def per_tick_cost(resting):
+    sim = TradeSim.tradeSim(f"bench_book_{resting}", load_existing=False)
+    row = mock_row(30.0)
+    for i in range(resting):
+        sim.create_order_to_limit(100, 20.0 - (i % 100) * 0.01, "Buy", SYMBOL, 10 ** 9, 10 ** 9, row)
+    assert sim.execution.getOrderbooksSize() == resting
+
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        sim.isMatch(row)
+    return (time.perf_counter() - start) / TICKS
+
+
+def main():
+    os.chdir(tempfile.mkdtemp(prefix="bench_orderbook_"))
+    for resting in (10, 100, 1000, 5000):
+        print(f"{resting:>6} resting orders: {per_tick_cost(resting) * 1e6:8.2f} us/tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compare the event-driven engine with the vectorized signal mode on the same strategy.
+
+Usage: python -m benchmarks.bench_signals [ticks.csv]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from strategy.Strategies_template import Strategy_template
+from tradeSim import SignalEngine
+from tradeSim import TradeSim
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_TICKS = os.path.join(ROOT, "marketInfo", "ticks", "2025-10-20.csv")
+
+
+class every_nth_tick(Strategy_template):
+    """Buys on every 500th tick of a symbol and sells 100 shares 250 ticks later (IOC)."""
+
+    def __init__(self, handler):
+        super().__init__("BENCH", "every_nth_tick", handler)
+        self.count = 0
+
+    def on_data(self, row):
+        self.count += 1
+        if self.count % 500 == 0:
+            self.handler.create_order_to_limit(100, row["LastPrice"], "Buy", row["ShareCode"], time_in_force="IOC")
+        elif self.count % 500 == 250:
+            self.handler.create_order_to_limit(100, row["LastPrice"], "Sell", row["ShareCode"], time_in_force="IOC")
+
+    def signals(self, ticks):
+        count = np.arange(1, len(ticks["LastPrice"]) + 1)
+        return np.where(count % 500 == 0, 100, np.where(count % 500 == 250, -100, 0))
+
+
+def main():
+    ticks = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TICKS
+    df = pd.read_csv(ticks)
+    df["TradeDateTime"] = pd.to_datetime(df["TradeDateTime"])
+
+    os.chdir(tempfile.mkdtemp(prefix="bench_signals_"))
+    start = time.perf_counter()
+    sim = TradeSim.tradeSim("bench_event", load_existing=False)
+    sim.get_engine(every_nth_tick).stream(df)
+    elapsed = time.perf_counter() - start
+    print(f"  engine: {elapsed:7.2f}s  {len(df) / elapsed:12,.0f} ticks/s  NAV {sim.portfolio.get_nav():,.2f}")
+
+    start = time.perf_counter()
+    result = SignalEngine.signalEngine(every_nth_tick).run(df)
+    elapsed = time.perf_counter() - start
+    print(f"  signal: {elapsed:7.2f}s  {len(df) / elapsed:12,.0f} ticks/s  NAV {result['summary']['Net Asset Value']:,.2f}")
+
+
+if __name__ == "__main__":
+    main()
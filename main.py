@@ -1,6 +1,100 @@
-def main():
-    print("Hello from trade-sim!")
+import argparse
+import importlib
+import re
+import sys
+import time
+
+from tradeSim import TradeSim
+from tradeSim import TickStore
+from tradeSim import MultiDay
+
+NAME_PATTERN = r'^[A-Za-z0-9-_]{1,30}$'
+
+
+def load_strategy_class(strategy_name, class_name=None):
+    """
+    Import ``strategy.<strategy_name>`` and return the strategy class.
+    The class is expected to have the same name as the module, like in the notebook.
+    """
+    module_name = strategy_name if "." in strategy_name else f"strategy.{strategy_name}"
+    strategy_module = importlib.import_module(module_name)
+    class_name = class_name or module_name.rsplit(".", 1)[-1]
+    strategy_class = getattr(strategy_module, class_name, None)
+    if strategy_class is None:
+        raise ImportError(f"Strategy class '{class_name}' not found in module '{module_name}'")
+    return strategy_class
+
+
+def run_day(team_name, strategy_class, tick_file, symbols=None, participation_rate=None, lot_store="objects"):
+    """
+    Run one trading day without any UI and persist the results like the notebook does.
+    Returns the number of ticks processed.
+    """
+    df = TickStore.tickStore.load(tick_file, symbols=symbols)
+
+    trading_Sim = TradeSim.tradeSim(team_name, participation_rate=participation_rate, lot_store=lot_store)
+    processed = trading_Sim.get_engine(strategy_class).stream(df)
+
+    trading_Sim.flushTransactionLog()
+    trading_Sim.flushErrorLogger()
+    trading_Sim.create_transaction_summarize(team_name)
+    trading_Sim.save_portfolio()
+    trading_date = df['TradeDateTime'].dt.date.iloc[0]
+    trading_Sim.save_summary_csv(trading_date)
+    trading_Sim.save_equity_curve()
+    return processed
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Headless backtest runner for the SET50 trading simulation.")
+    parser.add_argument("team_name", help="team name, also the owner of the portfolio in result/<team_name>")
+    parser.add_argument("strategy", help="strategy module in the strategy package, e.g. my_strategy")
+    parser.add_argument("tick_files", nargs="+", help="daily tick CSV files or .ticks stores, replayed in the given order")
+    parser.add_argument("--symbols", nargs="+", default=None, help="only simulate these ShareCodes")
+    parser.add_argument("--strategy-class", default=None, help="class name if it differs from the module name")
+    parser.add_argument("--participation-rate", type=float, default=None,
+                        help="share of each tick's volume that limit orders may fill, e.g. 0.1 (default: fill completely)")
+    parser.add_argument("--lot-store", choices=("objects", "array"), default="objects",
+                        help="how the portfolio keeps its lots; 'array' suits strategies that build up many lots")
+    parser.add_argument("--continuous", action="store_true",
+                        help="keep one simulation across the days in memory (orders, strategies and NAV peak carry over) "
+                             "instead of saving and reloading the portfolio every day")
+    parser.add_argument("--checkpoint-every", type=int, default=None,
+                        help="with --continuous, save the results every N days (default: after the last day)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if not re.match(NAME_PATTERN, args.team_name):
+        raise ValueError("Team name is invalid. Please use only alphanumeric characters, hyphens, and underscores, with a maximum length of 30 characters.")
+
+    strategy_class = load_strategy_class(args.strategy, args.strategy_class)
+
+    runner = None
+    if args.continuous:
+        runner = MultiDay.multiDayRunner(args.team_name, strategy_class, args.checkpoint_every,
+                                         participation_rate=args.participation_rate, lot_store=args.lot_store)
+
+    total_ticks = 0
+    start = time.perf_counter()
+    for tick_file in args.tick_files:
+        day_start = time.perf_counter()
+        if runner is not None:
+            processed = runner.run_day(tick_file, args.symbols)
+        else:
+            processed = run_day(args.team_name, strategy_class, tick_file, args.symbols, args.participation_rate, args.lot_store)
+        day_elapsed = time.perf_counter() - day_start
+        total_ticks += processed
+        print(f"[INFO] {tick_file}: {processed} ticks in {day_elapsed:.2f}s ({processed / day_elapsed:,.0f} ticks/s)")
+    if runner is not None:
+        runner.checkpoint()
+
+    elapsed = time.perf_counter() - start
+    print(f"[INFO] Total: {total_ticks} ticks in {elapsed:.2f}s ({total_ticks / elapsed:,.0f} ticks/s)")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -2,6 +2,18 @@ from abc import ABC, abstractmethod
 from datetime import timedelta
 
 class Strategy_template(ABC):
+    # Optional: define on_batch(self, rows) to be called once per ``batch_size`` ticks of the
+    # symbol instead of on_data once per tick. ``rows`` maps each tick column (ShareCode,
+    # TradeDateTime, LastPrice, Volume, Flag) to a read-only numpy array of the block's ticks;
+    # orders placed from on_batch are placed at the last tick of the block.
+    on_batch = None
+    batch_size = 100
+    # Optional: define signals(self, ticks) for SignalEngine.signalEngine, the vectorized
+    # signal mode. ``ticks`` holds the symbol's ticks of the whole day like the rows of
+    # on_batch; return one volume per tick, positive to buy and negative to sell at the
+    # tick's LastPrice (IOC). Strategies are created with handler None in signal mode.
+    signals = None
+
     def __init__(self,owner,strategy_name, handler):
         self.owner = owner
         self.strategy_name = strategy_name
@@ -13,6 +13,8 @@ import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from collections import defaultdict
 
+from tradeSim.TickCatalog import tickCatalog
+
 # ============================================================
 # 1) การตั้งค่าและจัดการ Path สำหรับ Local (VS Code)
 # ============================================================
@@ -31,11 +33,11 @@ output_dir = os.path.join(PROJECT_ROOT, 'competition_api_results')
 # 2. Path ไปยังโฟลเดอร์ที่เก็บไฟล์ Ticks
 ticks_folder = os.path.join(PROJECT_ROOT, 'marketInfo', 'ticks')
 
-# 3. Path ของไฟล์ Ticks ที่จะรวม
+# 3. Path ของไฟล์ Ticks รายวัน
 ticks_glob_path = os.path.join(ticks_folder, '*.csv')
 
-# 4. Path ที่จะเซฟไฟล์ Ticks ที่รวมแล้ว
-merged_ticks_path = os.path.join(ticks_folder, 'merged_ticks.csv')
+# 4. Path ของ tick catalog (เก็บ tick รายวันแบบ columnar + manifest)
+ticks_catalog_path = os.path.join(PROJECT_ROOT, 'marketInfo', 'catalog')
 
 print(f"Project Root: {PROJECT_ROOT}")
 print(f"Output Dir: {output_dir}")
@@ -91,29 +93,21 @@ def save_output(data, file_type, teamName):
     print(f"{file_type} saved at {file_path}")
 
 # ============================================================
-# 5) รวมไฟล์ tick ทั้งหมดในโฟลเดอร์ /ticks
+# 5) นำเข้าไฟล์ tick รายวันเข้า catalog (แปลงเฉพาะวันที่ใหม่หรือมีการแก้ไข)
 # ============================================================
-# ใช้ Path ที่เราสร้างไว้ในข้อ 1
-csv_files = glob.glob(ticks_glob_path)
+# ข้าม merged_ticks.csv ที่เคยสร้างไว้จากเวอร์ชันก่อน (มีหลายวันในไฟล์เดียว)
+csv_files = [f for f in glob.glob(ticks_glob_path) if os.path.basename(f) != 'merged_ticks.csv']
 
-print("Found CSV files:", csv_files)
+catalog = tickCatalog(ticks_catalog_path)
+ingested_days = catalog.ingest(sorted(csv_files))
 
-if csv_files:
-    df = pd.concat((pd.read_csv(f) for f in csv_files), ignore_index=True)
-    
-    # เปลี่ยน display() เป็น print()
-    print("--- Merged DataFrame Head ---")
-    print(df.head())
-    print("-----------------------------")
-
-    # บันทึกไฟล์ที่รวมแล้วกลับไป
-    df.to_csv(merged_ticks_path, index=False)
-    print(f"บันทึกไฟล์รวมแล้วที่: {merged_ticks_path}")
-    print("จำนวนแถวทั้งหมด:", len(df))
-else:
-    print(f"ไม่พบไฟล์ CSV ในโฟลเดอร์: {ticks_glob_path}")
-    # สร้าง DataFrame ว่างๆ เพื่อให้โค้ดส่วนต่อไปไม่ error
-    df = pd.DataFrame(columns=['ShareCode', 'TradeDateTime', 'LastPrice', 'Volume', 'Value', 'Flag'])
+print("Ingested days:", ingested_days)
+print("Catalog days:", catalog.days())
+
+# อ่านข้อมูลทีละวันด้วย catalog.query(start, end, symbols) แทนการรวมทุกไฟล์เป็น DataFrame เดียว
+for trading_date, day_df in catalog.query():
+    print(f"--- {trading_date}: {len(day_df)} rows ---")
+    print(day_df.head())
 
 # # ============================================================
 # # 6) ทดลองโหลดข้อมูลวันก่อนหน้า (ถ้ามี)
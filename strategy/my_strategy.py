@@ -4,6 +4,19 @@ import numpy as np
 from collections import deque
 
 class my_strategy(Strategy_template):
+    # parameters of the signals and the bracket, class attributes so that a parameter
+    # sweep (tradeSim.Sweep) can override them in a subclass
+    rsi_period = 14
+    macd_fast_period = 5
+    macd_slow_period = 15
+    macd_signal_period = 5
+    min_prices = 20
+    rsi_buy = 40
+    rsi_sell = 60
+    allocation = (0.02, 0.03)
+    stop_loss = 0.95
+    take_profit = 1.02
+
     def __init__(self, handler_from_framework):
         self.handler_obj = handler_from_framework
         super().__init__("TEMP_OWNER", "TEMP_STRATEGY", handler_from_framework)
@@ -30,6 +43,20 @@ class my_strategy(Strategy_template):
         else:
             return None, None, None
 
+    def cancel_open_orders(self):
+        """
+        Cancel the open orders of the bracket: the entry if it has not filled yet and its exits.
+        """
+        for open_order in self.handler.get_open_orders(self.symbol):
+            self.handler.cancel_order(open_order["Order Number"])
+
+    def reset_position(self):
+        self.position = 0
+        self.trade_volume = 0
+        self.buy_price = 0.0
+        self.stop_loss_price = None
+        self.take_profit_price = None
+
     # ===== Trading Logic =====
     def on_data(self, row):
         if not self.initialized:
@@ -57,82 +84,73 @@ class my_strategy(Strategy_template):
             self.prices.append(price)
 
             # ต้องมีข้อมูลอย่างน้อย 20 จุดเพื่อคำนวณ RSI + MACD
-            if len(self.prices) < 20:
+            if len(self.prices) < self.min_prices:
                 return
 
             # === คำนวณ RSI และ MACD ===
-            rsi_value = self.relative_strength_index(self.prices)
-            macd_line, signal_line, hist = self.macd_indicator(self.prices)
+            rsi_value = self.relative_strength_index(self.prices, self.rsi_period)
+            macd_line, signal_line, hist = self.macd_indicator(
+                self.prices, self.macd_fast_period, self.macd_slow_period, self.macd_signal_period
+            )
 
             if rsi_value is None or macd_line is None:
                 return
 
             # === Buy Signal ===
-            buy_signal = (
-                (rsi_value < 40)
-                and (macd_line > signal_line)
-                and self.position == 0
-            )
+            buy_setup = (rsi_value < self.rsi_buy) and (macd_line > signal_line)
+            if buy_setup and self.position == 1 and not self.handler.get_open_orders(self.symbol):
+                # the bracket's take profit or stop loss has closed the position
+                self.reset_position()
+            buy_signal = buy_setup and self.position == 0
 
             # === Sell Signal (จาก RSI/MACD) ===
             sell_signal = (
-                (rsi_value > 60)
+                (rsi_value > self.rsi_sell)
                 and (macd_line < signal_line)
                 and self.position == 1
             )
 
-            # === Stop Loss / Take Profit Conditions ===
-            stop_loss_trigger = (
-                self.position == 1 and price <= self.stop_loss_price
-                if self.stop_loss_price else False
-            )
-            take_profit_trigger = (
-                self.position == 1 and price >= self.take_profit_price
-                if self.take_profit_price else False
-            )
-
             # === Execute Orders ===
             if buy_signal:
                 cash = self.handler.get_cash_balance()
-                allocation = np.random.uniform(0.02, 0.03)  # ใช้ 2–3% ของพอร์ตต่อไม้
+                allocation = np.random.uniform(*self.allocation)  # ใช้ 2–3% ของพอร์ตต่อไม้
                 allocated_cash = cash * allocation
                 self.trade_volume = int(allocated_cash / price)
 
                 if self.trade_volume > 0:
-                    self.handler.create_order_to_limit(
+                    self.position = 1
+                    self.buy_price = price
+                    self.stop_loss_price = price * self.stop_loss   # stop loss -5%
+                    self.take_profit_price = price * self.take_profit # take profit +2%
+
+                    # take profit and stop loss are placed and cancel each other in the engine
+                    self.handler.create_bracket_order(
                         volume=self.trade_volume,
                         price=price,
                         side="Buy",
                         symbol=self.symbol,
+                        take_profit_price=self.take_profit_price,
+                        stop_loss_price=self.stop_loss_price,
                     )
-                    self.position = 1
-                    self.buy_price = price
-                    self.stop_loss_price = price * 0.95   # stop loss -5%
-                    self.take_profit_price = price * 1.02 # take profit +2%
 
                     # print(
                     #     f"🚀 [BUY] {self.symbol} at {price:.2f} | "
                     #     f"Vol={self.trade_volume:,} | RSI={rsi_value:.1f}"
                     # )
 
-            elif sell_signal or stop_loss_trigger or take_profit_trigger:
-                self.handler.create_order_to_limit(
-                    volume=self.trade_volume,
-                    price=price,
-                    side="Sell",
-                    symbol=self.symbol,
-                )
-                reason = (
-                    "Stop Loss" if stop_loss_trigger else
-                    "Take Profit" if take_profit_trigger else
-                    "RSI/MACD Signal"
-                )
-                # print(f"💰 [SELL] {self.symbol} at {price:.2f} | {reason}")
-                self.position = 0
-                self.trade_volume = 0
-                self.buy_price = 0.0
-                self.stop_loss_price = None
-                self.take_profit_price = None
+            elif sell_signal:
+                # sell what is held: the entry may have filled partly and an exit may already have sold some
+                self.cancel_open_orders()
+                held = self.handler.get_total_stock_volume_by_symbol(self.symbol)
+                if held > 0:
+                    self.handler.create_order_to_limit(
+                        volume=held,
+                        price=price,
+                        side="Sell",
+                        symbol=self.symbol,
+                    )
+                # print(f"💰 [SELL] {self.symbol} at {price:.2f} | RSI/MACD Signal")
+                self.reset_position()
 
         except Exception as e:
             print(f"[{self.symbol}] Error in logic: {e}")
\ No newline at end of file
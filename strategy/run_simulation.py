@@ -1,6 +1,6 @@
 # run_simulation.py
 import os
-import pandas as pd
+from tradeSim.TickStore import tickStore
 from strategy.my_strategy import SimpleBuyLowStrategy 
 
 # --- 1. สร้างตัว Handler จำลอง ---
@@ -41,8 +41,8 @@ my_strategy = SimpleBuyLowStrategy(
 print(f"--- เริ่มการจำลองโดยใช้ไฟล์: {DATA_FILE_PATH} ---")
 
 try:
-    # อ่านไฟล์ CSV ด้วย pandas
-    df = pd.read_csv(DATA_FILE_PATH)
+    # อ่านเฉพาะ tick ของ SYMBOL_TO_TRACK (ถ้าเป็น .ticks store จะอ่านเฉพาะช่วงแถวของ symbol นี้)
+    df = tickStore.load(DATA_FILE_PATH, symbols=[SYMBOL_TO_TRACK])
     
     # ตรวจสอบคอลัมน์ (เผื่อชื่อไม่ตรง)
     print(f"พบคอลัมน์: {list(df.columns)}")
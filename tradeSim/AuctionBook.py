@@ -0,0 +1,108 @@
+import numpy as np
+
+
+class auctionBook:
+    """
+    Orders collected for the next call auction.
+
+    The tick files print each call auction (OPEN1_E, OPEN2_E and ATC) as one tick per
+    symbol, all with the same timestamp. Auction orders are collected here until then and
+    ``clear`` matches them against the prints of every symbol at once with numpy:
+    a buy crosses if the auction price is at or below its limit, a sell if it is at or
+    above, and orders without a limit (ATO/ATC) always cross. Everything fills at the
+    auction price. An auction order only takes part in one auction, its unfilled volume
+    is cancelled afterwards.
+    """
+
+    AUCTION_FLAGS = ("OPEN1_E", "OPEN2_E", "ATC")
+
+    def __init__(self):
+        # order number -> (order, limit price or None for ATO/ATC), in arrival order
+        self._orders = {}
+
+    def add(self, order, limit_price=None):
+        self._orders[order.get_order_number()] = (order, limit_price)
+
+    def get(self, order_number):
+        entry = self._orders.get(order_number)
+        return None if entry is None else entry[0]
+
+    def cancel(self, order_number):
+        entry = self._orders.pop(order_number, None)
+        return None if entry is None else entry[0]
+
+    def get_limit_price(self, order_number):
+        return self._orders[order_number][1]
+
+    def clear(self, prints, participation_rate=None):
+        """
+        Match the collected orders against the auction prints.
+
+        Parameter
+        ----------
+        prints: dict ShareCode -> (auction price, auction volume).
+        participation_rate: share of a print's volume that the orders of one side may fill,
+                            in board lots and oldest first. None fills every crossed order.
+
+        Returns
+        -------
+        list of (order, price, volume)
+            The fills in arrival order. Orders of the printed symbols leave the book, filled
+            or not; orders of symbols without a print keep waiting for the next auction.
+        """
+        if not self._orders or not prints:
+            return []
+
+        symbols = list(prints)
+        code_of = {symbol: code for code, symbol in enumerate(symbols)}
+        auction_price = np.array([prints[s][0] for s in symbols], dtype="float64")
+        auction_volume = np.array([prints[s][1] for s in symbols], dtype="int64")
+
+        numbers = [n for n, (o, _) in self._orders.items() if o.get_symbol() in code_of]
+        if not numbers:
+            return []
+        entries = [self._orders.pop(n) for n in numbers]
+
+        code = np.array([code_of[o.get_symbol()] for o, _ in entries], dtype="int64")
+        is_buy = np.array([o.get_side() == "Buy" for o, _ in entries])
+        limit = np.array([np.nan if p is None else p for _, p in entries], dtype="float64")
+        remaining = np.array([o.get_remaining_volume() for o, _ in entries], dtype="int64")
+
+        price = auction_price[code]
+        with np.errstate(invalid="ignore"):
+            crossed = np.isnan(limit) | np.where(is_buy, price <= limit, price >= limit)
+        wanted = np.where(crossed, remaining, 0)
+
+        if participation_rate is None:
+            filled = wanted
+        else:
+            budget = (np.floor(auction_volume * participation_rate).astype("int64") // 100 * 100)[code]
+            # share each (symbol, side) budget oldest first: stable sort keeps the arrival order
+            group = code * 2 + is_buy
+            by_group = np.argsort(group, kind="stable")
+            sorted_group = group[by_group]
+            sorted_wanted = wanted[by_group]
+            total = np.cumsum(sorted_wanted)
+            starts = np.r_[True, sorted_group[1:] != sorted_group[:-1]]
+            group_offset = np.maximum.accumulate(np.where(starts, total - sorted_wanted, 0))
+            before = total - sorted_wanted - group_offset
+            filled = np.empty_like(wanted)
+            filled[by_group] = np.clip(budget[by_group] - before, 0, sorted_wanted)
+
+        return [
+            (entries[i][0], float(price[i]), int(filled[i]))
+            for i in np.flatnonzero(filled > 0)
+        ]
+
+    def orders_for(self, symbol):
+        return [o for o, _ in self._orders.values() if o.get_symbol() == symbol]
+
+    def __len__(self):
+        return len(self._orders)
+
+    def __iter__(self):
+        for order, _ in list(self._orders.values()):
+            yield order
+
+    def __contains__(self, order):
+        return order.get_order_number() in self._orders
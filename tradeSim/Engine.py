@@ -0,0 +1,163 @@
+import heapq
+import pandas as pd
+from . import StrategyHandler
+from . import TickStore
+from . import TickRow
+
+
+class engine:
+    """
+    Single-threaded event loop that replays a trading day for one strategy.
+
+    The per-symbol tick streams are k-way merged by ``TradeDateTime`` with a heap,
+    and every tick drives ``StrategyHandler.process_row``, ``tradeSim.isMatch`` and
+    ``portfolio.update_market_prices`` from the same loop. Ticks with the same
+    timestamp are replayed in symbol order and then in file order, so a run is
+    reproducible from run to run.
+
+    A strategy with an ``on_batch`` hook gets no ``on_data`` calls: every ``batch_size``
+    ticks of a symbol (and at its last tick) its handler gets the block of those ticks,
+    at the block's last tick, as numpy columns.
+    """
+
+    def __init__(self, trade_sim, strategy_class):
+        """
+        Parameter
+        ----------
+        trade_sim: tradeSim instance that owns the portfolio and the order book.
+        strategy_class: Strategy_template subclass, one instance is created per symbol.
+        """
+        self.tradeSim = trade_sim
+        self.strategy_class = strategy_class
+        self.strategy_runner = trade_sim.get_strategy_runner()
+        self.handlers = {}
+        self.latest_prices = {}
+        self.tick_count = 0
+
+    def get_handler(self, symbol):
+        """
+        Returns the StrategyHandler for ``symbol``, creating it on first use.
+        """
+        handler = self.handlers.get(symbol)
+        if handler is None:
+            handler = StrategyHandler.StrategyHandler(self.strategy_class, self.strategy_runner)
+            self.handlers[symbol] = handler
+        return handler
+
+    @staticmethod
+    def _symbol_stream(symbol, frame, arrays=False, rows=True):
+        if not frame["TradeDateTime"].is_monotonic_increasing:
+            frame = frame.sort_values("TradeDateTime", kind="stable")
+        times = frame["TradeDateTime"].to_numpy(dtype="datetime64[ns]").view("int64").tolist()
+        row = TickRow.tickRow({name: frame[name].tolist() for name in frame.columns}) if rows else None
+        blocks = None
+        if arrays:
+            blocks = {}
+            for name in frame.columns:
+                values = frame[name].to_numpy(copy=True)
+                values.flags.writeable = False
+                blocks[name] = values
+        return symbol, times, row, blocks
+
+    @classmethod
+    def _symbol_streams(cls, ticks, symbols=None, arrays=False, rows=True):
+        """
+        Split daily ticks into per-symbol streams sorted by ShareCode.
+
+        ``ticks`` is a DataFrame or the path of a tick CSV or tick store. Tick stores are
+        read through their symbol index, so only the requested symbols are materialised.
+
+        Returns a list of ``(symbol, times, row, arrays)`` where ``times`` are epoch
+        nanoseconds in time order, ``row`` is a ``TickRow.tickRow`` over the
+        symbol's columns in the same order, or None if ``rows`` is not set, and
+        ``arrays`` the columns as read-only numpy arrays if ``arrays`` is set, None otherwise.
+        """
+        store = TickStore.tickStore
+        if isinstance(ticks, str) and store.is_tick_store(ticks):
+            columns, meta = store.load_columns(ticks)
+            wanted = meta["index"] if symbols is None else set(symbols).intersection(meta["index"])
+            return [
+                cls._symbol_stream(symbol, store.to_frame(store.symbol_columns(ticks, symbol, columns, meta), meta), arrays, rows)
+                for symbol in sorted(wanted)
+            ]
+
+        if isinstance(ticks, str):
+            ticks = store.load(ticks, symbols)
+        elif symbols is not None:
+            ticks = ticks[ticks["ShareCode"].isin(list(symbols))]
+
+        if not pd.api.types.is_datetime64_any_dtype(ticks["TradeDateTime"]):
+            ticks = ticks.assign(TradeDateTime=pd.to_datetime(ticks["TradeDateTime"]))
+
+        return [
+            cls._symbol_stream(symbol, group, arrays, rows)
+            for symbol, group in ticks.groupby("ShareCode", sort=True, observed=True)
+        ]
+
+    def stream(self, ticks, on_tick=None, every=1, symbols=None):
+        """
+        Replay ``ticks`` through the strategy, the order book and the portfolio.
+
+        Parameter
+        ----------
+        ticks: DataFrame with ShareCode, TradeDateTime, LastPrice, Volume and Flag columns,
+               or the path of a tick CSV or tick store.
+        on_tick: optional callable ``on_tick(engine)`` called every ``every`` ticks,
+                 e.g. to refresh a live display.
+        every: number of ticks between two ``on_tick`` calls.
+        symbols: optional iterable of ShareCodes to replay, all symbols by default.
+
+        Returns
+        -------
+        int
+            Number of ticks processed.
+        """
+        batched = getattr(self.strategy_class, "on_batch", None) is not None
+        batch_size = self.strategy_class.batch_size if batched else 1
+        streams = self._symbol_streams(ticks, symbols, arrays=batched)
+        trade_sim = self.tradeSim
+        portfolio = trade_sim.portfolio
+        latest_prices = self.latest_prices
+
+        # heap entries are (timestamp, symbol rank, position in the symbol stream)
+        heap = [(times[0], rank, 0) for rank, (_, times, _, _) in enumerate(streams) if times]
+        heapq.heapify(heap)
+
+        processed = 0
+        while heap:
+            _, rank, pos = heap[0]
+            symbol, times, row, arrays = streams[rank]
+            row.seek(pos)
+
+            if not batched:
+                self.get_handler(symbol).process_row(row)
+            elif (pos + 1) % batch_size == 0 or pos + 1 == len(times):
+                self.get_handler(symbol).process_batch(row, arrays, pos - pos % batch_size, pos + 1)
+
+            latest_prices[symbol] = {
+                "price": row["LastPrice"],
+                "volume": row["Volume"],
+                "Flag": row["Flag"],
+            }
+
+            if not trade_sim.isOrderbooksEmpty():
+                trade_sim.isMatch(row)
+
+            # the stream's times are epoch nanoseconds already, no Timestamp per tick
+            portfolio.update_market_prices({symbol: row["LastPrice"]}, times[pos] / 1e9)
+
+            pos += 1
+            if pos < len(times):
+                heapq.heapreplace(heap, (times[pos], rank, pos))
+            else:
+                heapq.heappop(heap)
+
+            processed += 1
+            if on_tick is not None and processed % every == 0:
+                on_tick(self)
+
+        # the ATC prints are the last ticks of the day, nothing follows to close the auction
+        trade_sim.clear_auction()
+
+        self.tick_count += processed
+        return processed
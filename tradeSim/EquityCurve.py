@@ -0,0 +1,116 @@
+import csv
+import os
+import numpy as np
+import pandas as pd
+
+
+class equityCurve:
+    """
+    Downsampled intraday NAV of a portfolio in a preallocated ring buffer.
+
+    The portfolio offers every price update to ``record``; a sample (time, NAV, peak NAV
+    and drawdown from the peak) is kept every ``every_ticks`` updates and/or every
+    ``every_seconds`` of tick time, whichever comes first, and always for the first update.
+    Once ``capacity`` samples are kept the oldest are overwritten, so recording never
+    allocates.
+    """
+
+    COLUMNS = ("Time", "NAV", "Peak NAV", "Drawdown (%)")
+
+    def __init__(self, capacity=4096, every_ticks=None, every_seconds=60.0):
+        """
+        Parameter
+        ----------
+        capacity: number of samples kept.
+        every_ticks: keep a sample every this many price updates, None to not sample by count.
+        every_seconds: keep a sample every this many seconds of tick time, None to not sample by time.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive.")
+        self.capacity = capacity
+        self.every_ticks = every_ticks
+        self.every_seconds = every_seconds
+        # one row per sample: time (epoch seconds of the tick time, NaN if unknown), nav, peak, drawdown
+        self._samples = np.zeros((capacity, 4), dtype="float64")
+        self._next = 0
+        self._size = 0
+        self._ticks = 0
+        self._last_time = None
+
+    def record(self, nav, peak, drawdown, tick_time=None):
+        """
+        Offer the NAV after a price update. ``tick_time`` is the tick time in epoch seconds.
+        Returns True if a sample was kept.
+        """
+        self._ticks += 1
+        due = (
+            self._ticks == 1 and self._size == 0
+            or self.every_ticks is not None and self._ticks >= self.every_ticks
+            or self.every_seconds is not None
+            and tick_time is not None
+            and (self._last_time is None or tick_time - self._last_time >= self.every_seconds)
+        )
+        if not due:
+            return False
+
+        self._samples[self._next] = (np.nan if tick_time is None else tick_time, nav, peak, drawdown)
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        self._ticks = 0
+        if tick_time is not None:
+            self._last_time = tick_time
+        return True
+
+    def clear(self):
+        self._next = 0
+        self._size = 0
+        self._ticks = 0
+        self._last_time = None
+
+    def __len__(self):
+        return self._size
+
+    def to_array(self):
+        """
+        Returns the samples oldest first as an array of (time, nav, peak, drawdown) rows.
+        """
+        if self._size < self.capacity:
+            return self._samples[:self._size].copy()
+        return np.concatenate((self._samples[self._next:], self._samples[:self._next]))
+
+    def to_frame(self):
+        samples = self.to_array()
+        return pd.DataFrame(
+            {
+                "Time": pd.to_datetime(samples[:, 0], unit="s"),
+                "NAV": samples[:, 1],
+                "Peak NAV": samples[:, 2],
+                "Drawdown (%)": samples[:, 3],
+            }
+        )
+
+    def save_csv(self, file_path):
+        """
+        Append the samples to the CSV ``file_path``, writing the header if it is new.
+        """
+        self.write_csv(file_path, self.to_array())
+
+    @classmethod
+    def write_csv(cls, file_path, samples):
+        """
+        Append ``samples``, an array like ``to_array`` returns, to the CSV ``file_path``.
+        """
+        write_header = not os.path.exists(file_path)
+        with open(file_path, mode="a", newline="") as f:
+            writer = csv.writer(f)
+            if write_header:
+                writer.writerow(cls.COLUMNS)
+            for time, nav, peak, drawdown in samples:
+                writer.writerow(
+                    [
+                        "" if np.isnan(time) else pd.Timestamp(time, unit="s").strftime("%Y-%m-%d %H:%M:%S"),
+                        round(nav, 2),
+                        round(peak, 2),
+                        round(drawdown, 4),
+                    ]
+                )
@@ -2,9 +2,16 @@ from . import Stock
 from . import TransactionLog
 from . import PortSummarize as ps
 from . import CommissionService
+from . import OrderBook
+from . import TriggerBook
+from . import OrderGroup
+from . import AuctionBook
+from . import Order
+from . import OrderRejection
 import pandas as pd
 import os
 import bisect
+import heapq
 import logging
 
 
@@ -15,35 +22,243 @@ class execution:
         self,
         team_name,
         orders_book=None,
+        participation_rate=None,
     ):
-        self.Orders_Book = orders_book if orders_book is not None else []
+        """
+        Parameter
+        ----------
+        team_name: Name of the team.
+        orders_book: optional iterable of resting orders.
+        participation_rate: share (0, 1] of each tick's volume that limit orders may fill.
+                            None fills a matching order completely on one tick.
+        """
+        if participation_rate is not None and not 0 < participation_rate <= 1:
+            raise ValueError(f"[ERROR] participation_rate must be in (0, 1], got {participation_rate}.")
+        self.participation_rate = participation_rate
+        self.Orders_Book = OrderBook.orderBook(orders_book)
+        # odd-lot orders (1-99 shares) only match Odd ticks
+        self.Odd_Lot_Book = OrderBook.orderBook()
+        # orders waiting for the next call auction and the auction prints seen so far
+        self.Auction_Book = AuctionBook.auctionBook()
+        self._auction_prints = {}
+        self._auction_time = None
+        # pending stop, stop-limit and trailing-stop orders
+        self.Trigger_Book = TriggerBook.triggerBook()
+        # OCO and bracket links between orders
+        self.Order_Groups = OrderGroup.orderGroups()
+        # errors of triggered orders that could not be executed, drained by tradeSim
+        self.rejected_orders = []
+        # (expire timestamp, order number) of resting DAY/GTT orders
+        self._expiry_heap = []
         self.tranLog = TransactionLog.Transaction(team_name)
 
     def addOrderToOrders_Book(self, new_order, row):
         if new_order is None:
             return "Cannot add an invalid/None order."
-        if new_order.get_side() == "Buy":
-            self.Orders_Book.append(new_order)
-            return f"Order {new_order.get_order_number()} added to book ({new_order.get_symbol()})."
-        elif new_order.get_side() == "Sell":
-            self.Orders_Book.append(new_order)
+        if new_order.get_side() in ("Buy", "Sell"):
+            self._book_for(new_order).add(new_order)
+            if new_order.get_expire_timestamp() is not None:
+                heapq.heappush(self._expiry_heap, (new_order.get_expire_timestamp(), new_order.get_order_number()))
             return f"Order {new_order.get_order_number()} added to book ({new_order.get_symbol()})."
 
+    def addStopOrder(self, new_order, row):
+        """
+        Park a stop, stop-limit or trailing-stop order until a tick of its symbol crosses its stop price.
+        """
+        self.Trigger_Book.add(new_order, row["LastPrice"])
+        if new_order.get_expire_timestamp() is not None:
+            heapq.heappush(self._expiry_heap, (new_order.get_expire_timestamp(), new_order.get_order_number()))
+        return f"Order {new_order.get_order_number()} added to trigger book ({new_order.get_symbol()})."
+
+    def addAuctionOrder(self, new_order, limit_price=None):
+        """
+        Collect an order for the next call auction; ``limit_price`` None means at any price (ATO/ATC).
+        """
+        self.Auction_Book.add(new_order, limit_price)
+        return f"Order {new_order.get_order_number()} added to auction book ({new_order.get_symbol()})."
+
+    def _book_for(self, order):
+        return self.Odd_Lot_Book if order.get_board() == "odd" else self.Orders_Book
+
+    def addBracket(self, entry, children, row):
+        """
+        Add the entry order of a bracket; its exit orders are placed once the entry fills.
+        """
+        self.Order_Groups.add_bracket(entry, children)
+        return self.addOrderToOrders_Book(entry, row)
+
+    def addOcoGroup(self, order_numbers):
+        self.Order_Groups.add_oco(order_numbers)
+
     def isMatch(self, row):
+        """
+        Match the resting orders of the tick's symbol whose price is marketable at the tick.
+        Orders that do not match keep resting in the book.
 
-        if len(self.Orders_Book) == 0:
+        With a participation rate, the marketable orders share the tick's fillable volume
+        oldest first; a partially filled order keeps resting with its remaining volume.
+
+        Odd ticks only match the odd-lot board. Call auction prints (OPEN1_E, OPEN2_E, ATC)
+        do not match the continuous book; they are collected and the auction orders are
+        cleared in one batch once the auction has been printed for every symbol, i.e. at
+        the first tick with a later timestamp (or by ``clearAuction`` at the end of the day).
+        """
+        if self.isOrderbooksEmpty():
+            self._expiry_heap.clear()
             return "No order in Order book"
 
-        for order in self.Orders_Book:
+        if self._expiry_heap:
+            self.expireOrders(Order.order.to_timestamp(row["TradeDateTime"]))
+
+        if self._auction_prints and row["TradeDateTime"] != self._auction_time:
+            self.clearAuction()
+
+        flag = row.get("Flag")
+        if flag in AuctionBook.auctionBook.AUCTION_FLAGS:
+            if len(self.Auction_Book):
+                self._auction_time = row["TradeDateTime"]
+                self._auction_prints[row["ShareCode"]] = (row["LastPrice"], row["Volume"])
+            if len(self.Trigger_Book):
+                self._trigger(row)
+            return
+
+        if flag == "Odd":
+            book, lot = self.Odd_Lot_Book, 1
+        else:
+            book, lot = self.Orders_Book, 100
+            if len(self.Trigger_Book):
+                self._trigger(row)
+
+        if len(book) == 0:
+            return
 
-            if self._is_order_valid(row, order):
-                if order.get_side() == "Buy":
-                    self._process_buy_order(order)
-                if order.get_side() == "Sell":
-                    self._process_sell_order(order)
+        available = self._fillable_volume(row, lot)
+        for order in book.marketable(row["ShareCode"], row["LastPrice"]):
+            if available == 0:
+                break
+            if not self._is_order_valid(row, order):
+                continue
+            volume = order.get_remaining_volume()
+            if available is not None:
+                volume = min(volume, available)
+            filled = self._fill(order, volume)
+            if available is not None:
+                available -= filled
+
+    def _trigger(self, row):
+        """
+        Activate the stop orders crossed by the tick. Stop and trailing-stop orders fill at the
+        tick's price, stop-limit orders start resting at their limit price.
+        """
+        last_price = row["LastPrice"]
+        for order in self.Trigger_Book.triggered(row["ShareCode"], last_price):
+            if order.get_order_type() != "STOP_LIMIT":
+                order.set_price(last_price)
+
+            code = self._trigger_rejection(order)
+            if code is not OrderRejection.rejectReason.OK:
+                self._reject(order, code, f"Triggered {order.get_order_type()} order {order.get_order_number()}")
+                if self.Order_Groups:
+                    self.Order_Groups.discard(order.get_order_number())
+                continue
+
+            if order.get_order_type() == "STOP_LIMIT":
+                self.Orders_Book.add(order)
             else:
-                self.removeOrder(order)
-                return f"Order does not match with valid for matching order in market."
+                self._fill(order, order.get_remaining_volume())
+
+    def _trigger_rejection(self, order):
+        portfolio = order.get_ownerPortfolio()
+        volume = order.get_remaining_volume()
+        if order.get_side() == "Sell" and not portfolio.has_stock(order.get_symbol(), volume):
+            return OrderRejection.rejectReason.INSUFFICIENT_HOLDINGS
+        if order.get_side() == "Buy" and not CommissionService.commissionService.verify_transaction(
+            volume=volume, price=order.get_price(), cashBalance=portfolio.get_cash_balance()
+        ):
+            return OrderRejection.rejectReason.INSUFFICIENT_CASH
+        return OrderRejection.rejectReason.OK
+
+    def _reject(self, order, code, subject):
+        self.rejected_orders.append(OrderRejection.orderRejection(
+            code, order.get_symbol(), order.get_remaining_volume(), order.get_price(), order.get_side(),
+            subject=subject,
+        ))
+
+    def _fillable_volume(self, row, lot=100):
+        """
+        Volume of ``row`` that limit orders may fill, in lots of ``lot`` shares. None means unlimited.
+        """
+        if self.participation_rate is None:
+            return None
+        return int(row["Volume"] * self.participation_rate) // lot * lot
+
+    def hasPendingAuction(self):
+        return bool(self._auction_prints)
+
+    def clearAuction(self):
+        """
+        Clear the collected auction orders against the buffered auction prints in one batch.
+        """
+        prints, self._auction_prints, self._auction_time = self._auction_prints, {}, None
+        for order, price, volume in self.Auction_Book.clear(prints, self.participation_rate):
+            order.set_price(price)
+            self._fill(order, volume)
+
+    def _fill(self, order, volume):
+        """
+        Fill ``volume`` of ``order`` and return the filled volume.
+
+        Sells are checked against the holdings again at fill time: the position may have been
+        sold since the order was placed (e.g. the take profit of a bracket). A sell that the
+        holdings no longer cover is rejected and cancelled and fills nothing.
+        """
+        if order.get_side() == "Buy":
+            self._process_buy_order(order, volume)
+        elif order.get_side() == "Sell":
+            if not order.get_ownerPortfolio().has_stock(order.get_symbol(), volume):
+                self._reject(order, OrderRejection.rejectReason.INSUFFICIENT_HOLDINGS,
+                             f"{order.get_order_type()} order {order.get_order_number()}")
+                self.cancelOrder(order.get_order_number())
+                return 0
+            volume = self._process_sell_order(order, volume)
+        return volume
+
+    def executeImmediateOrder(self, new_order, row):
+        """
+        Match an IOC/FOK limit order against the current tick only; it never rests in the book.
+        IOC orders fill what the tick allows, FOK orders fill completely or not at all.
+        Returns the filled volume.
+        """
+        if not self._is_order_valid(row, new_order):
+            return 0
+        flag = row.get("Flag")
+        if flag in AuctionBook.auctionBook.AUCTION_FLAGS or (flag == "Odd") != (new_order.get_board() == "odd"):
+            return 0
+        volume = new_order.get_remaining_volume()
+        available = self._fillable_volume(row, 1 if new_order.get_board() == "odd" else 100)
+        if available is not None and available < volume:
+            if new_order.get_time_in_force() == "FOK":
+                return 0
+            volume = available
+        if volume > 0:
+            volume = self._fill(new_order, volume)
+        return volume
+
+    def expireOrders(self, timestamp):
+        """
+        Cancel the resting orders whose time in force has run out at ``timestamp`` (order timestamp).
+        Heap entries of orders that were already filled or cancelled are dropped on the way.
+        Returns the expired orders.
+        """
+        heap = self._expiry_heap
+        expired = []
+        while heap and heap[0][0] <= timestamp:
+            _, order_number = heapq.heappop(heap)
+            cancelled = self.cancelOrder(order_number)
+            if cancelled is not None:
+                expired.append(cancelled)
+        return expired
+
     def isMatchMarketOrder(self, row, market_order):    
         if market_order is not None:
             if self._is_order_valid(row, market_order):
@@ -62,41 +277,92 @@ class execution:
 
         if order.get_side() == "Buy" and row["LastPrice"] > (CommissionService.commissionService._get_slippage(order.get_price()) + order.get_price()):
             return False  # Order has lower price than market price
-        if order.get_side() == "Sell" and row["LastPrice"] < (CommissionService.commissionService._get_slippage(order.get_price()) - order.get_price()):
+        if order.get_side() == "Sell" and row["LastPrice"] < (order.get_price() - CommissionService.commissionService._get_slippage(order.get_price())):
             return False  # order has higher price than market price
         return True
 
-    def _process_buy_order(self, order):
+    def _process_buy_order(self, order, volume=None):
+        # volume is the filled volume of a partial fill, the remaining volume by default
+        volume = order.get_remaining_volume() if volume is None else volume
         Buy_value = CommissionService.commissionService.cal_commissionAndVat(
-            order.get_volume(), order.get_price(), order.get_side()
+            volume, order.get_price(), order.get_side()
         )
         new_stock = Stock.stock(
             order.get_symbol(),
-            order.get_volume(),
+            volume,
             Buy_value,
             order.get_price(),
             order.get_timestamp(),
         )
-        order.get_ownerPortfolio().add_stock(new_stock)
+        order.get_ownerPortfolio().add_stock(new_stock, Stock._FILL_TOKEN)
         order.get_ownerPortfolio().update_Buy_stock_valueToPort(
-            Buy_value * order.get_volume()
+            Buy_value * volume
         )
-        self.tranLog.create_transaction_log(order)
-
-        self.removeOrder(order)
+        self._record_fill(order, volume)
 
-    def _process_sell_order(self, order):
+    def _process_sell_order(self, order, volume=None):
+        volume = order.get_remaining_volume() if volume is None else volume
         Sell_value = CommissionService.commissionService.cal_commissionAndVat(
-            order.get_volume(), order.get_price(), order.get_side()
+            volume, order.get_price(), order.get_side()
         )
-        order.get_ownerPortfolio().decrease_stock_volume(
-            order.get_symbol(), order.get_volume(), Sell_value
+        # only the volume actually sold is credited
+        sold = order.get_ownerPortfolio().decrease_stock_volume(
+            order.get_symbol(), volume, Sell_value
         )
         order.get_ownerPortfolio().update_sold_stock_valueToPort(
-            Sell_value * order.get_volume()
+            Sell_value * sold
         )
-        self.tranLog.create_transaction_log(order)
-        self.removeOrder(order)
+        self._record_fill(order, sold)
+        return sold
+
+    def _record_fill(self, order, volume):
+        order.fill(volume)
+        self.tranLog.create_transaction_log(order, volume)
+        if order.is_filled():
+            self.removeOrder(order)
+        if self.Order_Groups:
+            self._on_group_fill(order, volume)
+
+    def _on_group_fill(self, order, volume):
+        """
+        Place the exits of a filled bracket entry and cancel (or reduce) the OCO siblings of a filled order.
+        """
+        groups = self.Order_Groups
+        order_number = order.get_order_number()
+
+        bracket = groups.bracket(order_number)
+        if bracket is not None:
+            children = bracket["children"]
+            if bracket["active"] and all(self.getOpenOrder(child.get_order_number()) is child for child in children):
+                for child in children:
+                    child.set_volume(child.get_volume() + volume)
+            else:
+                if bracket["active"]:
+                    # an exit of the earlier fills has filled or was cancelled, this fill gets a new pair
+                    children = bracket["children"] = [child.renew() for child in children]
+                    groups.add_oco([child.get_order_number() for child in children])
+                for child in children:
+                    child.set_volume(volume)
+                    self._activate(child, order.get_price())
+            bracket["active"] = True
+
+        for sibling_number in list(groups.siblings(order_number)):
+            sibling = self.getOpenOrder(sibling_number)
+            if sibling is None:
+                continue
+            if order.is_filled() or sibling.get_remaining_volume() <= volume:
+                self.cancelOrder(sibling_number)
+            else:
+                sibling.set_volume(sibling.get_volume() - volume)
+
+        if order.is_filled():
+            groups.discard(order_number)
+
+    def _activate(self, order, last_price):
+        if order.get_order_type() in Order.order.STOP_TYPES:
+            self.Trigger_Book.add(order, last_price)
+        else:
+            self.Orders_Book.add(order)
 
     def _process_market_order(self, order):
         if order.get_side() == "Buy":
@@ -110,8 +376,7 @@ class execution:
                 order.get_price(),
                 order.get_timestamp(),
             )
-            print(f"Adding stock {new_stock.get_symbol()} with volume {new_stock.get_actual_vol()} at price {new_stock.get_buy_price()}")
-            order.get_ownerPortfolio().add_stock(new_stock)
+            order.get_ownerPortfolio().add_stock(new_stock, Stock._FILL_TOKEN)
             order.get_ownerPortfolio().update_Buy_stock_valueToPort(
                 Buy_value * order.get_volume()
             )
@@ -120,22 +385,77 @@ class execution:
             Sell_value = CommissionService.commissionService.cal_commissionAndVat(
             order.get_volume(), order.get_price(), order.get_side()
             )
-            order.get_ownerPortfolio().decrease_stock_volume(
+            sold = order.get_ownerPortfolio().decrease_stock_volume(
                 order.get_symbol(), order.get_volume(), Sell_value
             )
             order.get_ownerPortfolio().update_sold_stock_valueToPort(
-                Sell_value * order.get_volume()
+                Sell_value * sold
             )
-            self.tranLog.create_transaction_log(order)
+            self.tranLog.create_transaction_log(order, sold)
 
     def removeOrder(self, order):
-        self.Orders_Book.remove(order)
+        self._book_for(order).remove(order)
+
+    def getOrder(self, order_number):
+        """
+        Returns the resting limit order (board or odd lot) with ``order_number``, or None.
+        """
+        open_order = self.Orders_Book.get(order_number)
+        if open_order is None:
+            open_order = self.Odd_Lot_Book.get(order_number)
+        return open_order
+
+    def openBooks(self):
+        return (self.Orders_Book, self.Odd_Lot_Book, self.Trigger_Book, self.Auction_Book)
+
+    def getOpenOrder(self, order_number):
+        """
+        Returns the resting, pending stop or auction order with ``order_number``, or None.
+        """
+        for book in self.openBooks():
+            open_order = book.get(order_number)
+            if open_order is not None:
+                return open_order
+        return None
+
+    def cancelOrder(self, order_number):
+        """
+        Cancel a resting, pending stop or auction order. Returns the cancelled order, or None if it is not open.
+        """
+        cancelled = None
+        for book in self.openBooks():
+            cancelled = book.cancel(order_number)
+            if cancelled is not None:
+                break
+        if cancelled is not None and self.Order_Groups:
+            self.Order_Groups.discard(order_number)
+        return cancelled
+
+    def amendOrder(self, order_number, price=None, volume=None):
+        """
+        Change the price and/or volume of a resting order. A new price re-queues the order
+        behind the orders already resting at that price; a volume change keeps its priority.
+        Returns the amended order, or None if it is not in the book.
+        """
+        order = self.getOrder(order_number)
+        if order is None:
+            return None
+        if volume is not None:
+            order.set_volume(volume)
+        if price is not None and price != order.get_price():
+            order.set_price(price)
+            self._book_for(order).requeue(order)
+        return order
 
     def getOrderbooksSize(self):
-        return len(self.Orders_Book)
+        return len(self.Orders_Book) + len(self.Odd_Lot_Book)
 
     def isOrderbooksEmpty(self):
-        return self.getOrderbooksSize() == 0
+        return self.getOrderbooksSize() == 0 and len(self.Trigger_Book) == 0 and len(self.Auction_Book) == 0
+
+    def drainRejectedOrders(self):
+        rejected, self.rejected_orders = self.rejected_orders, []
+        return rejected
 
     def flushTransactionLog(self):
         self.tranLog.flush_logs()
\ No newline at end of file
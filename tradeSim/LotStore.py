@@ -0,0 +1,228 @@
+from collections import deque
+import numpy as np
+from . import Stock
+
+
+class objectLots(deque):
+    """
+    The lots of one symbol as ``Stock.stock`` objects, oldest first. The default lot store.
+    """
+
+    def __init__(self, symbol):
+        super().__init__()
+        self.symbol = symbol
+
+    def mark(self, mkt_price, avg_cost):
+        """
+        Value every lot at ``mkt_price`` (its own market price if None) and ``avg_cost``.
+        """
+        for stock in self:
+            stock.updateStockMk_value(stock.get_mkt_price() if mkt_price is None else mkt_price, avg_cost)
+
+    def summary(self):
+        """
+        Returns the lots added up, see ``arrayLots.summary``.
+        """
+        total = {
+            "Actual Volume": 0,
+            "Total Cost": 0.0,
+            "Market Value": 0.0,
+            "Unrealized P&L": 0.0,
+            "Realized P&L": 0.0,
+        }
+        info = None
+        for stock in self:
+            info = stock.get_stock_info()
+            total["Actual Volume"] += info["Actual Volume"]
+            total["Total Cost"] += info["Amount Cost"]
+            total["Market Value"] += info["Market Value"]
+            total["Unrealized P&L"] += info["Unrealized P&L"]
+            total["Realized P&L"] += info["Realized P&L"]
+        total["Buy Price"] = info["Buy Price"]
+        total["Buy time"] = info["Buy time"]
+        total["Market Price"] = info["Market Price"]
+        return total
+
+
+# one row per lot; the symbol is the same for all rows of an ``arrayLots``
+LOT_DTYPE = np.dtype(
+    [
+        ("start_vol", "i8"),
+        ("actual_vol", "i8"),
+        ("buy_price", "f8"),
+        ("mkt_price", "f8"),
+        ("avg_cost", "f8"),
+        ("amount_cost", "f8"),
+        ("market_value", "f8"),
+        ("unrealized", "f8"),
+        ("unrealizedInPercentage", "f8"),
+        ("realized", "f8"),
+        ("buy_time", "f8"),
+    ]
+)
+
+
+class arrayLots:
+    """
+    The lots of one symbol as rows of a numpy structured array, oldest first.
+
+    Selling takes lots from the front by moving the first row forward; the rows before it
+    are reused once the array is full. Valuing the lots and adding them up are column
+    operations, so a symbol bought on thousands of ticks costs the same as one lot.
+    Lots are read as ``lotView`` objects that behave like ``Stock.stock``.
+    """
+
+    def __init__(self, symbol, capacity=8):
+        self.symbol = symbol
+        self._rows = np.zeros(capacity, dtype=LOT_DTYPE)
+        # live rows are _rows[_head:_tail]
+        self._head = 0
+        self._tail = 0
+        # number of the lot in row 0: lots keep their number when the rows move
+        self._offset = 0
+
+    def __len__(self):
+        return self._tail - self._head
+
+    def _live(self):
+        return self._rows[self._head:self._tail]
+
+    def _row(self, number):
+        return self._rows[number - self._offset]
+
+    def __getitem__(self, index):
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("lot index out of range")
+        return lotView(self, self._offset + self._head + index)
+
+    def __iter__(self):
+        for row in range(self._head, self._tail):
+            yield lotView(self, self._offset + row)
+
+    def insert(self, index, stock):
+        if self._tail == len(self._rows):
+            self._make_room()
+        row = self._head + index
+        # numpy copies overlapping slices correctly
+        self._rows[row + 1:self._tail + 1] = self._rows[row:self._tail]
+        self._rows[row] = (
+            stock.get_start_vol(),
+            stock.get_actual_vol(),
+            stock.get_buy_price(),
+            stock.get_mkt_price(),
+            stock.avg_cost,
+            stock.get_amount_cost(),
+            stock.get_market_value(),
+            stock.get_unrealized(),
+            stock.get_unrealized_in_percentage(),
+            stock.get_realized(),
+            stock.buy_time,
+        )
+        self._tail += 1
+
+    def append(self, stock):
+        self.insert(len(self), stock)
+
+    def popleft(self):
+        if not len(self):
+            raise IndexError("pop from an empty lot store")
+        self._head += 1
+
+    def _make_room(self):
+        size = len(self)
+        if size * 2 > len(self._rows):
+            rows = np.zeros(len(self._rows) * 2, dtype=LOT_DTYPE)
+        else:
+            rows = self._rows
+        rows[:size] = self._rows[self._head:self._tail]
+        self._rows = rows
+        self._offset += self._head
+        self._head = 0
+        self._tail = size
+
+    def mark(self, mkt_price, avg_cost):
+        """
+        Value every lot at ``mkt_price`` (its own market price if None) and ``avg_cost``,
+        with the formulas of ``Stock.stock.updateStockMk_value``.
+        """
+        lots = self._live()
+        if mkt_price is not None:
+            lots["mkt_price"] = mkt_price
+        lots["avg_cost"] = avg_cost
+        lots["amount_cost"] = lots["actual_vol"] * avg_cost
+        lots["market_value"] = lots["actual_vol"] * lots["mkt_price"]
+        lots["unrealized"] = lots["market_value"] - lots["amount_cost"]
+        amount_cost = lots["amount_cost"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lots["unrealizedInPercentage"] = np.where(
+                amount_cost != 0, lots["unrealized"] / amount_cost * 100, 0.0
+            )
+
+    def summary(self):
+        """
+        Returns the lots added up as ``Portfolio.get_all_stocks_info`` reports them: the
+        volume and the per-lot rounded values are summed, buy price, buy time and market
+        price are those of the newest lot.
+        """
+        lots = self._live()
+        newest = self[-1]
+        return {
+            "Actual Volume": int(lots["actual_vol"].sum()),
+            "Total Cost": float(np.round(lots["amount_cost"], 2).sum()),
+            "Market Value": float(np.round(lots["market_value"], 2).sum()),
+            "Unrealized P&L": float(np.round(lots["unrealized"], 2).sum()),
+            "Realized P&L": float(np.round(lots["realized"], 2).sum()),
+            "Buy Price": round(newest.buy_price, 2),
+            "Buy time": newest.get_buy_time_str(),
+            "Market Price": round(newest.mkt_price, 2),
+        }
+
+
+def _column(name, cast):
+    def get(self):
+        return cast(self._lots._row(self._number)[name])
+
+    def set(self, value):
+        self._lots._row(self._number)[name] = value
+
+    return property(get, set)
+
+
+class lotView(Stock.stock):
+    """
+    A lot of an ``arrayLots``. It is a ``Stock.stock`` whose fields are read from and
+    written to its row. A view follows its lot while the lot is held; inserting an older
+    lot (a resting order filled late) moves the lots after it to the next view.
+    """
+
+    __slots__ = ("_lots", "_number")
+
+    def __init__(self, lots, number):
+        self._lots = lots
+        self._number = number
+
+    @property
+    def symbol(self):
+        return self._lots.symbol
+
+    start_vol = _column("start_vol", int)
+    actual_vol = _column("actual_vol", int)
+    buy_price = _column("buy_price", float)
+    mkt_price = _column("mkt_price", float)
+    avg_cost = _column("avg_cost", float)
+    amount_cost = _column("amount_cost", float)
+    market_value = _column("market_value", float)
+    unrealized = _column("unrealized", float)
+    unrealizedInPercentage = _column("unrealizedInPercentage", float)
+    realized = _column("realized", float)
+    buy_time = _column("buy_time", float)
+
+
+# name -> lot container class, see ``Portfolio.portfolio``
+LOT_STORES = {
+    "objects": objectLots,
+    "array": arrayLots,
+}
@@ -0,0 +1,119 @@
+from datetime import timedelta
+import numpy as np
+import pandas as pd
+from . import TickStore
+from . import TradeSim
+
+
+class multiDayRunner:
+    """
+    Streams many days of ticks through one live ``tradeSim``: the portfolio, the resting
+    orders and the strategy instances carry over from day to day in memory instead of
+    being saved to and loaded from the portfolio JSON every day.
+
+    At the end of every day the runner rolls over: the DAY and GTT orders that expired at
+    the close are cancelled, the strategies' cumulative tick volumes start again at zero
+    and the portfolio rolls over (``portfolio.roll_over_day``). The day's summary row and
+    equity curve are kept in memory; the logs, the summary, the equity curve and the
+    portfolio JSON are written to result/<team_name> at checkpoints only, every
+    ``checkpoint_every`` days and after the last day of ``run``.
+
+    The portfolio JSON does not hold resting orders, a run restarted from a checkpoint
+    starts without them.
+    """
+
+    def __init__(self, team_name, strategy_class, checkpoint_every=None, load_existing=True,
+                 participation_rate=None, lot_store="objects", equity_curve=None):
+        """
+        Parameter
+        ----------
+        team_name: owner of the portfolio in result/<team_name>.
+        strategy_class: Strategy_template subclass, one instance per symbol for the whole run.
+        checkpoint_every: number of days between checkpoints, None checkpoints only at the
+                          end of ``run`` or when ``checkpoint`` is called.
+        load_existing, participation_rate, lot_store, equity_curve: see ``TradeSim.tradeSim``.
+        """
+        if checkpoint_every is not None and checkpoint_every <= 0:
+            raise ValueError("checkpoint_every must be a positive number of days.")
+        self.team_name = team_name
+        self.tradeSim = TradeSim.tradeSim(
+            team_name, load_existing=load_existing, participation_rate=participation_rate,
+            lot_store=lot_store, equity_curve=equity_curve,
+        )
+        self.engine = self.tradeSim.get_engine(strategy_class)
+        self.checkpoint_every = checkpoint_every
+        self.days = 0
+        # summary rows and equity curve samples of the days since the last checkpoint
+        self._summary_rows = []
+        self._equity_curves = []
+
+    def run(self, days, symbols=None):
+        """
+        Stream ``days`` in order and checkpoint after the last one.
+
+        Parameter
+        ----------
+        days: iterable of daily tick DataFrames or paths of tick CSVs or tick stores.
+        symbols: optional iterable of ShareCodes to simulate, all symbols by default.
+
+        Returns
+        -------
+        int
+            Number of ticks processed.
+        """
+        processed = 0
+        for ticks in days:
+            processed += self.run_day(ticks, symbols)
+        if self._summary_rows:
+            self.checkpoint()
+        return processed
+
+    def run_day(self, ticks, symbols=None):
+        """
+        Stream one day of ticks, roll over to the next day and checkpoint if one is due.
+        Returns the number of ticks processed.
+        """
+        if isinstance(ticks, str):
+            ticks = TickStore.tickStore.load(ticks, symbols=symbols)
+        processed = self.engine.stream(ticks, symbols=symbols)
+        if len(ticks) == 0:
+            return processed
+
+        self.roll_over(pd.Timestamp(ticks["TradeDateTime"].iloc[0]).date())
+        self.days += 1
+        if self.checkpoint_every is not None and self.days % self.checkpoint_every == 0:
+            self.checkpoint()
+        return processed
+
+    def roll_over(self, trading_date):
+        """
+        End of ``trading_date``: expire the day's orders, keep the day's summary row and
+        equity curve, and roll the strategies and the portfolio over to the next day.
+        """
+        self.tradeSim.expire_orders(pd.Timestamp(trading_date) + timedelta(days=1))
+        for handler in self.engine.handlers.values():
+            handler.start_day()
+
+        portfolio = self.tradeSim.portfolio
+        portfolio.update_portfolio_totals()
+        self._summary_rows.append(portfolio.summary_row(trading_date))
+        self._equity_curves.append(portfolio.equity_curve.to_array())
+        portfolio.roll_over_day()
+
+    def checkpoint(self):
+        """
+        Write the logs, the summary rows and equity curves of the days since the last
+        checkpoint, the transaction summary and the portfolio JSON.
+        """
+        trade_sim = self.tradeSim
+        portfolio = trade_sim.portfolio
+        trade_sim.flushTransactionLog()
+        trade_sim.flushErrorLogger()
+        if self._summary_rows:
+            portfolio.write_summary_rows(self._summary_rows)
+        if self._equity_curves:
+            portfolio.save_equity_curve(np.concatenate(self._equity_curves))
+        trade_sim.create_transaction_summarize(self.team_name)
+        trade_sim.save_portfolio()
+        self._summary_rows = []
+        self._equity_curves = []
@@ -1,11 +1,27 @@
+import copy
 import time
 import csv
 import os
 import bisect
+from datetime import timedelta
+import pandas as pd
 from . import CommissionService
+from . import OrderRejection
 
 
 class order:
+    # GTC: good till cancelled, DAY: until the end of the trading day,
+    # GTT: good till expire_time, IOC: immediate or cancel, FOK: fill or kill
+    TIME_IN_FORCE = ("GTC", "DAY", "GTT", "IOC", "FOK")
+    # STOP and TRAILING_STOP fill at market once triggered, STOP_LIMIT rests at its limit price,
+    # AUCTION orders wait for the next call auction (OPEN1, OPEN2 or ATC)
+    ORDER_TYPES = ("LIMIT", "STOP", "STOP_LIMIT", "TRAILING_STOP", "AUCTION")
+    STOP_TYPES = ("STOP", "STOP_LIMIT", "TRAILING_STOP")
+    # board lots trade in multiples of 100 shares, the odd-lot board takes 1 to 99 shares
+    BOARDS = ("main", "odd")
+    # tick times are Bangkok wall-clock times
+    MARKET_UTC_OFFSET = timedelta(hours=7)
+
     _order_counter = 1
     _set50_symbols = set()
     _csv_loaded = False
@@ -43,7 +59,26 @@ class order:
 
         cls._csv_loaded = True
 
-    def __init__(
+    def __init__(self, *args, **kwargs):
+        """
+        Create and validate an order, see ``_build`` for the parameters. Raises the
+        ``orderRejection`` (a ValueError) if the order is rejected; ``create`` returns it instead.
+        """
+        rejection = self._build(*args, **kwargs)
+        if rejection is not None:
+            raise rejection
+
+    @classmethod
+    def create(cls, *args, **kwargs):
+        """
+        Exception-free constructor. Returns the new order, or an ``orderRejection`` carrying
+        the reason code if the order is rejected.
+        """
+        new_order = cls.__new__(cls)
+        rejection = new_order._build(*args, **kwargs)
+        return new_order if rejection is None else rejection
+
+    def _build(
         self,
         ownerPortfolio,
         volume,
@@ -53,64 +88,158 @@ class order:
         cum_sell_volume,
         cum_buy_volume,
         timestamp=None,
+        time_in_force="GTC",
+        expire_time=None,
+        order_type="LIMIT",
+        stop_price=None,
+        trail_amount=None,
+        trail_percent=None,
+        check_position=None,
+        board="main",
+        validate_against=None,
     ):
         order.load_set50_symbols()
-        is_valid, reason = self.validate_order(
-            volume, side, symbol, ownerPortfolio, price, cum_sell_volume, cum_buy_volume
-        )
-        if not is_valid:
-            raise ValueError(
-                f"[ERROR] Order for {symbol} (Vol: {volume}, Price: {price}, Side: {side}) skipped due to {reason}"
+        timestamp = timestamp if timestamp is not None else time.time()
+        code = self.validate_stop(order_type, time_in_force, stop_price, trail_amount, trail_percent)
+        if code is OrderRejection.rejectReason.OK:
+            # holdings and tick volumes of stop orders are checked when they trigger
+            if check_position is None:
+                check_position = order_type not in self.STOP_TYPES
+            # a batch of orders is validated against a portfolio snapshot, see tradeSim.submit_orders
+            code = self.validate_order(
+                volume, side, symbol, ownerPortfolio if validate_against is None else validate_against, price,
+                cum_sell_volume, cum_buy_volume,
+                check_position=check_position, board=board,
+                # nothing has traded yet before the opening auction
+                check_tick_volume=order_type != "AUCTION",
+            )
+        if code is OrderRejection.rejectReason.OK:
+            code = self.validate_time_in_force(time_in_force, expire_time, timestamp)
+        if code is not OrderRejection.rejectReason.OK:
+            return OrderRejection.orderRejection(
+                code, symbol, volume, price, side,
+                order_type=order_type, time_in_force=time_in_force, expire_time=expire_time, board=board,
+                trail_amount=trail_amount, trail_percent=trail_percent,
             )
+
         self.order_number = f"ORD{order._order_counter:05d}"
         order._order_counter += 1
 
         self.ownerPortfolio = ownerPortfolio
         self.volume = volume
+        self.filled_volume = 0
         self.price = price
         self.side = side
         self.symbol = symbol
         self.cum_sell_volume = cum_sell_volume
         self.cum_buy_volume = cum_buy_volume
-        self.timestamp = timestamp if timestamp is not None else time.time()
+        self.timestamp = timestamp
+        self.time_in_force = time_in_force
+        self.expire_timestamp = self._expire_timestamp(time_in_force, expire_time, timestamp)
+        self.order_type = order_type
+        self.board = board
+        self.trail_amount = trail_amount
+        self.trail_percent = trail_percent
+        # a trailing stop starts trailing from the order price
+        self.stop_price = self.trailing_stop_price(price) if order_type == "TRAILING_STOP" else stop_price
+        return None
 
+    @classmethod
+    def to_timestamp(cls, trade_datetime):
+        """
+        Convert a tick ``TradeDateTime`` to an order timestamp (epoch seconds).
+        """
+        return (pd.Timestamp(trade_datetime) - cls.MARKET_UTC_OFFSET).timestamp()
+
+    @classmethod
+    def _expire_timestamp(cls, time_in_force, expire_time, timestamp):
+        if time_in_force == "GTT":
+            return cls.to_timestamp(expire_time)
+        if time_in_force == "DAY":
+            trade_day = (pd.Timestamp(timestamp, unit="s") + cls.MARKET_UTC_OFFSET).normalize()
+            return cls.to_timestamp(trade_day + timedelta(days=1))
+        return None
+
+    @classmethod
+    def validate_time_in_force(cls, time_in_force, expire_time, timestamp):
+        if time_in_force not in cls.TIME_IN_FORCE:
+            return OrderRejection.rejectReason.INVALID_TIME_IN_FORCE
+
+        if time_in_force == "GTT":
+            if expire_time is None:
+                return OrderRejection.rejectReason.MISSING_EXPIRE_TIME
+            if cls.to_timestamp(expire_time) <= timestamp:
+                return OrderRejection.rejectReason.EXPIRE_TIME_PASSED
+        elif expire_time is not None:
+            return OrderRejection.rejectReason.EXPIRE_TIME_NOT_GTT
+
+        return OrderRejection.rejectReason.OK
+
+    @classmethod
+    def validate_stop(cls, order_type, time_in_force, stop_price, trail_amount, trail_percent):
+        if order_type not in cls.ORDER_TYPES:
+            return OrderRejection.rejectReason.INVALID_ORDER_TYPE
+        if order_type in ("LIMIT", "AUCTION"):
+            return OrderRejection.rejectReason.OK
+
+        if time_in_force in ("IOC", "FOK"):
+            return OrderRejection.rejectReason.IMMEDIATE_STOP
+        if order_type == "TRAILING_STOP":
+            if (trail_amount is None) == (trail_percent is None):
+                return OrderRejection.rejectReason.INVALID_TRAIL
+            if trail_amount is not None and trail_amount <= 0:
+                return OrderRejection.rejectReason.INVALID_TRAIL_AMOUNT
+            if trail_percent is not None and not 0 < trail_percent < 1:
+                return OrderRejection.rejectReason.INVALID_TRAIL_PERCENT
+        elif stop_price is None or stop_price <= 0:
+            return OrderRejection.rejectReason.INVALID_STOP_PRICE
+
+        return OrderRejection.rejectReason.OK
+
+    @classmethod
+    def validate_order(cls, volume, side, symbol, ownerPortfolio, price, cum_sell_volume, cum_buy_volume, check_position=True, board="main", check_tick_volume=True):
+        """
+        Returns the ``rejectReason`` of the first check the order fails, ``rejectReason.OK`` if it passes.
+        """
+        if board == "odd":
+            if not 0 < volume < 100:
+                return OrderRejection.rejectReason.INVALID_ODD_LOT
+        elif board != "main":
+            return OrderRejection.rejectReason.INVALID_BOARD
+        elif (volume % 100.0) != 0 and volume > 0:
+            return OrderRejection.rejectReason.INVALID_LOT
 
-    def validate_order(self, volume, side, symbol, ownerPortfolio, price, cum_sell_volume, cum_buy_volume):
-        cashBalance = ownerPortfolio.get_cash_balance()
-        
-        if (volume % 100.0) != 0 and volume > 0:
-            return False, "Volume must be a multiple of 100.SS S"
-        
         if side.capitalize() not in {"Buy", "Sell"}:
-            return False, f"Invalid side '{side}'. Must be 'Buy' or 'Sell'. Case sensitive."
-        
-        if symbol.upper() not in self._set50_symbols:
-            return False, f"Symbol '{symbol}' is not in SET50."
-        
+            return OrderRejection.rejectReason.INVALID_SIDE
+
+        if symbol.upper() not in cls._set50_symbols:
+            return OrderRejection.rejectReason.NOT_IN_SET50
+
         if (
-            CommissionService.commissionService.verify_transaction(
-                volume=volume, price=price, cashBalance=cashBalance
+            side == "Buy"
+            and CommissionService.commissionService.verify_transaction(
+                volume=volume, price=price, cashBalance=ownerPortfolio.get_cash_balance()
             )
             is False
-            and side == "Buy"
         ):
-            return False, "Insufficient cash balance to cover transaction costs."
-        
-        if ownerPortfolio.has_stock(symbol, volume) is False and side == "Sell":
-            return (
-                False,
-                f"Cannot sell {symbol} as it is not in the portfolio or insufficient volume.",
-            )
-            
+            return OrderRejection.rejectReason.INSUFFICIENT_CASH
+
+        if not check_position:
+            return OrderRejection.rejectReason.OK
+
+        if side == "Sell" and ownerPortfolio.has_stock(symbol, volume) is False:
+            return OrderRejection.rejectReason.INSUFFICIENT_HOLDINGS
+
+        if not check_tick_volume:
+            return OrderRejection.rejectReason.OK
+
         if side == "Buy" and volume > cum_sell_volume:
-            return False, "Order's buy volume exceeds the cumulative sell volume from the daily ticks."
-        
+            return OrderRejection.rejectReason.EXCEEDS_SELL_VOLUME
+
         if side == "Sell" and volume > cum_buy_volume:
-            return False, "Order's sell volume exceeds the cumulative buy volume from the daily ticks."
-        
-        return True, ""
-        
-        
+            return OrderRejection.rejectReason.EXCEEDS_BUY_VOLUME
+
+        return OrderRejection.rejectReason.OK
 
     # --------- Getter Methods ---------
     def get_order_number(self):
@@ -122,6 +251,35 @@ class order:
     def get_volume(self):
         return self.volume
 
+    def get_order_type(self):
+        return self.order_type
+
+    def get_board(self):
+        return self.board
+
+    def get_stop_price(self):
+        return self.stop_price
+
+    def trailing_stop_price(self, extreme_price):
+        """
+        Stop price of a trailing stop that trails ``extreme_price``, the highest price since
+        the order was placed for sells and the lowest price for buys.
+        """
+        if self.trail_amount is not None:
+            trail = self.trail_amount
+        else:
+            trail = extreme_price * self.trail_percent
+        return extreme_price - trail if self.side == "Sell" else extreme_price + trail
+
+    def get_filled_volume(self):
+        return self.filled_volume
+
+    def get_remaining_volume(self):
+        return self.volume - self.filled_volume
+
+    def is_filled(self):
+        return self.filled_volume >= self.volume
+
     def get_price(self):
         return self.price
 
@@ -134,6 +292,15 @@ class order:
     def get_timestamp(self):
         return self.timestamp
 
+    def get_time_in_force(self):
+        return self.time_in_force
+
+    def get_expire_timestamp(self):
+        return self.expire_timestamp
+
+    def is_expired(self, timestamp):
+        return self.expire_timestamp is not None and timestamp >= self.expire_timestamp
+
     def get_formatted_timestamp(self):
         return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.timestamp))
 
@@ -155,6 +322,22 @@ class order:
     def set_volume(self, volume):
         self.volume = volume
 
+    def set_stop_price(self, stop_price):
+        self.stop_price = stop_price
+
+    def fill(self, volume):
+        self.filled_volume += volume
+
+    def renew(self):
+        """
+        Returns an unfilled copy of the order with the same terms under a new order number.
+        """
+        fresh = copy.copy(self)
+        fresh.order_number = f"ORD{order._order_counter:05d}"
+        order._order_counter += 1
+        fresh.filled_volume = 0
+        return fresh
+
     def set_price(self, price):
         self.price = price
 
@@ -0,0 +1,161 @@
+import bisect
+from itertools import count
+from . import CommissionService
+
+
+class orderBook:
+    """
+    Resting limit orders indexed by symbol and side.
+
+    Each (symbol, side) keeps its orders sorted by match threshold, the worst market
+    price at which the order still matches (limit price plus slippage for buys, minus
+    slippage for sells). A tick only has to bisect its own symbol's books to find the
+    orders that are marketable at its price.
+
+    Orders are also indexed by order number, so ``get`` (and with it a volume amend) is a
+    dictionary lookup. ``cancel`` only drops that index entry and leaves a dead slot in the
+    sorted book, which is skipped when matching and compacted once a book holds more dead
+    slots than live orders, so cancels take amortized constant time.
+    """
+
+    COMPACT_MIN_DEAD = 32
+
+    def __init__(self, orders=None):
+        # (symbol, side) -> ([(threshold, seq), ...] sorted, [order, ...] in the same order)
+        self._books = {}
+        # order number -> (symbol, side, (threshold, seq), order)
+        self._entries = {}
+        # (symbol, side) -> number of cancelled slots still in the sorted lists
+        self._dead = {}
+        self._seq = count()
+        for order in orders or []:
+            self.add(order)
+
+    @staticmethod
+    def match_threshold(order):
+        price = order.get_price()
+        slippage = CommissionService.commissionService._get_slippage(price)
+        if order.get_side() == "Buy":
+            return price + slippage
+        return price - slippage
+
+    def add(self, order):
+        key = (self.match_threshold(order), next(self._seq))
+        symbol, side = order.get_symbol(), order.get_side()
+
+        keys, orders = self._books.setdefault((symbol, side), ([], []))
+        index = bisect.bisect_right(keys, key)
+        keys.insert(index, key)
+        orders.insert(index, order)
+        self._entries[order.get_order_number()] = (symbol, side, key, order)
+
+    def remove(self, order):
+        entry = self._entries.pop(order.get_order_number(), None)
+        if entry is None:
+            return False
+
+        symbol, side, key, _ = entry
+        keys, orders = self._books[(symbol, side)]
+        index = bisect.bisect_left(keys, key)
+        del keys[index]
+        del orders[index]
+        if not keys:
+            del self._books[(symbol, side)]
+            self._dead.pop((symbol, side), None)
+        return True
+
+    def get(self, order_number):
+        """
+        Returns the resting order with ``order_number``, or None.
+        """
+        entry = self._entries.get(order_number)
+        return entry[3] if entry is not None else None
+
+    def cancel(self, order_number):
+        """
+        Cancel a resting order in constant time. Returns the order, or None if it is not resting.
+        """
+        order = self.get(order_number)
+        if order is None:
+            return None
+        self._kill(order_number)
+        return order
+
+    def requeue(self, order):
+        """
+        Re-sort a resting order after its price changed; it loses its time priority.
+        The order is inserted again into its sorted book, which is linear in the book's size.
+        """
+        self._kill(order.get_order_number())
+        self.add(order)
+
+    def _kill(self, order_number):
+        symbol, side, _, _ = self._entries.pop(order_number)
+        book_key = (symbol, side)
+        dead = self._dead.get(book_key, 0) + 1
+        self._dead[book_key] = dead
+
+        keys, orders = self._books[book_key]
+        if dead >= self.COMPACT_MIN_DEAD and dead > len(keys) - dead:
+            self._compact(book_key)
+
+    def _is_live(self, key, order):
+        entry = self._entries.get(order.get_order_number())
+        return entry is not None and entry[2] == key
+
+    def _compact(self, book_key):
+        keys, orders = self._books[book_key]
+        live = [(k, o) for k, o in zip(keys, orders) if self._is_live(k, o)]
+        if live:
+            keys[:] = [k for k, _ in live]
+            orders[:] = [o for _, o in live]
+        else:
+            del self._books[book_key]
+        self._dead.pop(book_key, None)
+
+    def marketable(self, symbol, last_price):
+        """
+        Returns the resting orders of ``symbol`` that match at ``last_price``, oldest first.
+        """
+        matched = []
+
+        book = self._books.get((symbol, "Buy"))
+        if book is not None:
+            # buys match while the market is at or below their threshold
+            keys, orders = book
+            start = bisect.bisect_left(keys, (last_price,))
+            matched.extend(zip(keys[start:], orders[start:]))
+
+        book = self._books.get((symbol, "Sell"))
+        if book is not None:
+            # sells match while the market is at or above their threshold
+            keys, orders = book
+            stop = bisect.bisect_right(keys, (last_price, float("inf")))
+            matched.extend(zip(keys[:stop], orders[:stop]))
+
+        if not matched:
+            return []
+        if self._dead:
+            matched = [(key, order) for key, order in matched if self._is_live(key, order)]
+        matched.sort(key=lambda item: item[0][1])
+        return [order for _, order in matched]
+
+    def orders_for(self, symbol):
+        return [
+            order
+            for side in ("Buy", "Sell")
+            for key, order in zip(*self._books.get((symbol, side), ((), ())))
+            if self._is_live(key, order)
+        ]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        for keys, orders in list(self._books.values()):
+            for key, order in list(zip(keys, orders)):
+                if self._is_live(key, order):
+                    yield order
+
+    def __contains__(self, order):
+        return order.get_order_number() in self._entries
@@ -0,0 +1,60 @@
+class orderGroups:
+    """
+    One-cancels-other (OCO) and bracket groups of orders, keyed by order number.
+
+    The registry only records the links between orders; ``execution`` reads it while it
+    records a fill, so siblings are cancelled and bracket exits are placed inside the
+    matching step, without a round trip through the strategy.
+
+    - OCO: when one order of the group is filled, the other orders are cancelled. A
+      partial fill reduces the volume of the other orders by the filled volume.
+    - Bracket: an entry order with exit orders (take profit and stop loss) that are only
+      placed once the entry fills, for the filled volume, and form an OCO group. Later
+      fills of the entry add to the resting exits, or get a new pair once an exit has left
+      the books.
+    """
+
+    def __init__(self):
+        # order number -> set of the other order numbers of its OCO group
+        self._siblings = {}
+        # entry order number -> {"children": [order, ...], "active": bool}
+        self._brackets = {}
+
+    def add_oco(self, order_numbers):
+        numbers = set(order_numbers)
+        for number in numbers:
+            self._siblings[number] = numbers - {number}
+
+    def add_bracket(self, entry, children):
+        self._brackets[entry.get_order_number()] = {"children": list(children), "active": False}
+        self.add_oco([child.get_order_number() for child in children])
+
+    def is_grouped(self, order_number):
+        return order_number in self._siblings or order_number in self._brackets
+
+    def siblings(self, order_number):
+        return self._siblings.get(order_number, ())
+
+    def bracket(self, order_number):
+        return self._brackets.get(order_number)
+
+    def discard(self, order_number):
+        """
+        Forget an order that left the books. Exit orders of a bracket whose entry never
+        filled are dropped with it; exits that were already placed stay linked.
+        """
+        for number in self._siblings.pop(order_number, ()):
+            group = self._siblings.get(number)
+            if group is None:
+                continue
+            group.discard(order_number)
+            if not group:
+                del self._siblings[number]
+
+        bracket = self._brackets.pop(order_number, None)
+        if bracket is not None and not bracket["active"]:
+            for child in bracket["children"]:
+                self.discard(child.get_order_number())
+
+    def __len__(self):
+        return len(self._siblings) + len(self._brackets)
@@ -0,0 +1,73 @@
+from enum import Enum
+
+
+class rejectReason(Enum):
+    """
+    Reason codes of rejected orders. The value is the reason text, formatted with the
+    fields of the ``orderRejection``.
+    """
+
+    OK = ""
+    # order type and stops
+    INVALID_ORDER_TYPE = "Invalid order type '{order_type}'. Must be one of LIMIT, STOP, STOP_LIMIT, TRAILING_STOP, AUCTION."
+    IMMEDIATE_STOP = "{order_type} order cannot be {time_in_force}."
+    INVALID_TRAIL = "Trailing stop requires either a trail amount or a trail percent."
+    INVALID_TRAIL_AMOUNT = "Trail amount must be positive, got {trail_amount}."
+    INVALID_TRAIL_PERCENT = "Trail percent must be between 0 and 1, got {trail_percent}."
+    INVALID_STOP_PRICE = "{order_type} order requires a positive stop price."
+    # order
+    INVALID_ODD_LOT = "Odd-lot volume must be between 1 and 99, got {volume}."
+    INVALID_BOARD = "Invalid board '{board}'. Must be one of main, odd."
+    INVALID_LOT = "Volume must be a multiple of 100."
+    INVALID_SIDE = "Invalid side '{side}'. Must be 'Buy' or 'Sell'. Case sensitive."
+    NOT_IN_SET50 = "Symbol '{symbol}' is not in SET50."
+    INSUFFICIENT_CASH = "Insufficient cash balance to cover transaction costs."
+    INSUFFICIENT_HOLDINGS = "Cannot sell {symbol} as it is not in the portfolio or insufficient volume."
+    EXCEEDS_SELL_VOLUME = "Order's buy volume exceeds the cumulative sell volume from the daily ticks."
+    EXCEEDS_BUY_VOLUME = "Order's sell volume exceeds the cumulative buy volume from the daily ticks."
+    # time in force
+    INVALID_TIME_IN_FORCE = "Invalid time in force '{time_in_force}'. Must be one of GTC, DAY, GTT, IOC, FOK."
+    MISSING_EXPIRE_TIME = "GTT order requires an expire time."
+    EXPIRE_TIME_PASSED = "Expire time {expire_time} is not after the order time."
+    EXPIRE_TIME_NOT_GTT = "Expire time is only supported for GTT orders, not {time_in_force}."
+    # brackets and amends
+    IMMEDIATE_BRACKET = "{time_in_force} entry, the entry has to rest in the book."
+    INVALID_BRACKET_PRICES = "take profit {take_profit_price} and stop loss {stop_loss_price} not being on either side of the entry price."
+    AMEND_BELOW_FILLED = "Volume must exceed the filled volume {filled_volume}."
+
+
+class orderRejection(ValueError):
+    """
+    A rejected order with its reason code.
+
+    The order paths return a rejection instead of raising it, and its message is only
+    formatted when it is read, so a strategy that retries a rejected order on every tick
+    only pays for one small object per attempt. It is a ValueError, so callers that check
+    the returned value for one keep working, and ``order(...)`` still raises it.
+    """
+
+    __slots__ = ("code", "symbol", "volume", "price", "side", "subject", "context")
+
+    def __init__(self, code, symbol, volume, price, side, subject="Order", **context):
+        self.code = code
+        self.symbol = symbol
+        self.volume = volume
+        self.price = price
+        self.side = side
+        self.subject = subject
+        # extra fields used by the reason text, e.g. board or time_in_force
+        self.context = context
+
+    def reason(self):
+        return self.code.value.format(
+            symbol=self.symbol, volume=self.volume, price=self.price, side=self.side, **self.context
+        )
+
+    def key(self):
+        """
+        Identifies rejections with the same message without formatting it.
+        """
+        return (self.code, self.subject, self.symbol, self.volume, self.price, self.side, *self.context.values())
+
+    def __str__(self):
+        return f"[ERROR] {self.subject} for {self.symbol} (Vol: {self.volume}, Price: {self.price}, Side: {self.side}) skipped due to {self.reason()}"
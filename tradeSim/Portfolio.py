@@ -1,13 +1,23 @@
-from collections import defaultdict
+import heapq
 import csv
 import json
 from . import Stock
+from . import CommissionService
+from . import LotStore
+from . import EquityCurve
 import os
 from datetime import datetime
-import inspect
 
 
 class portfolio:
+    SUMMARY_COLUMNS = [
+        "Owner", "Number of Stocks", "Total Cost", "Unrealized P&L", "Unrealized %",
+        "Realized P&L", "cashbalance start", "Cash Balance", "Net Asset Value", "Max NAV", "Min NAV",
+        "Max Drawdown (%)", "Relative Drawdown", "Calmar Ratio",
+        "Previous Day Max DD (%)", "Number of Wins", "Number of Sells",
+        "Win Rate", "Return rate", "Saved At", "Daily Ticks Time"
+    ]
+
     def __init__(
         self,
         owner,
@@ -25,9 +35,20 @@ class portfolio:
         max_Draw_down=0.0,
         No_win=0,
         No_sell=0,
+        lot_store="objects",
+        equity_curve=None,
     ):
+        """
+        ``lot_store`` picks how the lots of a symbol are kept: "objects" (default) keeps
+        ``Stock.stock`` objects, "array" keeps numpy rows and values them column-wise, for
+        portfolios that build up thousands of lots.
+        ``equity_curve`` is the ``EquityCurve.equityCurve`` that price updates are recorded
+        into, one sample per minute of tick time by default.
+        """
+        if lot_store not in LotStore.LOT_STORES:
+            raise ValueError(f"Invalid lot store '{lot_store}'. Must be one of {', '.join(LotStore.LOT_STORES)}.")
         self.owner = owner
-        self.stocksList = stocksList if stocksList is not None else []
+        self.lot_store = lot_store
         self.amountByCost = amountByCost
         self.unrealized = unrealized
         self.unrealizedInPercentage = unrealizedInPercentage
@@ -42,72 +63,164 @@ class portfolio:
         self.max_Draw_down = max_Draw_down
         self.No_win = No_win
         self.No_sell = No_sell
-
-    def add_stock(self, stock):
-        # check if add stock is call for create_order
-        caller = inspect.stack()[1].function
-        if caller != "_process_buy_order" and caller != "_process_market_order":
-            print(caller)
-            raise ValueError(f"add stock must be called from create_order(). unable to add stock from {caller}()")
-
-        self.stocksList.append(stock)
+        self.equity_curve = equity_curve if equity_curve is not None else EquityCurve.equityCurve()
+
+        # symbol -> position: the lots of the symbol, oldest first, and their totals; kept up
+        # to date on every buy, sell and price update so that none of them scans all lots
+        self._positions = {}
+        # totals of all positions: cost of the holdings and their market value
+        self._cost = 0.0
+        self._market_value = 0.0
+        # symbols whose price changed since their lots were last brought up to date
+        self._stale = set()
+        # the totals need updating: holdings, prices of held symbols or cash changed
+        self._dirty = True
+        # bumped on every change; the summaries are cached with the version they were built at
+        self._version = 0
+        self._info_cache = None
+        self._stocks_info_cache = None
+        for stock in stocksList or []:
+            self._add_to_position(stock)
+        for symbol in self._positions:
+            self.update_avg_stocks_by_symbol(symbol)
+
+    @property
+    def stocksList(self):
+        """
+        All lots, oldest first, brought up to date with the last prices. Built from the
+        per-symbol lots, so it is a copy.
+        """
+        self._sync_lots()
+        return list(heapq.merge(*(pos.lots for pos in self._positions.values()), key=lambda stock: stock.buy_time))
+
+    def _changed(self):
+        self._dirty = True
+        self._version += 1
+
+    def _add_to_position(self, stock):
+        self._changed()
+        symbol = stock.get_symbol()
+        pos = self._positions.get(symbol)
+        if pos is None:
+            pos = self._positions[symbol] = position(symbol, LotStore.LOT_STORES[self.lot_store](symbol))
+        pos.add_lot(stock)
+        volume = stock.get_actual_vol()
+        cost = stock.get_buy_price() * volume
+        market_value = stock.get_mkt_price() * volume
+        pos.volume += volume
+        pos.cost += cost
+        pos.market_value += market_value
+        self._cost += cost
+        self._market_value += market_value
+
+    def _take_from_position(self, stock, volume, realized):
+        self._changed()
+        pos = self._positions[stock.get_symbol()]
+        cost = stock.get_buy_price() * volume
+        market_value = stock.get_mkt_price() * volume
+        pos.volume -= volume
+        pos.realized += realized
+        if pos.volume <= 0:
+            # drop what is left of the position rather than carrying rounding errors
+            cost, market_value = pos.cost, pos.market_value
+            pos.cost = pos.market_value = 0.0
+        else:
+            pos.cost -= cost
+            pos.market_value -= market_value
+        self._cost -= cost
+        self._market_value -= market_value
+
+    def _sync_lots(self, symbol=None):
+        """
+        Bring the lots of ``symbol`` (of every symbol by default) up to date with the price
+        updates they missed. Price updates only change the position, the lots follow lazily
+        when they are read or traded.
+        """
+        symbols = list(self._stale) if symbol is None else [symbol]
+        for sym in symbols:
+            if sym not in self._stale:
+                continue
+            self._stale.discard(sym)
+            pos = self._positions.get(sym)
+            if pos is None:
+                continue
+            pos.lots.mark(pos.mkt_price, pos.get_avg_cost())
+
+    def add_stock(self, stock, token=None):
+        # only fills of orders add stock, ``execution`` passes the fill token
+        if token is not Stock._FILL_TOKEN:
+            raise ValueError("add stock must be called from create_order(). unable to add stock outside of a fill")
+
+        self._sync_lots(stock.get_symbol())
+        # the totals are taken before the new lot counts, the cash is paid after this call
         self.update_portfolio_totals()
+        self._add_to_position(stock)
         self.update_avg_stocks_by_symbol(stock.get_symbol())
 
     def decrease_stock_volume(self, symbol, volume, price):
-
-        self.stocksList.sort(key=lambda stock: stock.buy_time)
+        """
+        Sell up to ``volume`` shares of ``symbol`` at ``price``, oldest lots first.
+        Returns the volume actually sold, at most the volume held.
+        """
+        self._sync_lots(symbol)
+        # as for buys, the totals are taken before the sale, the proceeds are credited after this call
+        self.update_portfolio_totals()
 
         remaining_volume = volume
         total_realized = 0.0
-        if self._isWin((price * volume), self._cal_avg_cost(symbol) * volume):
+        pos = self._positions.get(symbol)
+        if pos is not None and self._isWin((price * volume), self._cal_avg_cost(symbol) * volume):
             self._increase_numberOfWin()
-        for s in list(self.stocksList):
 
-            if remaining_volume == 0:
-                break
+        # sell the oldest lots first
+        lots = pos.lots if pos is not None else ()
+        while lots and remaining_volume != 0:
+            s = lots[0]
 
-            if s.get_symbol() == symbol:
+            if s.get_realized() != 0.0:
+                total_realized = s.get_realized()
 
-                if s.get_realized() != 0.0:
-                    total_realized = s.get_realized()
+            vol_to_decrease = min(s.get_actual_vol(), remaining_volume)
 
-                vol_to_decrease = min(s.get_actual_vol(), remaining_volume)
-
-                # Calculate realized profit/loss
-                realized_profit = (price * vol_to_decrease) - (
-                    s.get_buy_price() * vol_to_decrease
-                )
-                total_realized += realized_profit
-                self.realized += realized_profit
+            # Calculate realized profit/loss
+            realized_profit = (price * vol_to_decrease) - (
+                s.get_buy_price() * vol_to_decrease
+            )
+            total_realized += realized_profit
+            self.realized += realized_profit
 
-                s.add_realized(total_realized)
+            s.add_realized(total_realized, Stock._FILL_TOKEN)
 
-                # count number of sell count
-                self._increase_numberOfSell()
+            # count number of sell count
+            self._increase_numberOfSell()
 
-                # decrease volume of stock
-                s.decreaseStockVolume(vol_to_decrease)
-                remaining_volume -= vol_to_decrease
+            # decrease volume of stock
+            self._take_from_position(s, vol_to_decrease, realized_profit)
+            s.decreaseStockVolume(vol_to_decrease, Stock._FILL_TOKEN)
+            remaining_volume -= vol_to_decrease
 
-                # If actual_vol becomes 0 or below, remove this stock
-                if s.get_actual_vol() <= 0:
-                    self.stocksList.remove(s)
+            # If actual_vol becomes 0 or below, remove this stock
+            if s.get_actual_vol() <= 0:
+                lots.popleft()
 
-        self.update_portfolio_totals()
+        if pos is not None and pos.volume <= 0:
+            del self._positions[symbol]
         self.update_avg_stocks_by_symbol(symbol)
+        return volume - remaining_volume
 
     def update_avg_stocks_by_symbol(self, symbol):
-            for stocks in self.get_stock_by_symbol(symbol):
-                new_price = stocks.get_mkt_price()
-                symbol_avg_cost = self._cal_avg_cost(symbol)
-                stocks.updateStockMk_value(new_price, symbol_avg_cost)
+            pos = self._positions.get(symbol)
+            if pos is None:
+                return
+            pos.lots.mark(None, pos.get_avg_cost())
 
     def update_sold_stock_valueToPort(self, amount):
         self.cashbalance += amount
+        self._changed()
 
     def update_Buy_stock_valueToPort(self, amount):
         self.cashbalance -= amount
+        self._changed()
 
     def _update_max_min_nav(self):
         nav = self.get_nav()
@@ -127,20 +240,10 @@ class portfolio:
         )
 
     def _cal_avg_cost(self, symbol):
-        symbol_stocks = self.get_stock_by_symbol(symbol)
-        total_volume = 0
-        total_cost = 0.0
-        for stock in symbol_stocks:
-            volume = stock.get_actual_vol()
-            price = stock.get_buy_price()
-            total_volume += volume
-            total_cost += price * volume
-
-        if total_volume == 0:
+        pos = self._positions.get(symbol)
+        if pos is None:
             return 0.0
-
-        avg_cost = total_cost / total_volume
-        return avg_cost
+        return pos.get_avg_cost()
 
     def _cal_maxDD(self):
         if self.max_nav and self.min_nav and self.max_nav != 0:
@@ -165,19 +268,8 @@ class portfolio:
         return (self.max_Draw_down / self.initial_cash) / 100
 
     def update_portfolio_totals(self):
-        total_amount = 0.0
-        total_unrealized = 0.0
-        total_realized = 0.0
-
-        for stock in self.stocksList:
-            total_amount += stock.get_amount_cost()
-            total_unrealized += stock.get_unrealized()
-            total_realized += stock.get_realized()
-            
-
-
-        self.amountByCost = total_amount
-        self.unrealized = total_unrealized
+        self.amountByCost = self._cost
+        self.unrealized = self._market_value - self._cost
         self.unrealizedInPercentage = (
             (self.unrealized / self.amountByCost) * 100
             if self.amountByCost != 0
@@ -186,31 +278,48 @@ class portfolio:
         self._calculate_nav()
         self._update_max_min_nav()
         self._cal_maxDD()
+        self._dirty = False
+        self._version += 1
 
     def _cal_calmar_ratio(self):
         if self.max_Draw_down == 0:
             return 0
         return self.calculate_roi() / self.max_Draw_down
 
-    def update_market_prices(self, price_updates: dict):
+    def update_market_prices(self, price_updates: dict, tick_time=None):
         """
         price_updates: dict mapping symbol (str) -> new market price (float)
+        tick_time: time of the tick in epoch seconds, for the equity curve
+
+        Only the positions of the updated symbols change, and the totals by the change in
+        their market value; the lots are brought up to date when they are read. The totals
+        are only recalculated if a held price, the holdings or the cash changed since.
         """
-        for stock in self.stocksList:
-            if stock.get_symbol() in price_updates:
-                new_price = price_updates[stock.get_symbol()]
-                symbol_avg_cost = self._cal_avg_cost(stock.get_symbol())
-                stock.updateStockMk_value(new_price, symbol_avg_cost)
-        self.update_portfolio_totals()
+        for symbol, new_price in price_updates.items():
+            pos = self._positions.get(symbol)
+            if pos is None:
+                continue
+            market_value = pos.volume * new_price
+            if new_price == pos.mkt_price and market_value == pos.market_value:
+                continue
+            self._changed()
+            self._market_value += market_value - pos.market_value
+            pos.market_value = market_value
+            pos.mkt_price = new_price
+            self._stale.add(symbol)
+        if self._dirty:
+            self.update_portfolio_totals()
+        self.equity_curve.record(self.nav, self.max_nav, self.get_drawdown(), tick_time)
 
     def has_stock(self, symbol, volume):
-        total_volume = 0.0
-        for stock in self.stocksList:
-            if stock.get_symbol() == symbol:
-                total_volume += stock.get_actual_vol()
-        if total_volume >= volume:
-            return True
-        return False
+        return self.get_total_stock_volume_by_symbol(symbol) >= volume
+
+    def snapshot(self):
+        """
+        Returns a ``portfolioSnapshot`` of the current cash balance and holdings.
+        """
+        holdings = {symbol: pos.volume for symbol, pos in self._positions.items()}
+        return portfolioSnapshot(self.cashbalance, holdings)
 
     def cal_realized(self, total_cost, total_value):
         return total_value - total_cost
@@ -222,6 +331,19 @@ class portfolio:
     def get_stocks_list(self):
         return self.stocksList
 
+    def get_position(self, symbol):
+        """
+        Returns the position in ``symbol`` (all its lots added up) or None if it is not held.
+
+        Returns
+        -------
+        dict
+            "Symbol", "Volume", "Total Cost", "Average Cost", "Market Price" (None until the
+            first price update), "Market Value" and "Realized P&L" of the position.
+        """
+        pos = self._positions.get(symbol)
+        return None if pos is None else pos.get_info()
+
     def get_amount_by_cost(self):
         return self.amountByCost
 
@@ -255,6 +377,17 @@ class portfolio:
     def get_max_draw_down(self):
         return self.max_Draw_down
 
+    def get_drawdown(self):
+        """
+        Returns the current drawdown from the peak NAV in percent (0 or negative).
+        """
+        if not self.max_nav:
+            return 0.0
+        return (self.nav - self.max_nav) / self.max_nav * 100
+
+    def get_equity_curve(self):
+        return self.equity_curve
+
     def get_number_of_wins(self):
         return self.No_win
 
@@ -265,37 +398,25 @@ class portfolio:
         """
         Returns a list of aggregated stock info dictionaries by symbol.
         Combines multiple lots of the same stock into a single summary row.
+        The rows are cached until a fill or a price update of a held symbol.
         """
-        aggregated = defaultdict(
-            lambda: {
-                "Symbol": "",
-                "Buy Price": 0.0,
-                "Actual Volume": 0,
-                "Total Cost": 0.0,
-                "Market Value": 0.0,
-                "Unrealized P&L": 0.0,
-                "Realized P&L": 0.0,
-                "Buy time": "",
-                "Market Price": 0.0,
-            }
+        version = self._version
+        cached = self._stocks_info_cache
+        if cached is None or cached[0] != version:
+            cached = self._stocks_info_cache = (version, self._build_all_stocks_info())
+        return [dict(row) for row in cached[1]]
+
+    def _build_all_stocks_info(self):
+        self._sync_lots()
+        # symbols in the order of their oldest lot, as in stocksList
+        positions = sorted(
+            (pos for pos in self._positions.values() if pos.lots),
+            key=lambda pos: pos.lots[0].buy_time,
         )
 
-        for stock in self.stocksList:
-            info = stock.get_stock_info()
-            symbol = info["Symbol"]
-
-            aggregated[symbol]["Symbol"] = symbol
-            aggregated[symbol]["Buy Price"] = info["Buy Price"]
-            aggregated[symbol]["Actual Volume"] += info["Actual Volume"]
-            aggregated[symbol]["Total Cost"] += info["Amount Cost"]
-            aggregated[symbol]["Market Value"] += info["Market Value"]
-            aggregated[symbol]["Unrealized P&L"] += info["Unrealized P&L"]
-            aggregated[symbol]["Realized P&L"] += info["Realized P&L"]
-            aggregated[symbol]["Buy time"] = info["Buy time"]
-            aggregated[symbol]["Market Price"] = info["Market Price"]
-
         result = []
-        for sym_data in aggregated.values():
+        for pos in positions:
+            sym_data = pos.lots.summary()
             actual_vol = sym_data["Actual Volume"]
             avg_cost = sym_data["Total Cost"] / actual_vol if actual_vol != 0 else 0.0
             unrealized_pct = (
@@ -306,7 +427,7 @@ class portfolio:
 
             result.append(
                 {
-                    "Symbol": sym_data["Symbol"],
+                    "Symbol": pos.symbol,
                     "Buy Price": sym_data["Buy Price"],
                     "Actual Volume": actual_vol,
                     "Average Cost": avg_cost,
@@ -323,14 +444,13 @@ class portfolio:
         return result
 
     def get_stock_by_symbol(self, symbol):
-        return [stock for stock in self.stocksList if stock.get_symbol() == symbol]
+        self._sync_lots(symbol)
+        pos = self._positions.get(symbol)
+        return list(pos.lots) if pos is not None else []
 
     def get_total_stock_volume_by_symbol(self, symbol):
-        total_volume = 0
-        all_stocks_of_symbol = self.get_stock_by_symbol(symbol)
-        for stock in all_stocks_of_symbol:
-            total_volume += stock.get_actual_vol()
-        return total_volume
+        pos = self._positions.get(symbol)
+        return pos.volume if pos is not None else 0
 
     def get_portfolio_info(self):
         """
@@ -361,11 +481,19 @@ class portfolio:
                 - "Number of Sells": int, total number of sell trades executed.
                 - "Win Rate": float, win rate across all sell trades.
                 - "Return rate": float, overall portfolio ROI.
+
+            The summary is cached until a fill or a price update of a held symbol.
         """
+        version = self._version
+        cached = self._info_cache
+        if cached is None or cached[0] != version:
+            cached = self._info_cache = (version, self._build_portfolio_info())
+        return dict(cached[1])
 
+    def _build_portfolio_info(self):
         return {
             "Owner": self.owner,
-            "Number of Stocks": len(self.stocksList),
+            "Number of Stocks": self._count_lots(),
             "Total Cost": round(self.amountByCost, 2),
             "Unrealized P&L": round(self.unrealized, 2),
             "Unrealized %": round(self.unrealizedInPercentage, 2),
@@ -395,11 +523,10 @@ class portfolio:
         Returns a dict mapping symbol -> number of buy entries in stocksList.
         Each entry counts as one buy regardless of volume.
         """
-        buy_count = defaultdict(int)
-        for stock in self.stocksList:
-            symbol = stock.get_symbol()
-            buy_count[symbol] += 1
-        return dict(buy_count)
+        return {symbol: len(pos.lots) for symbol, pos in self._positions.items()}
+
+    def _count_lots(self):
+        return sum(len(pos.lots) for pos in self._positions.values())
 
     def _increase_numberOfWin(self):
         self.No_win += 1
@@ -432,24 +559,57 @@ class portfolio:
             "cashbalance_start": self.cashbalance_start,
             "cashbalance": self.cashbalance,
             "realized": self.realized,
-            "stocksList": [stock.to_dict() for stock in self.stocksList],
+            "stocksList": [stock.to_dict() for stock in self.get_stocks_list()],
             "No_win": self.No_win,
             "No_sell": self.No_sell,
             "prevousDay_maxDD": self.prevousDay_maxDD,
+            "max_nav": self.max_nav,
+            "min_nav": self.min_nav,
         }
         with open(filename, "w") as f:
             json.dump(data, f, indent=4, default=str)
 
-    def save_summary_csv(self,daily_ticks_timestamp):
-        # Define folder and filename
+    def save_equity_curve(self, samples=None):
+        """
+        Append the recorded equity curve to result/<owner>/<owner>_equity_curve.csv, or
+        ``samples`` of it (``equityCurve.to_array``) kept from earlier days.
+        """
         folder_path = os.path.join("result", self.owner)
         os.makedirs(folder_path, exist_ok=True)
-        summary_file = os.path.join(folder_path, f"{self.owner}_portfolio_summary.csv")
+        file_path = os.path.join(folder_path, f"{self.owner}_equity_curve.csv")
+        if samples is None:
+            self.equity_curve.save_csv(file_path)
+        else:
+            EquityCurve.equityCurve.write_csv(file_path, samples)
+
+    def roll_over_day(self):
+        """
+        End-of-day rollover of a portfolio that keeps trading the next day, in memory
+        instead of through ``save_to_file`` and ``load_from_file``.
 
+        The cash at the close becomes the next day's starting cash and the day's equity
+        curve is cleared, so save it first. The worst drawdown so far is already kept in
+        ``prevousDay_maxDD``; the NAV peak and trough carry over, so a drawdown that spans
+        days is measured from its peak.
+        """
+        if self._dirty:
+            self.update_portfolio_totals()
+        self.cashbalance_start = self.cashbalance
+        self.equity_curve.clear()
+        self._changed()
+
+    def save_summary_csv(self,daily_ticks_timestamp):
+        self.write_summary_rows([self.summary_row(daily_ticks_timestamp)])
+
+    def summary_row(self, daily_ticks_timestamp):
+        """
+        The row of the portfolio summary CSV for the day of ``daily_ticks_timestamp``,
+        see ``SUMMARY_COLUMNS``.
+        """
         # Calculate derived stats
-        num_stocks = len(self.stocksList)
-        total_cost = sum(stock.amount_cost for stock in self.stocksList)
-        unrealized = sum(stock.unrealized for stock in self.stocksList)
+        num_stocks = self._count_lots()
+        total_cost = self._cost
+        unrealized = self._market_value - self._cost
         unrealized_percent = (unrealized / total_cost * 100) if total_cost else 0
         nav = self.get_nav()
         max_nav = self.max_nav
@@ -484,28 +644,28 @@ class portfolio:
             datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             daily_ticks_timestamp.strftime("%Y-%m-%d %H:%M:%S")
         ]
+        return row
 
-        # Write header and row
-        header = [
-            "Owner", "Number of Stocks", "Total Cost", "Unrealized P&L", "Unrealized %",
-            "Realized P&L", "cashbalance start", "Cash Balance", "Net Asset Value", "Max NAV", "Min NAV",
-            "Max Drawdown (%)", "Relative Drawdown", "Calmar Ratio",
-            "Previous Day Max DD (%)", "Number of Wins", "Number of Sells",
-            "Win Rate", "Return rate", "Saved At", "Daily Ticks Time"
-        ]
+    def write_summary_rows(self, rows):
+        """
+        Append ``rows`` of ``summary_row`` to result/<owner>/<owner>_portfolio_summary.csv.
+        """
+        folder_path = os.path.join("result", self.owner)
+        os.makedirs(folder_path, exist_ok=True)
+        summary_file = os.path.join(folder_path, f"{self.owner}_portfolio_summary.csv")
 
         write_header = not os.path.exists(summary_file)
 
         with open(summary_file, mode='a', newline='') as f:
             writer = csv.writer(f)
             if write_header:
-                writer.writerow(header)
-            writer.writerow(row)
+                writer.writerow(self.SUMMARY_COLUMNS)
+            writer.writerows(rows)
 
         
 
     @classmethod
-    def load_from_file(cls, owner):
+    def load_from_file(cls, owner, lot_store="objects", equity_curve=None):
 
         file_path = os.path.join("result", owner, owner + "_" + "portfolio.json")
 
@@ -527,4 +687,76 @@ class portfolio:
             No_win=data.get("No_win", 0),
             No_sell=data.get("No_sell", 0),
             prevousDay_maxDD=data.get("prevousDay_maxDD", None),
+            max_nav=data.get("max_nav", None),
+            min_nav=data.get("min_nav", None),
+            lot_store=lot_store,
+            equity_curve=equity_curve,
         )
+
+
+class position:
+    """
+    The lots of one symbol, oldest first, and their totals: volume, cost (buy price times
+    volume), market value and the realized P&L of its sells. ``lots`` is a container of
+    ``LotStore``, ``objectLots`` by default.
+    """
+
+    def __init__(self, symbol, lots=None):
+        self.symbol = symbol
+        self.lots = LotStore.objectLots(symbol) if lots is None else lots
+        self.volume = 0
+        self.cost = 0.0
+        self.market_value = 0.0
+        # price of the last price update, None until the first one
+        self.mkt_price = None
+        self.realized = 0.0
+
+    def add_lot(self, stock):
+        # fills arrive in time order, except a resting order filled after a newer one
+        index = len(self.lots)
+        while index > 0 and self.lots[index - 1].buy_time > stock.buy_time:
+            index -= 1
+        self.lots.insert(index, stock)
+
+    def get_avg_cost(self):
+        return self.cost / self.volume if self.volume != 0 else 0.0
+
+    def get_info(self):
+        return {
+            "Symbol": self.symbol,
+            "Volume": self.volume,
+            "Total Cost": self.cost,
+            "Average Cost": self.get_avg_cost(),
+            "Market Price": self.mkt_price,
+            "Market Value": self.market_value,
+            "Realized P&L": self.realized,
+        }
+
+
+class portfolioSnapshot:
+    """
+    Cash balance and holdings of a portfolio at one point in time.
+
+    A batch of orders is validated against one snapshot instead of the live portfolio:
+    every accepted order reserves its cost (buys) or its volume (sells) with ``reserve``,
+    so the later orders of the batch only see what is left.
+    """
+
+    def __init__(self, cashbalance, holdings):
+        self.cashbalance = cashbalance
+        # symbol -> volume held
+        self.holdings = holdings
+
+    def get_cash_balance(self):
+        return self.cashbalance
+
+    def has_stock(self, symbol, volume):
+        return self.holdings.get(symbol, 0) >= volume
+
+    def reserve(self, order):
+        if order.get_side() == "Buy":
+            self.cashbalance -= CommissionService.commissionService.cal_All_Volume_commissionAndVat(
+                order.get_volume(), order.get_price()
+            )
+        else:
+            self.holdings[order.get_symbol()] = self.holdings.get(order.get_symbol(), 0) - order.get_volume()
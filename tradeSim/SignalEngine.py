@@ -0,0 +1,281 @@
+from collections import Counter
+import numpy as np
+import pandas as pd
+from . import AuctionBook
+from . import CommissionService
+from . import Engine
+from . import Order
+from . import OrderRejection
+from . import Portfolio
+from . import TickRow
+
+
+class signalEngine:
+    """
+    Signal-mode backtester for research sweeps: the strategy's ``signals`` turn a whole
+    day of a symbol's ticks into one signed volume per tick, and the day is simulated in
+    numpy instead of tick by tick.
+
+    A signal is an IOC limit order at the tick's LastPrice: positive volumes buy, negative
+    volumes sell. It is validated like the event engine validates orders placed from
+    ``on_data`` on that tick (``order.validate_order`` against the cash and holdings left
+    and the cumulative tick volumes up to the tick), fills on that tick only, not on
+    auction or odd-lot ticks, and pays commission, VAT and slippage from
+    ``CommissionService``. Only the validation walks the signals one by one, as cash is
+    shared by all symbols; the costs, the NAV of every tick, the drawdown and the FIFO
+    realized P&L are array operations.
+
+    The result reconciles with ``engine.stream`` for a strategy whose ``on_data`` places
+    the same orders with ``time_in_force="IOC"``, starting from an empty portfolio.
+    """
+
+    def __init__(self, strategy_class, cashbalance=10000000.0, participation_rate=None):
+        """
+        Parameter
+        ----------
+        strategy_class: Strategy_template subclass with a ``signals(ticks)`` method, one
+                        instance is created per symbol with handler None.
+        cashbalance: starting cash.
+        participation_rate: share (0, 1] of a tick's volume that a signal may fill, in
+                            board lots, None fills it completely.
+        """
+        if getattr(strategy_class, "signals", None) is None:
+            raise ValueError(f"{strategy_class.__name__} has no signals() method for signal mode.")
+        self.strategy_class = strategy_class
+        self.cashbalance = cashbalance
+        self.participation_rate = participation_rate
+
+    @staticmethod
+    def _fill_values(volume, price, is_buy):
+        """
+        ``commissionService.cal_commissionAndVat`` for arrays: net value per share of each fill.
+        """
+        service = CommissionService.commissionService
+        slippage = np.asarray(service.slippages)[np.searchsorted(service.price_range, price, side="right")]
+        match_price = np.where(is_buy, price + slippage, price - slippage)
+        amount = match_price * volume
+        comm_amount = amount * service.comm
+        vat = comm_amount * service.vat
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(is_buy, amount + comm_amount + vat, amount - comm_amount - vat) / volume
+
+    def _symbol_signals(self, symbol, arrays, size):
+        strategy = self.strategy_class(None)
+        signal = np.asarray(strategy.signals(TickRow.tickBlock(arrays, 0, size)))
+        if signal.shape != (size,):
+            raise ValueError(f"signals() for {symbol} returned shape {signal.shape}, expected ({size},).")
+        return signal.astype("int64")
+
+    def run(self, ticks, symbols=None):
+        """
+        Simulate one trading day.
+
+        Parameter
+        ----------
+        ticks: DataFrame with ShareCode, TradeDateTime, LastPrice, Volume and Flag columns,
+               or the path of a tick CSV or tick store.
+        symbols: optional iterable of ShareCodes to simulate, all symbols by default.
+
+        Returns
+        -------
+        dict
+            "summary": the figures of ``portfolio.get_portfolio_info`` (unrounded),
+            "fills": DataFrame of the fills in time order,
+            "nav": NAV after every tick in replay order, starting with the starting cash,
+            "rejections": {reason code name: number of rejected signals}.
+        """
+        Order.order.load_set50_symbols()
+        streams = Engine.engine._symbol_streams(ticks, symbols, arrays=True, rows=False)
+
+        tick_time, tick_rank, tick_pos, tick_price, events = [], [], [], [], []
+        for rank, (symbol, times, _, arrays) in enumerate(streams):
+            size = len(times)
+            price = arrays["LastPrice"].astype("float64")
+            volume = arrays["Volume"]
+            flag = arrays["Flag"]
+            signal = self._symbol_signals(symbol, arrays, size)
+
+            index = np.flatnonzero(signal)
+            is_buy = signal[index] > 0
+            wanted = np.abs(signal[index])
+            if self.participation_rate is None:
+                filled = wanted
+            else:
+                available = (volume[index] * self.participation_rate).astype("int64") // 100 * 100
+                filled = np.minimum(wanted, available)
+            tradable = ~np.isin(flag[index], AuctionBook.auctionBook.AUCTION_FLAGS + ("Odd",))
+            filled = np.where(tradable, filled, 0)
+
+            events.append(
+                pd.DataFrame(
+                    {
+                        "time": np.asarray(times, dtype="int64")[index],
+                        "rank": rank,
+                        "pos": index,
+                        "symbol": symbol,
+                        "is_buy": is_buy,
+                        "volume": wanted,
+                        "filled": filled,
+                        "price": price[index],
+                        "value": self._fill_values(filled, price[index], is_buy),
+                        "cum_buy": np.cumsum(np.where(flag == "Buy", volume, 0))[index],
+                        "cum_sell": np.cumsum(np.where(flag == "Sell", volume, 0))[index],
+                    }
+                )
+            )
+            tick_time.append(np.asarray(times, dtype="int64"))
+            tick_rank.append(np.full(size, rank))
+            tick_pos.append(np.arange(size))
+            tick_price.append(price)
+
+        events = pd.concat(events, ignore_index=True) if events else pd.DataFrame(
+            columns=["time", "rank", "pos", "symbol", "is_buy", "volume", "filled", "price", "value", "cum_buy", "cum_sell"]
+        )
+        events = events.sort_values(["time", "rank", "pos"], kind="stable", ignore_index=True)
+        executed, rejections = self._validate(events)
+        events["executed"] = executed
+
+        return self._account(streams, events, tick_time, tick_rank, tick_pos, tick_price, rejections)
+
+    def _validate(self, events):
+        """
+        Validate the signals in replay order against the cash and holdings left.
+        Returns the signed executed volume of every signal and the rejection counts.
+        """
+        snapshot = Portfolio.portfolioSnapshot(self.cashbalance, {})
+        executed = np.zeros(len(events), dtype="int64")
+        rejections = Counter()
+        ok = OrderRejection.rejectReason.OK
+        columns = zip(
+            events["symbol"], events["is_buy"], events["volume"].tolist(), events["filled"].tolist(),
+            events["price"].tolist(), events["value"].tolist(), events["cum_buy"].tolist(), events["cum_sell"].tolist(),
+        )
+        for i, (symbol, is_buy, volume, filled, price, value, cum_buy, cum_sell) in enumerate(columns):
+            side = "Buy" if is_buy else "Sell"
+            code = Order.order.validate_order(volume, side, symbol, snapshot, price, cum_sell, cum_buy)
+            if code is not ok:
+                rejections[code.name] += 1
+                continue
+            if filled == 0:
+                continue
+            if is_buy:
+                snapshot.cashbalance -= value * filled
+                snapshot.holdings[symbol] = snapshot.holdings.get(symbol, 0) + filled
+                executed[i] = filled
+            else:
+                snapshot.cashbalance += value * filled
+                snapshot.holdings[symbol] -= filled
+                executed[i] = -filled
+        return executed, dict(rejections)
+
+    def _account(self, streams, events, tick_time, tick_rank, tick_pos, tick_price, rejections):
+        fills = events[events["executed"] != 0]
+        flows = np.where(fills["is_buy"], -1.0, 1.0) * fills["value"].to_numpy() * fills["filled"].to_numpy()
+
+        # market value: every tick of a symbol revalues its holding after the tick's fills
+        mv_delta = []
+        realized = wins = sells = lots = 0
+        cost = 0.0
+        for rank, (symbol, times, _, _) in enumerate(streams):
+            own = fills[fills["rank"] == rank]
+            change = np.zeros(len(times), dtype="int64")
+            np.add.at(change, own["pos"].to_numpy(), own["executed"].to_numpy())
+            contribution = np.cumsum(change) * tick_price[rank]
+            mv_delta.append(np.diff(contribution, prepend=0.0))
+
+            symbol_realized, symbol_wins, symbol_sells, symbol_lots, symbol_cost = self._fifo(own)
+            realized += symbol_realized
+            wins += symbol_wins
+            sells += symbol_sells
+            lots += symbol_lots
+            cost += symbol_cost
+
+        # NAV after every tick in replay order: ticks by time, then symbol, then file order
+        if tick_time:
+            order = np.lexsort((np.concatenate(tick_pos), np.concatenate(tick_rank), np.concatenate(tick_time)))
+            offsets = np.cumsum([0] + [len(t) for t in tick_time[:-1]])
+            cash_flow = np.zeros(offsets[-1] + len(tick_time[-1]))
+            np.add.at(cash_flow, offsets[fills["rank"].to_numpy()] + fills["pos"].to_numpy(), flows)
+            cash = self.cashbalance + np.cumsum(cash_flow[order])
+            market_value = np.cumsum(np.concatenate(mv_delta)[order])
+            nav = np.concatenate(([self.cashbalance], cash + market_value))
+        else:
+            cash = np.array([self.cashbalance])
+            market_value = np.array([0.0])
+            nav = cash.copy()
+
+        peak = int(np.argmax(nav))
+        max_nav = float(nav[peak])
+        running_max = np.maximum.accumulate(nav)
+        max_drawdown = min(0.0, float(((nav - running_max) / running_max * 100).min()))
+
+        summary = {
+            "Number of Stocks": lots,
+            "Total Cost": cost,
+            "Unrealized P&L": float(market_value[-1]) - cost,
+            "Realized P&L": realized,
+            "Cash Balance": float(cash[-1]),
+            "Net Asset Value": float(nav[-1]),
+            "Max NAV": max_nav,
+            "Min NAV": float(nav[peak:].min()),
+            "Max Drawdown (%)": max_drawdown,
+            "Number of Wins": wins,
+            "Number of Sells": sells,
+            "Win Rate": wins / sells * 100 if sells and wins else 0,
+            "Return rate": (float(nav[-1]) - self.cashbalance) / self.cashbalance * 100,
+        }
+        fill_table = pd.DataFrame(
+            {
+                "TradeDateTime": pd.to_datetime(fills["time"].to_numpy()),
+                "Symbol": fills["symbol"].to_numpy(),
+                "Side": np.where(fills["is_buy"], "Buy", "Sell"),
+                "Volume": fills["filled"].to_numpy(),
+                "Price": fills["price"].to_numpy(),
+                "Value per Share": fills["value"].to_numpy(),
+            }
+        )
+        return {"summary": summary, "fills": fill_table, "nav": nav, "rejections": rejections}
+
+    @staticmethod
+    def _fifo(fills):
+        """
+        Realized P&L, wins, sell count (one per lot sold from, as ``portfolio`` counts
+        them), lots and cost left of one symbol's fills, oldest lots sold first.
+
+        The cost of the first q shares bought is a piecewise linear function of q, so the
+        cost of the lots a sell takes is its difference between the shares sold before and
+        after the sell.
+        """
+        executed = fills["executed"].to_numpy()
+        value = fills["value"].to_numpy()
+        bought = np.where(executed > 0, executed, 0)
+        sold = np.where(executed < 0, -executed, 0)
+        lot_cost = value * bought
+
+        is_lot = bought > 0
+        lot_end = np.cumsum(bought)[is_lot]
+        cost_curve = (np.r_[0, lot_end], np.r_[0.0, np.cumsum(lot_cost[is_lot])])
+
+        bought_before = np.cumsum(bought)
+        sold_after = np.cumsum(sold)
+        sold_before = sold_after - sold
+        is_sell = sold > 0
+        if not is_sell.any():
+            return 0.0, 0, 0, int(is_lot.sum()), float(cost_curve[1][-1])
+
+        cost_before = np.interp(sold_before, *cost_curve)
+        cost_after = np.interp(sold_after, *cost_curve)
+        held_cost = np.interp(bought_before, *cost_curve) - cost_before
+        avg_cost = held_cost / np.maximum(bought_before - sold_before, 1)
+        proceeds = value * sold
+
+        realized = float((proceeds - (cost_after - cost_before))[is_sell].sum())
+        wins = int((proceeds > avg_cost * sold)[is_sell].sum())
+        lots_touched = (
+            np.searchsorted(lot_end, sold_after, side="left") - np.searchsorted(lot_end, sold_before, side="right") + 1
+        )
+        sells = int(lots_touched[is_sell].sum())
+        sold_total = sold_after[-1]
+        lots_left = len(lot_end) - int(np.searchsorted(lot_end, sold_total, side="right"))
+        cost_left = float(cost_curve[1][-1] - np.interp(sold_total, *cost_curve))
+        return realized, wins, sells, lots_left, cost_left
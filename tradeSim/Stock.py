@@ -1,6 +1,11 @@
 import time
 import datetime
-import inspect
+
+
+# capability of the fill path: ``execution`` hands it to the portfolio, the portfolio to the
+# lots, and the methods that change holdings refuse to run without it. Strategies only get
+# the lots, not the token, so they cannot change their holdings outside of an order.
+_FILL_TOKEN = object()
 
 
 class stock:
@@ -39,10 +44,9 @@ class stock:
         self.__calUnrealized()
         self.__calUnrealizedInPercentage()
 
-    def decreaseStockVolume(self, volume):
-        caller = inspect.stack()[1].function
-        if caller != "decrease_stock_volume":
-            raise ValueError(f"decrease stock volume must be called from decrease_stock_volume(). unable to decrease stock volume from {caller}()")
+    def decreaseStockVolume(self, volume, token=None):
+        if token is not _FILL_TOKEN:
+            raise ValueError("decrease stock volume must be called from decrease_stock_volume(). unable to decrease stock volume outside of a fill")
         if volume < 0:
             raise ValueError("Volume must be positive.")
         self.actual_vol -= volume
@@ -76,10 +80,9 @@ class stock:
             (self.unrealized / self.amount_cost) * 100 if self.amount_cost != 0 else 0.0
         )
 
-    def add_realized(self, realized):
-        caller = inspect.stack()[1].function
-        if caller != "decrease_stock_volume":
-            raise ValueError(f"add_realized must be called from decrease_stock_volume(). unable to add stock from {caller}()")
+    def add_realized(self, realized, token=None):
+        if token is not _FILL_TOKEN:
+            raise ValueError("add_realized must be called from decrease_stock_volume(). unable to add realized outside of a fill")
         self.realized += realized
 
     # Getter methods
@@ -141,7 +144,7 @@ class stock:
             amount_cost=float(data["amount_cost"]),
             market_value=float(data["market_value"]),
             unrealized=float(data["unrealized"]),
-            mkt_price=float(data["market_value"])/float(data["start_vol"]),
+            mkt_price=float(data["market_value"])/float(data.get("actual_vol") or data["start_vol"]),
             realized=float(data["realized"]),
         )
 
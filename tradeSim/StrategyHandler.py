@@ -1,5 +1,5 @@
-import copy
 from types import MappingProxyType
+from . import TickRow
 
 class StrategyHandler:
     def __init__(self, strategy_class, strategy_runner):
@@ -11,9 +11,13 @@ class StrategyHandler:
         self.cum_sell_volume = 0
 
     def process_row(self, row):
-        
-        #made deep copy and readonly
-        self._current_row = MappingProxyType(copy.deepcopy(dict(row)))
+
+        # the strategy gets a read-only row: the engine's tick views already are, other
+        # rows (dicts, pandas Series) are copied once into a read-only mapping
+        if isinstance(row, TickRow.tickRow):
+            self._current_row = row
+        else:
+            self._current_row = MappingProxyType(dict(row))
 
         flag = row["Flag"]
         volume = row["Volume"]
@@ -25,16 +29,81 @@ class StrategyHandler:
 
         self.strategy.on_data(self._current_row)
 
-    def create_order_to_limit(self, volume, price, side, symbol):
+    def start_day(self):
+        """
+        Reset the cumulative tick volumes, they count the volumes of one trading day.
+        """
+        self.cum_buy_volume = 0
+        self.cum_sell_volume = 0
+
+    def process_batch(self, row, columns, start, stop):
+        """
+        Hand the ticks ``start`` to ``stop`` (exclusive) of ``columns`` to the strategy's
+        ``on_batch`` as one block. ``row`` is the block's last tick: orders placed from
+        ``on_batch`` are placed at it, with the cumulative volumes up to it, as if they
+        were placed from ``on_data`` on that tick.
+        """
+        flags = columns["Flag"][start:stop]
+        volumes = columns["Volume"][start:stop]
+        self.cum_buy_volume += volumes[flags == "Buy"].sum().item()
+        self.cum_sell_volume += volumes[flags == "Sell"].sum().item()
+        self._current_row = row
+
+        self.strategy.on_batch(TickRow.tickBlock(columns, start, stop))
+
+    def create_order_to_limit(self, volume, price, side, symbol, time_in_force="GTC", expire_time=None, board="main"):
         if self._current_row is None:
             raise RuntimeError("There is error in daily tick row data. Please check the data source.")
-        return self._runner.create_order_to_limit(volume, price, side, symbol, self.cum_sell_volume, self.cum_buy_volume, self._current_row)
+        return self._runner.create_order_to_limit(volume, price, side, symbol, self.cum_sell_volume, self.cum_buy_volume, self._current_row,
+                                                  time_in_force, expire_time, board)
+
+    def create_auction_order(self, volume, side, symbol, price=None):
+        if self._current_row is None:
+            raise RuntimeError("There is error in daily tick row data. Please check the data source.")
+        return self._runner.create_auction_order(volume, side, symbol, self.cum_sell_volume, self.cum_buy_volume, self._current_row, price)
     
     def create_order_at_market(self, volume, side, symbol):
         if self._current_row is None:
             raise RuntimeError("There is error in daily tick row data. Please check the data source.")
         return self._runner.create_order_at_market(volume, side, symbol, self.cum_sell_volume, self.cum_buy_volume, self._current_row)
 
+    def submit_orders(self, orders):
+        if self._current_row is None:
+            raise RuntimeError("There is error in daily tick row data. Please check the data source.")
+        return self._runner.submit_orders(orders, self.cum_sell_volume, self.cum_buy_volume, self._current_row)
+
+    def create_stop_order(self, volume, side, symbol, stop_price, limit_price=None, time_in_force="GTC", expire_time=None):
+        if self._current_row is None:
+            raise RuntimeError("There is error in daily tick row data. Please check the data source.")
+        return self._runner.create_stop_order(volume, side, symbol, stop_price, self.cum_sell_volume, self.cum_buy_volume, self._current_row,
+                                              limit_price, time_in_force, expire_time)
+
+    def create_trailing_stop_order(self, volume, side, symbol, trail_amount=None, trail_percent=None, time_in_force="GTC", expire_time=None):
+        if self._current_row is None:
+            raise RuntimeError("There is error in daily tick row data. Please check the data source.")
+        return self._runner.create_trailing_stop_order(volume, side, symbol, self.cum_sell_volume, self.cum_buy_volume, self._current_row,
+                                                       trail_amount, trail_percent, time_in_force, expire_time)
+
+    def create_bracket_order(self, volume, price, side, symbol, take_profit_price, stop_loss_price, time_in_force="GTC", expire_time=None):
+        if self._current_row is None:
+            raise RuntimeError("There is error in daily tick row data. Please check the data source.")
+        return self._runner.create_bracket_order(volume, price, side, symbol, take_profit_price, stop_loss_price,
+                                                 self.cum_sell_volume, self.cum_buy_volume, self._current_row, time_in_force, expire_time)
+
+    def create_oco_group(self, order_numbers):
+        return self._runner.create_oco_group(order_numbers)
+
+    def cancel_order(self, order_number):
+        return self._runner.cancel_order(order_number)
+
+    def amend_order(self, order_number, price=None, volume=None):
+        if self._current_row is None:
+            raise RuntimeError("There is error in daily tick row data. Please check the data source.")
+        return self._runner.amend_order(order_number, price, volume, self.cum_sell_volume, self.cum_buy_volume, self._current_row)
+
+    def get_open_orders(self, symbol=None):
+        return self._runner.get_open_orders(symbol)
+
     def check_port_has_stock(self, symbol, volume):
         return self._runner.check_port_has_stock(symbol, volume)
 
@@ -50,6 +119,9 @@ class StrategyHandler:
     def get_stock_by_symbol(self,symbol):
         return self._runner.get_stock_by_symbol(symbol)
     
+    def get_position(self, symbol):
+        return self._runner.get_position(symbol)
+
     def get_total_stock_volume_by_symbol(self, symbol):
         return self._runner.get_total_stock_volume_by_symbol(symbol)
     
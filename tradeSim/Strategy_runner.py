@@ -8,11 +8,66 @@ class strategy_runner:
         """
         self.tradeSim = tradeSim
 
-    def create_order_to_limit(self, volume, price, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data):
-        return self.tradeSim.create_order_to_limit(volume, price, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data)
+    def create_order_to_limit(self, volume, price, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data,
+                              time_in_force="GTC", expire_time=None, board="main"):
+        return self.tradeSim.create_order_to_limit(volume, price, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data,
+                                                   time_in_force, expire_time, board)
+
+    def create_auction_order(self, volume, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data, price=None):
+        """
+        Create an order for the next call auction, at any price (ATO/ATC) or at ``price`` or better.
+        """
+        return self.tradeSim.create_auction_order(volume, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data, price)
     
     def create_order_at_market(self, volume, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data):
         return self.tradeSim.create_order_at_market(volume, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data)
+
+    def submit_orders(self, orders, cum_sell_volume, cum_buy_volume, mkt_data):
+        """
+        Submit a batch of limit and market orders, validated together against one snapshot of
+        the cash balance and holdings. Returns a status and reason per order.
+        """
+        return self.tradeSim.submit_orders(orders, cum_sell_volume, cum_buy_volume, mkt_data)
+
+    def create_stop_order(self, volume, side, symbol, stop_price, cum_sell_volume, cum_buy_volume, mkt_data,
+                          limit_price=None, time_in_force="GTC", expire_time=None):
+        return self.tradeSim.create_stop_order(volume, side, symbol, stop_price, cum_sell_volume, cum_buy_volume, mkt_data,
+                                               limit_price, time_in_force, expire_time)
+
+    def create_trailing_stop_order(self, volume, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data,
+                                   trail_amount=None, trail_percent=None, time_in_force="GTC", expire_time=None):
+        return self.tradeSim.create_trailing_stop_order(volume, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data,
+                                                        trail_amount, trail_percent, time_in_force, expire_time)
+
+    def create_bracket_order(self, volume, price, side, symbol, take_profit_price, stop_loss_price,
+                             cum_sell_volume, cum_buy_volume, mkt_data, time_in_force="GTC", expire_time=None):
+        return self.tradeSim.create_bracket_order(volume, price, side, symbol, take_profit_price, stop_loss_price,
+                                                  cum_sell_volume, cum_buy_volume, mkt_data, time_in_force, expire_time)
+
+    def create_oco_group(self, order_numbers):
+        """
+        Link open orders so that a fill of one of them cancels the others.
+        """
+        return self.tradeSim.create_oco_group(order_numbers)
+
+    def cancel_order(self, order_number):
+        """
+        Cancel a resting limit order or a pending stop order by its order number.
+        """
+        return self.tradeSim.cancel_order(order_number)
+
+    def amend_order(self, order_number, price, volume, cum_sell_volume, cum_buy_volume, mkt_data):
+        """
+        Change the price and/or volume of a resting limit order.
+        """
+        return self.tradeSim.amend_order(order_number, price, volume, cum_sell_volume, cum_buy_volume, mkt_data)
+
+    def get_open_orders(self, symbol=None):
+        """
+        Returns a list of order info dicts ("Order Number", "Volume", "Price", ..., "Filled Volume", "Time In Force",
+        "Order Type", "Stop Price", "Triggered", "Board") of the resting, pending stop and auction orders.
+        """
+        return self.tradeSim.get_open_orders(symbol)
     
     def check_port_has_stock(self, symbol, volume):
         """
@@ -90,6 +145,13 @@ class strategy_runner:
         """
         return self.tradeSim.portfolio.get_stock_by_symbol(symbol)
     
+    def get_position(self, symbol):
+        """
+        Get the position in a symbol (volume, total cost, average cost, market price, market value
+        and realized P&L of all its lots), or None if it is not held.
+        """
+        return self.tradeSim.portfolio.get_position(symbol)
+
     def get_total_stock_volume_by_symbol(self, symbol):
         """
         Get the total volume of a specific stock symbol in the portfolio.
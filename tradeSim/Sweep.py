@@ -0,0 +1,163 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from . import TickStore
+from . import TradeSim
+
+# the day of ticks of a worker process, attached once when the worker starts
+_shared = None
+_ticks = None
+
+
+def _calmar(table):
+    """
+    Return rate over the absolute max drawdown of every run; a run without drawdown
+    scores +inf. The portfolio's own Calmar ratio is 0 when there is no drawdown.
+    """
+    drawdown = table["Max Drawdown (%)"].astype("float64").abs()
+    score = table["Return rate"].astype("float64") / drawdown.where(drawdown != 0)
+    return score.mask(drawdown == 0, np.inf)
+
+
+def _attach(spec):
+    global _shared, _ticks
+    _shared = TickStore.sharedTicks.attach(spec)
+    _ticks = _shared.to_frame()
+
+
+def _run_configuration(strategy_class, params, folder, run_name, participation_rate, lot_store, seed):
+    """
+    Run one configuration on the worker's ticks with a new portfolio, from ``folder`` so
+    that its results are written to ``folder/result/<run_name>``.
+    """
+    configured = type(strategy_class.__name__, (strategy_class,), dict(params))
+    cwd = os.getcwd()
+    os.chdir(folder)
+    try:
+        if seed is not None:
+            np.random.seed(seed)
+        sim = TradeSim.tradeSim(run_name, load_existing=False, participation_rate=participation_rate, lot_store=lot_store)
+        sim.get_engine(configured).stream(_ticks)
+
+        sim.flushTransactionLog()
+        sim.flushErrorLogger()
+        sim.save_portfolio()
+        if len(_ticks):
+            sim.save_summary_csv(_ticks["TradeDateTime"].dt.date.iloc[0])
+        sim.save_equity_curve()
+        return sim.portfolio.get_portfolio_info()
+    except Exception as e:
+        return {"Error": f"{type(e).__name__}: {e}"}
+    finally:
+        os.chdir(cwd)
+
+
+class parameterSweep:
+    """
+    Runs a strategy once per combination of a parameter grid, in parallel worker processes.
+
+    A configuration is a subclass of the strategy with the grid's values as class
+    attributes, so the parameters are the class attributes the strategy reads (e.g.
+    ``rsi_period`` of ``my_strategy``). The day of ticks is put into shared memory once
+    and every worker attaches to it when it starts. Each run trades a new portfolio and
+    writes its results to ``<folder>/result/run_<n>``.
+
+    The results table has one row per run, ranked by return, drawdown and Calmar ratio.
+    """
+
+    METRICS = ["Return rate", "Max Drawdown (%)", "Calmar Ratio", "Net Asset Value", "Number of Sells", "Win Rate"]
+    # rank column -> (metric column or function of the table, ascending); the drawdown is negative
+    RANKS = {
+        "ROI Rank": ("Return rate", False),
+        "Drawdown Rank": ("Max Drawdown (%)", False),
+        "Calmar Rank": (_calmar, False),
+    }
+
+    def __init__(self, strategy_class, grid, folder=os.path.join("result", "sweep"), max_workers=None,
+                 participation_rate=None, lot_store="objects", seed=0):
+        """
+        Parameter
+        ----------
+        strategy_class: Strategy_template subclass, defined at module level so that worker
+                        processes can import it.
+        grid: dict parameter name -> list of values, every combination is run.
+        folder: directory of the runs' results and of sweep_results.csv.
+        max_workers: number of worker processes, the number of CPUs by default.
+        participation_rate, lot_store: passed to every run's ``TradeSim.tradeSim``.
+        seed: numpy random seed set before every run, so runs that draw random numbers
+              (like the allocation of ``my_strategy``) only differ by their parameters;
+              None leaves the seed alone.
+        """
+        unknown = [name for name in grid if not hasattr(strategy_class, name)]
+        if unknown:
+            raise ValueError(f"{strategy_class.__name__} has no parameters {unknown}.")
+        self.strategy_class = strategy_class
+        self.grid = {name: list(values) for name, values in grid.items()}
+        self.folder = folder
+        self.max_workers = max_workers
+        self.participation_rate = participation_rate
+        self.lot_store = lot_store
+        self.seed = seed
+
+    def configurations(self):
+        """
+        Returns
+        -------
+        list
+            One dict parameter name -> value per combination of the grid.
+        """
+        names = list(self.grid)
+        return [dict(zip(names, values)) for values in itertools.product(*self.grid.values())]
+
+    def run(self, ticks, symbols=None):
+        """
+        Run every configuration on one trading day.
+
+        Parameter
+        ----------
+        ticks: tick DataFrame, or the path of a tick CSV or tick store.
+        symbols: optional iterable of ShareCodes to simulate, all symbols by default.
+
+        Returns
+        -------
+        DataFrame
+            One row per run, best first: "Run", the parameters, ``METRICS``, the ``RANKS``
+            columns, "Error" (None for runs that completed) and "Result Folder".
+            It is also saved to <folder>/sweep_results.csv.
+        """
+        folder = os.path.abspath(self.folder)
+        os.makedirs(folder, exist_ok=True)
+        configurations = self.configurations()
+        run_names = [f"run_{n:03d}" for n in range(len(configurations))]
+
+        shared = TickStore.sharedTicks.create(ticks, symbols)
+        try:
+            with ProcessPoolExecutor(self.max_workers, initializer=_attach, initargs=(shared.spec,)) as pool:
+                futures = [
+                    pool.submit(
+                        _run_configuration, self.strategy_class, params, folder, run_name,
+                        self.participation_rate, self.lot_store, self.seed,
+                    )
+                    for params, run_name in zip(configurations, run_names)
+                ]
+                results = [future.result() for future in futures]
+        finally:
+            shared.unlink()
+
+        rows = []
+        for params, run_name, info in zip(configurations, run_names, results):
+            row = {"Run": run_name, **params}
+            row.update({metric: info.get(metric) for metric in self.METRICS})
+            row["Error"] = info.get("Error")
+            row["Result Folder"] = os.path.join(folder, "result", run_name)
+            rows.append(row)
+
+        table = pd.DataFrame(rows, columns=["Run", *self.grid, *self.METRICS, "Error", "Result Folder"])
+        for rank, (metric, ascending) in self.RANKS.items():
+            values = metric(table) if callable(metric) else table[metric].astype("float64")
+            table[rank] = values.rank(ascending=ascending, method="min", na_option="bottom")
+        table = table.sort_values(list(self.RANKS), kind="stable", ignore_index=True)
+        table.to_csv(os.path.join(folder, "sweep_results.csv"), index=False)
+        return table
@@ -0,0 +1,159 @@
+import glob
+import hashlib
+import json
+import os
+import sys
+from datetime import date
+import pandas as pd
+from . import TickStore
+
+
+class tickCatalog:
+    """
+    Incremental catalog of daily tick stores.
+
+    Each trading day is converted once into a tick store under ``root`` and recorded in
+    ``manifest.json`` with the content hash of its source CSV. ``ingest`` only converts
+    new or changed days, and ``query`` streams days one at a time, reading only the
+    requested symbols, instead of merging every day into one DataFrame.
+    """
+
+    VERSION = 1
+    MANIFEST_FILE = "manifest.json"
+
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self.manifest_path = os.path.join(root, self.MANIFEST_FILE)
+        self.manifest = self._read_manifest()
+
+    def _read_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return {"version": self.VERSION, "days": {}}
+        with open(self.manifest_path, "r") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != self.VERSION:
+            raise ValueError(f"[ERROR] Unsupported tick catalog version {manifest.get('version')} at '{self.manifest_path}'")
+        return manifest
+
+    def _write_manifest(self):
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.manifest, f, indent=4, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    @staticmethod
+    def file_hash(path, chunk_size=1 << 20):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _day_of(csv_path, df):
+        """
+        The trading day of a tick file: its file name if it is an ISO date, otherwise
+        the date of its ticks. A file must hold exactly one trading day.
+        """
+        stem = os.path.splitext(os.path.basename(csv_path))[0]
+        try:
+            return date.fromisoformat(stem).isoformat()
+        except ValueError:
+            pass
+
+        days = pd.to_datetime(df["TradeDateTime"]).dt.date.unique()
+        if len(days) != 1:
+            raise ValueError(f"[ERROR] '{csv_path}' holds {len(days)} trading days, expected one file per day.")
+        return days[0].isoformat()
+
+    def ingest(self, sources):
+        """
+        Convert new or changed daily tick CSVs into the catalog.
+
+        Parameter
+        ----------
+        sources: glob pattern or iterable of CSV paths.
+
+        Returns
+        -------
+        list of str
+            Trading days that were (re)converted.
+        """
+        paths = sorted(glob.glob(sources)) if isinstance(sources, str) else list(sources)
+        known = {os.path.abspath(e["path"]): day for day, e in self.manifest["days"].items()}
+
+        ingested = []
+        for csv_path in paths:
+            stat = os.stat(csv_path)
+            day = known.get(os.path.abspath(csv_path))
+            entry = self.manifest["days"].get(day)
+            if entry is not None and os.path.isdir(os.path.join(self.root, entry["store"])):
+                if entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                    continue
+                digest = self.file_hash(csv_path)
+                if digest == entry["sha256"]:
+                    # touched but not modified
+                    entry["size"], entry["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+                    continue
+            else:
+                digest = self.file_hash(csv_path)
+
+            df = pd.read_csv(csv_path)
+            day = self._day_of(csv_path, df)
+            store_name = day + TickStore.tickStore.EXTENSION
+            store_path = TickStore.tickStore.write_frame(df, os.path.join(self.root, store_name), source=os.path.basename(csv_path))
+            meta = TickStore.tickStore.read_meta(store_path)
+
+            self.manifest["days"][day] = {
+                "path": os.path.abspath(csv_path),
+                "store": store_name,
+                "sha256": digest,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "rows": meta["rows"],
+                "symbols": sorted(meta["index"]),
+                "first_time": min((e["first_time"] for e in meta["index"].values()), default=None),
+                "last_time": max((e["last_time"] for e in meta["index"].values()), default=None),
+            }
+            ingested.append(day)
+
+        self._write_manifest()
+        return ingested
+
+    def days(self, start=None, end=None, symbols=None):
+        """
+        Trading days in ``[start, end]`` (ISO dates or date-likes, inclusive) that traded
+        at least one of ``symbols``, in date order.
+        """
+        start = pd.Timestamp(start).date().isoformat() if start is not None else None
+        end = pd.Timestamp(end).date().isoformat() if end is not None else None
+        wanted = set(symbols) if symbols is not None else None
+
+        result = []
+        for day in sorted(self.manifest["days"]):
+            if (start is not None and day < start) or (end is not None and day > end):
+                continue
+            if wanted is not None and wanted.isdisjoint(self.manifest["days"][day]["symbols"]):
+                continue
+            result.append(day)
+        return result
+
+    def store_path(self, day):
+        return os.path.join(self.root, self.manifest["days"][day]["store"])
+
+    def query(self, start=None, end=None, symbols=None):
+        """
+        Yield ``(day, DataFrame)`` for every matching trading day, one day at a time.
+        Only the row ranges of ``symbols`` are read from each day's tick store.
+        """
+        for day in self.days(start, end, symbols):
+            yield day, TickStore.tickStore.load(self.store_path(day), symbols=symbols)
+
+
+if __name__ == "__main__":
+    # python -m tradeSim.TickCatalog <catalog root> "marketInfo/ticks/*.csv"
+    catalog = tickCatalog(sys.argv[1])
+    for day in catalog.ingest(sys.argv[2]):
+        print(f"[INFO] Ingested {day}")
+    print(f"[INFO] Catalog holds {len(catalog.days())} trading days")
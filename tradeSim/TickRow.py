@@ -0,0 +1,85 @@
+from collections.abc import Mapping
+
+
+class tickRow(Mapping):
+    """
+    Read-only view of one tick in the columns of a symbol's ticks.
+
+    The engine keeps one view per symbol and moves it from tick to tick with ``seek``,
+    so handing a tick to the strategy, the order book and the portfolio copies nothing.
+    Strategies read it like the old rows (``row['LastPrice']``, ``row.get('Flag')``);
+    it cannot be changed, and it shows the next tick once the engine moves on, so a
+    strategy that keeps ticks should keep ``row.to_dict()``.
+    """
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns, index=0):
+        """
+        Parameter
+        ----------
+        columns: dict column name -> list of values, all of the same length.
+        index: position of the tick in the columns.
+        """
+        self._columns = columns
+        self._index = index
+
+    def seek(self, index):
+        self._index = index
+
+    def __getitem__(self, key):
+        return self._columns[key][self._index]
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def to_dict(self):
+        index = self._index
+        return {name: values[index] for name, values in self._columns.items()}
+
+    def __repr__(self):
+        return f"tickRow({self.to_dict()!r})"
+
+
+class tickBlock(Mapping):
+    """
+    Read-only columns of consecutive ticks of one symbol, for ``on_batch`` strategies.
+
+    ``block['LastPrice']`` is a numpy array of the block's prices, a view of the engine's
+    columns that cannot be written to.
+    """
+
+    __slots__ = ("_columns", "_start", "_stop")
+
+    def __init__(self, columns, start, stop):
+        """
+        Parameter
+        ----------
+        columns: dict column name -> read-only numpy array of the symbol's ticks.
+        start, stop: positions of the first tick and one past the last tick of the block.
+        """
+        self._columns = columns
+        self._start = start
+        self._stop = stop
+
+    @property
+    def size(self):
+        """
+        Number of ticks in the block.
+        """
+        return self._stop - self._start
+
+    def __getitem__(self, key):
+        return self._columns[key][self._start:self._stop]
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __repr__(self):
+        return f"tickBlock({self.size} ticks, columns={list(self._columns)})"
@@ -0,0 +1,352 @@
+import json
+import os
+import sys
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+
+class tickStore:
+    """
+    Columnar binary storage for daily tick files.
+
+    A converted day is a directory (``<day>.ticks``) holding one ``.npy`` file per column
+    and a ``meta.json`` with the row count and the categories of the coded columns:
+
+    - TradeDateTime: int64 epoch nanoseconds
+    - LastPrice, Value: float64
+    - Volume: int64
+    - ShareCode, Flag: categorical codes, categories are stored in ``meta.json``
+
+    ``load`` memory-maps the columns, so a day loads in milliseconds instead of
+    re-parsing the CSV and its ``TradeDateTime`` strings.
+
+    Rows are stored grouped by ShareCode (in time order within a symbol) and ``meta.json``
+    also holds a symbol index with each ShareCode's row ranges and time bounds, so one
+    symbol or a subset of SET50 can be read as memory-mapped slices of the day.
+    """
+
+    VERSION = 1
+    EXTENSION = ".ticks"
+    META_FILE = "meta.json"
+
+    NUMERIC_COLUMNS = {
+        "TradeDateTime": "int64",
+        "LastPrice": "float64",
+        "Volume": "int64",
+        "Value": "float64",
+    }
+    CATEGORICAL_COLUMNS = {
+        "ShareCode": "int16",
+        "Flag": "int8",
+    }
+    COLUMN_ORDER = ["ShareCode", "TradeDateTime", "LastPrice", "Volume", "Value", "Flag"]
+
+    @classmethod
+    def is_tick_store(cls, path):
+        return os.path.isdir(path) and os.path.exists(os.path.join(path, cls.META_FILE))
+
+    @classmethod
+    def default_store_path(cls, csv_path):
+        return os.path.splitext(csv_path)[0] + cls.EXTENSION
+
+    @classmethod
+    def convert_csv(cls, csv_path, store_path=None):
+        """
+        Convert a daily tick CSV into a columnar tick store.
+
+        Parameter
+        ----------
+        csv_path: path of the tick CSV.
+        store_path: output directory, defaults to the CSV path with a ``.ticks`` extension.
+
+        Returns
+        -------
+        str
+            Path of the tick store directory.
+        """
+        if not os.path.exists(csv_path):
+            raise FileNotFoundError(f"[ERROR] Cannot find tick file at '{csv_path}'")
+
+        df = pd.read_csv(csv_path)
+        return cls.write_frame(df, store_path or cls.default_store_path(csv_path), source=os.path.basename(csv_path))
+
+    @classmethod
+    def write_frame(cls, df, store_path, source=None):
+        """
+        Write a tick DataFrame as a columnar tick store at ``store_path``.
+        """
+        columns, categories = cls.encode_frame(df)
+        os.makedirs(store_path, exist_ok=True)
+
+        for name, values in columns.items():
+            np.save(os.path.join(store_path, f"{name}.npy"), np.ascontiguousarray(values))
+
+        meta = {
+            "version": cls.VERSION,
+            "rows": int(len(df)),
+            "source": source,
+            "columns": {**cls.NUMERIC_COLUMNS, **cls.CATEGORICAL_COLUMNS},
+            "categories": categories,
+            "index": cls.build_index(columns["ShareCode"], columns["TradeDateTime"], categories["ShareCode"]),
+        }
+        with open(os.path.join(store_path, cls.META_FILE), "w") as f:
+            json.dump(meta, f, indent=4)
+
+        return store_path
+
+    @classmethod
+    def encode_frame(cls, df):
+        """
+        Encode a tick DataFrame into the columns of a tick store, rows grouped by ShareCode.
+
+        Returns
+        -------
+        tuple
+            ``(columns, categories)`` where ``columns`` maps column name to a numpy array of
+            the store's dtype and ``categories`` maps a coded column to its categories.
+        """
+        missing = [c for c in cls.COLUMN_ORDER if c not in df.columns]
+        if missing:
+            raise KeyError(f"[ERROR] Tick data is missing columns: {missing}")
+
+        times = pd.to_datetime(df["TradeDateTime"]).to_numpy(dtype="datetime64[ns]")
+        columns = {
+            "TradeDateTime": times.view("int64"),
+            "LastPrice": df["LastPrice"].to_numpy(dtype="float64"),
+            "Volume": df["Volume"].to_numpy(dtype="int64"),
+            "Value": df["Value"].to_numpy(dtype="float64"),
+        }
+
+        categories = {}
+        for name, dtype in cls.CATEGORICAL_COLUMNS.items():
+            values = pd.Categorical(df[name].astype(str))
+            columns[name] = values.codes.astype(dtype)
+            categories[name] = [str(c) for c in values.categories]
+
+        # group rows by symbol and order them by TradeDateTime within a symbol; lexsort is
+        # stable, so only ticks with equal timestamps keep their file order
+        order = np.lexsort((columns["TradeDateTime"], columns["ShareCode"]))
+        return {name: values[order] for name, values in columns.items()}, categories
+
+    @staticmethod
+    def build_index(codes, times, symbols):
+        """
+        Build the symbol index of a day from its ShareCode codes and epoch-ns times.
+
+        Returns
+        -------
+        dict
+            ShareCode -> ``{"ranges": [[start, stop], ...], "first_time": int, "last_time": int}``
+            where ``ranges`` are half-open row ranges and the times are epoch nanoseconds.
+        """
+        index = {}
+        if len(codes) == 0:
+            return index
+
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.concatenate(([0], bounds))
+        stops = np.concatenate((bounds, [len(codes)]))
+
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            symbol = symbols[int(codes[start])]
+            first_time = int(np.min(times[start:stop]))
+            last_time = int(np.max(times[start:stop]))
+            entry = index.get(symbol)
+            if entry is None:
+                index[symbol] = {"ranges": [[start, stop]], "first_time": first_time, "last_time": last_time}
+            else:
+                entry["ranges"].append([start, stop])
+                entry["first_time"] = min(entry["first_time"], first_time)
+                entry["last_time"] = max(entry["last_time"], last_time)
+        return index
+
+    @classmethod
+    def read_meta(cls, store_path):
+        with open(os.path.join(store_path, cls.META_FILE), "r") as f:
+            meta = json.load(f)
+        if meta.get("version") != cls.VERSION:
+            raise ValueError(f"[ERROR] Unsupported tick store version {meta.get('version')} at '{store_path}'")
+        return meta
+
+    @classmethod
+    def load_columns(cls, store_path):
+        """
+        Memory-map every column of a tick store.
+
+        Returns
+        -------
+        tuple
+            ``(columns, meta)`` where ``columns`` maps column name to a read-only numpy memmap.
+        """
+        meta = cls.read_meta(store_path)
+        columns = {
+            name: np.load(os.path.join(store_path, f"{name}.npy"), mmap_mode="r")
+            for name in meta["columns"]
+        }
+        if "index" not in meta:
+            meta["index"] = cls.build_index(columns["ShareCode"], columns["TradeDateTime"], meta["categories"]["ShareCode"])
+        return columns, meta
+
+    @classmethod
+    def symbol_index(cls, store_path):
+        """
+        Returns the symbol index of a tick store, see ``build_index``.
+        """
+        return cls.load_columns(store_path)[1]["index"]
+
+    @classmethod
+    def symbol_columns(cls, store_path, symbol, columns=None, meta=None):
+        """
+        Returns the columns of one symbol as memory-mapped views, without reading the rest of the day.
+        A symbol spans several row ranges only in stores written before the symbol index, which
+        kept the CSV's row order; its ranges are then copied into one array.
+        """
+        if columns is None or meta is None:
+            columns, meta = cls.load_columns(store_path)
+
+        entry = meta["index"].get(symbol)
+        if entry is None:
+            return {name: values[:0] for name, values in columns.items()}
+
+        ranges = entry["ranges"]
+        if len(ranges) == 1:
+            start, stop = ranges[0]
+            return {name: values[start:stop] for name, values in columns.items()}
+        return {
+            name: np.concatenate([values[start:stop] for start, stop in ranges])
+            for name, values in columns.items()
+        }
+
+    @classmethod
+    def to_frame(cls, columns, meta):
+        """
+        Build a tick DataFrame from (memory-mapped) tick store columns.
+        """
+        data = {}
+        for name in cls.COLUMN_ORDER:
+            values = columns[name]
+            if name == "TradeDateTime":
+                data[name] = values.view("datetime64[ns]")
+            elif name in cls.CATEGORICAL_COLUMNS:
+                data[name] = pd.Categorical.from_codes(values, categories=meta["categories"][name])
+            else:
+                data[name] = values
+        return pd.DataFrame(data, copy=False)
+
+    @classmethod
+    def load(cls, path, symbols=None):
+        """
+        Load daily ticks as a DataFrame from either a tick CSV or a tick store directory.
+
+        ``TradeDateTime`` is always returned as datetime64 and, for tick stores,
+        ``ShareCode`` and ``Flag`` are returned as pandas categoricals.
+
+        Parameter
+        ----------
+        path: tick CSV or tick store directory.
+        symbols: optional iterable of ShareCodes; for tick stores only their row ranges are read.
+        """
+        if not cls.is_tick_store(path):
+            df = pd.read_csv(path)
+            df["TradeDateTime"] = pd.to_datetime(df["TradeDateTime"])
+            if symbols is not None:
+                df = df[df["ShareCode"].isin(list(symbols))].reset_index(drop=True)
+            return df
+
+        columns, meta = cls.load_columns(path)
+        if symbols is not None:
+            ranges = sorted(
+                r for symbol in set(symbols) if symbol in meta["index"] for r in meta["index"][symbol]["ranges"]
+            )
+            columns = {
+                name: np.concatenate([values[start:stop] for start, stop in ranges]) if ranges else values[:0]
+                for name, values in columns.items()
+            }
+        return cls.to_frame(columns, meta)
+
+
+class sharedTicks:
+    """
+    A day of ticks in ``multiprocessing.shared_memory``, one block per tick store column,
+    so that worker processes read the day without parsing or copying it.
+
+    The process that ``create``s it owns the blocks and ``unlink``s them once the workers
+    are done; a worker ``attach``es to its ``spec`` and reads the day with ``to_frame``.
+    """
+
+    def __init__(self, blocks, spec):
+        """
+        Parameter
+        ----------
+        blocks: dict column name -> SharedMemory block.
+        spec: picklable description of the blocks: ``{"rows", "categories", "columns"}``
+              where ``columns`` maps a column name to ``(block name, dtype)``.
+        """
+        self._blocks = blocks
+        self.spec = spec
+
+    @classmethod
+    def create(cls, ticks, symbols=None):
+        """
+        Copy a day of ticks into new shared memory blocks.
+
+        Parameter
+        ----------
+        ticks: tick DataFrame, or the path of a tick CSV or tick store.
+        symbols: optional iterable of ShareCodes to keep.
+        """
+        if isinstance(ticks, str):
+            ticks = tickStore.load(ticks, symbols)
+        elif symbols is not None:
+            ticks = ticks[ticks["ShareCode"].isin(list(symbols))]
+        columns, categories = tickStore.encode_frame(ticks)
+
+        blocks = {}
+        spec = {"rows": int(len(ticks)), "categories": categories, "columns": {}}
+        try:
+            for name, values in columns.items():
+                block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+                blocks[name] = block
+                np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+                spec["columns"][name] = (block.name, values.dtype.str)
+        except Exception:
+            for block in blocks.values():
+                block.close()
+                block.unlink()
+            raise
+        return cls(blocks, spec)
+
+    @classmethod
+    def attach(cls, spec):
+        """
+        Attach to the blocks of ``spec`` created by another process.
+        """
+        return cls({name: shared_memory.SharedMemory(name=block) for name, (block, _) in spec["columns"].items()}, spec)
+
+    def to_frame(self):
+        """
+        The day as a tick DataFrame like ``tickStore.load`` returns, over read-only views
+        of the shared columns. Keep this object alive while the frame is in use.
+        """
+        columns = {}
+        for name, (_, dtype) in self.spec["columns"].items():
+            values = np.frombuffer(self._blocks[name].buf, dtype=dtype, count=self.spec["rows"])
+            values.flags.writeable = False
+            columns[name] = values
+        return tickStore.to_frame(columns, self.spec)
+
+    def unlink(self):
+        """
+        Free the blocks; only the creating process calls this, after the workers are done.
+        """
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks = {}
+
+
+if __name__ == "__main__":
+    # python -m tradeSim.TickStore marketInfo/ticks/2025-10-20.csv [...]
+    for csv_file in sys.argv[1:]:
+        print(f"[INFO] Converted '{csv_file}' to '{tickStore.convert_csv(csv_file)}'")
@@ -2,9 +2,13 @@ from . import Portfolio
 from . import Execution
 from . import Strategy_runner
 from . import Order
+from . import OrderRejection
+from . import Engine
 from datetime import timedelta
+import pandas as pd
 import os
 import threading
+from collections import Counter, defaultdict
 lock = threading.Lock()
 
 import os
@@ -13,13 +17,20 @@ from datetime import datetime
 logged_errors = set()
 
 class tradeSim:
-    def __init__(self, team_name, load_existing=True, folder="result", ):
+    def __init__(self, team_name, load_existing=True, folder="result", participation_rate=None, lot_store="objects",
+                 equity_curve=None):
         self.error_logger = ErrorLogger(team_name)
         """
         Initialize the trade simulation environment for a simulation.
         ----------
         Parameter
         team_name: Name of the team.
+        participation_rate: share (0, 1] of each tick's volume that limit orders may fill,
+                            None (default) fills a matching order completely on one tick.
+        lot_store: "objects" (default) or "array", how the portfolio keeps its lots, see
+                   ``Portfolio.portfolio``.
+        equity_curve: EquityCurve.equityCurve to record the NAV into, by default one sample
+                      per minute of tick time.
         """
         # create directory if it does not exist
         team_folder = os.path.join(folder, team_name)
@@ -29,19 +40,24 @@ class tradeSim:
         file_path = os.path.join(folder,team_name, portfolio_file_name)
 
         if load_existing and os.path.exists(file_path):
-            self.portfolio = Portfolio.portfolio.load_from_file(team_name)
+            self.portfolio = Portfolio.portfolio.load_from_file(team_name, lot_store=lot_store, equity_curve=equity_curve)
             print(f"[INFO] Loaded existing portfolio from '{file_path}'")
         else:
-            self.portfolio = Portfolio.portfolio(team_name)
+            self.portfolio = Portfolio.portfolio(team_name, lot_store=lot_store, equity_curve=equity_curve)
             print(f"[INFO] Created new portfolio for '{team_name}'")
             self.portfolio.save_to_file(team_name)
-        self.execution = Execution.execution(team_name)
+        self.execution = Execution.execution(team_name, participation_rate=participation_rate)
 
-    def create_order_to_limit(self, volume, price, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data):
+    def create_order_to_limit(self, volume, price, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data,
+                              time_in_force="GTC", expire_time=None, board="main"):
+        """
+        Create a limit order. ``time_in_force`` is one of GTC (default), DAY, GTT (until
+        ``expire_time``, a tick time), IOC or FOK; IOC/FOK orders only match the current tick.
+        ``board="odd"`` places an odd-lot order (1-99 shares) that only matches Odd ticks.
+        """
         with lock:
-            limit_order = None
             try:
-                limit_order = Order.order(
+                limit_order = Order.order.create(
                     ownerPortfolio=self.portfolio,
                     volume=volume,
                     price=price,
@@ -49,9 +65,14 @@ class tradeSim:
                     symbol=symbol,
                     cum_sell_volume=cum_sell_volume,
                     cum_buy_volume=cum_buy_volume,
-                    timestamp= (mkt_data['TradeDateTime'] - timedelta(hours=7)).timestamp()
+                    timestamp= (mkt_data['TradeDateTime'] - timedelta(hours=7)).timestamp(),
+                    time_in_force=time_in_force,
+                    expire_time=expire_time,
+                    board=board,
                 )
-                self.execution.addOrderToOrders_Book(limit_order, mkt_data)
+                if isinstance(limit_order, OrderRejection.orderRejection):
+                    return self._reject(limit_order)
+                return self._place_limit_order(limit_order, mkt_data)
 
             except ValueError as e:
                 self.error_logger.log_error(e)
@@ -63,18 +84,53 @@ class tradeSim:
                 self.error_logger.log_error(e)
                 return e
 
-            return "Order for {symbol} (Vol: {volume}, Price: {price}, Side: {side}) created successfully.".format(
-                symbol=symbol,
-                volume=volume,
-                price=price,
-                side=side
-            )
+    def _reject(self, rejection):
+        self.error_logger.log_error(rejection)
+        return rejection
+
+    def _place_limit_order(self, limit_order, mkt_data):
+        """
+        Put a validated limit order in the book, or match it against the current tick if it
+        is IOC/FOK. Returns the result message.
+        """
+        time_in_force = limit_order.get_time_in_force()
+        if time_in_force in ("IOC", "FOK"):
+            filled = self.execution.executeImmediateOrder(limit_order, mkt_data)
+            if filled == 0:
+                return "Order {order_number} for {symbol} (Vol: {volume}, Price: {price}, Side: {side}) expired, {tif} order could not be filled at {last_price}.".format(
+                    order_number=limit_order.get_order_number(),
+                    symbol=limit_order.get_symbol(),
+                    volume=limit_order.get_volume(),
+                    price=limit_order.get_price(),
+                    side=limit_order.get_side(),
+                    tif=time_in_force,
+                    last_price=mkt_data['LastPrice'],
+                )
+            if filled < limit_order.get_volume():
+                return "Order {order_number} for {symbol} (Vol: {volume}, Price: {price}, Side: {side}) partially filled ({filled} of {volume}), the rest was cancelled.".format(
+                    order_number=limit_order.get_order_number(),
+                    symbol=limit_order.get_symbol(),
+                    volume=limit_order.get_volume(),
+                    price=limit_order.get_price(),
+                    side=limit_order.get_side(),
+                    filled=filled,
+                )
+        else:
+            self.execution.addOrderToOrders_Book(limit_order, mkt_data)
+
+        return "Order {order_number} for {symbol} (Vol: {volume}, Price: {price}, Side: {side}) created successfully.".format(
+            order_number=limit_order.get_order_number(),
+            symbol=limit_order.get_symbol(),
+            volume=limit_order.get_volume(),
+            price=limit_order.get_price(),
+            side=limit_order.get_side()
+        )
 
     def create_order_at_market(self, volume, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data):
         with lock:
             new_order = None
             try:
-                new_order = Order.order(
+                new_order = Order.order.create(
                     ownerPortfolio=self.portfolio,
                     volume=volume,
                     price=mkt_data['LastPrice'],
@@ -84,6 +140,8 @@ class tradeSim:
                     cum_buy_volume=cum_buy_volume,
                     timestamp= (mkt_data['TradeDateTime'] - timedelta(hours=7)).timestamp()
                 )
+                if isinstance(new_order, OrderRejection.orderRejection):
+                    return self._reject(new_order)
                 self.execution.isMatchMarketOrder(mkt_data,new_order)
 
             except ValueError as e:
@@ -96,18 +154,414 @@ class tradeSim:
                 self.error_logger.log_error(e)
                 return e
 
-            return "Order for {symbol} (Vol: {volume}, Price: {price}, Side: {side}) created successfully.".format(
+            return "Order {order_number} for {symbol} (Vol: {volume}, Price: {price}, Side: {side}) created successfully.".format(
+                order_number=new_order.get_order_number(),
                 symbol=symbol,
                 volume=volume,
                 price=mkt_data['LastPrice'],
                 side=side
             )
 
+    def submit_orders(self, orders, cum_sell_volume, cum_buy_volume, mkt_data):
+        """
+        Submit a batch of limit and market orders with one lock acquisition.
+
+        The whole batch is validated against one snapshot of the cash balance and holdings:
+        each accepted buy reserves its cost and each accepted sell its volume, so the batch
+        as a whole cannot spend more cash or sell more shares than the portfolio has. The
+        accepted orders are applied together once every order has been validated.
+
+        Parameter
+        ----------
+        orders: list of dicts with "volume", "side", "symbol" and "price" (None or missing
+                for a market order), and optionally "time_in_force", "expire_time" and
+                "board" as in ``create_order_to_limit``.
+
+        Returns
+        -------
+        list of dict
+            {"status": "accepted" or "rejected", "order_number": str or None,
+            "code": rejectReason or None, "reason": str} for every order, in the order of
+            ``orders``. The reason of an accepted order is its result message, malformed
+            orders are rejected without a code.
+        """
+        with lock:
+            snapshot = self.portfolio.snapshot()
+            timestamp = (mkt_data['TradeDateTime'] - timedelta(hours=7)).timestamp()
+            results = []
+            accepted = []
+
+            for spec in orders:
+                try:
+                    missing = [key for key in ("volume", "side", "symbol") if key not in spec]
+                    if missing:
+                        raise ValueError(f"[ERROR] Order {spec} skipped due to missing {', '.join(missing)}.")
+                    price = spec.get("price")
+                    new_order = Order.order.create(
+                        ownerPortfolio=self.portfolio,
+                        volume=spec["volume"],
+                        price=mkt_data['LastPrice'] if price is None else price,
+                        side=spec["side"],
+                        symbol=spec["symbol"],
+                        cum_sell_volume=cum_sell_volume,
+                        cum_buy_volume=cum_buy_volume,
+                        timestamp=timestamp,
+                        time_in_force=spec.get("time_in_force", "GTC"),
+                        expire_time=spec.get("expire_time"),
+                        board=spec.get("board", "main"),
+                        validate_against=snapshot,
+                    )
+                except (ValueError, FileNotFoundError, KeyError) as e:
+                    new_order = e
+                if not isinstance(new_order, Order.order):
+                    self.error_logger.log_error(new_order)
+                    results.append({
+                        "status": "rejected",
+                        "order_number": None,
+                        "code": getattr(new_order, "code", None),
+                        "reason": str(new_order),
+                    })
+                    continue
+
+                snapshot.reserve(new_order)
+                accepted.append((len(results), new_order, price is None))
+                results.append(None)
+
+            for index, new_order, at_market in accepted:
+                if at_market:
+                    self.execution.isMatchMarketOrder(mkt_data, new_order)
+                    reason = "Order {order_number} for {symbol} (Vol: {volume}, Price: {price}, Side: {side}) created successfully.".format(
+                        order_number=new_order.get_order_number(),
+                        symbol=new_order.get_symbol(),
+                        volume=new_order.get_volume(),
+                        price=new_order.get_price(),
+                        side=new_order.get_side()
+                    )
+                else:
+                    reason = self._place_limit_order(new_order, mkt_data)
+                results[index] = {
+                    "status": "accepted",
+                    "order_number": new_order.get_order_number(),
+                    "code": OrderRejection.rejectReason.OK,
+                    "reason": reason,
+                }
+
+            return results
+
+    def create_auction_order(self, volume, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data, price=None):
+        """
+        Create an order for the next call auction (OPEN1, OPEN2 or ATC). Without ``price`` it
+        matches at any auction price (ATO/ATC), otherwise only if the auction price is at or
+        better than ``price``. Unfilled volume is cancelled after the auction.
+        """
+        with lock:
+            try:
+                auction_order = Order.order.create(
+                    ownerPortfolio=self.portfolio,
+                    volume=volume,
+                    price=mkt_data['LastPrice'] if price is None else price,
+                    side=side,
+                    symbol=symbol,
+                    cum_sell_volume=cum_sell_volume,
+                    cum_buy_volume=cum_buy_volume,
+                    timestamp= (mkt_data['TradeDateTime'] - timedelta(hours=7)).timestamp(),
+                    order_type="AUCTION",
+                )
+                if isinstance(auction_order, OrderRejection.orderRejection):
+                    return self._reject(auction_order)
+                self.execution.addAuctionOrder(auction_order, price)
+
+            except ValueError as e:
+                self.error_logger.log_error(e)
+                return e
+            except FileNotFoundError as e:
+                self.error_logger.log_error(e)
+                return e
+            except KeyError as e:
+                self.error_logger.log_error(e)
+                return e
+
+            return "AUCTION order {order_number} for {symbol} (Vol: {volume}, Price: {price}, Side: {side}) created successfully.".format(
+                order_number=auction_order.get_order_number(),
+                symbol=symbol,
+                volume=volume,
+                price="ATO/ATC" if price is None else price,
+                side=side
+            )
+
+    def clear_auction(self):
+        """
+        Clear the auction orders against the auction prints seen so far, e.g. after the ATC
+        prints at the end of a day. During a day this happens on the first tick after an auction.
+        """
+        with lock:
+            if self.execution.hasPendingAuction():
+                self.execution.clearAuction()
+
+    def create_stop_order(self, volume, side, symbol, stop_price, cum_sell_volume, cum_buy_volume, mkt_data,
+                          limit_price=None, time_in_force="GTC", expire_time=None):
+        """
+        Create a stop order that triggers once the market reaches ``stop_price`` (falls to it for
+        sells, rises to it for buys). Without ``limit_price`` it then fills at the market price,
+        with ``limit_price`` it becomes a limit order (stop-limit).
+        """
+        order_type = "STOP" if limit_price is None else "STOP_LIMIT"
+        price = stop_price if limit_price is None else limit_price
+        return self._create_stop_order(volume, price, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data,
+                                       time_in_force, expire_time, order_type, stop_price=stop_price)
+
+    def create_trailing_stop_order(self, volume, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data,
+                                   trail_amount=None, trail_percent=None, time_in_force="GTC", expire_time=None):
+        """
+        Create a trailing stop that follows the highest price (sells) or lowest price (buys) since it
+        was placed at a distance of ``trail_amount`` baht or ``trail_percent`` (0.05 = 5%), and fills
+        at the market price once triggered.
+        """
+        return self._create_stop_order(volume, mkt_data['LastPrice'], side, symbol, cum_sell_volume, cum_buy_volume, mkt_data,
+                                       time_in_force, expire_time, "TRAILING_STOP",
+                                       trail_amount=trail_amount, trail_percent=trail_percent)
+
+    def _create_stop_order(self, volume, price, side, symbol, cum_sell_volume, cum_buy_volume, mkt_data,
+                           time_in_force, expire_time, order_type, stop_price=None, trail_amount=None, trail_percent=None):
+        with lock:
+            try:
+                stop_order = Order.order.create(
+                    ownerPortfolio=self.portfolio,
+                    volume=volume,
+                    price=price,
+                    side=side,
+                    symbol=symbol,
+                    cum_sell_volume=cum_sell_volume,
+                    cum_buy_volume=cum_buy_volume,
+                    timestamp= (mkt_data['TradeDateTime'] - timedelta(hours=7)).timestamp(),
+                    time_in_force=time_in_force,
+                    expire_time=expire_time,
+                    order_type=order_type,
+                    stop_price=stop_price,
+                    trail_amount=trail_amount,
+                    trail_percent=trail_percent,
+                )
+                if isinstance(stop_order, OrderRejection.orderRejection):
+                    return self._reject(stop_order)
+                self.execution.addStopOrder(stop_order, mkt_data)
+
+            except ValueError as e:
+                self.error_logger.log_error(e)
+                return e
+            except FileNotFoundError as e:
+                self.error_logger.log_error(e)
+                return e
+            except KeyError as e:
+                self.error_logger.log_error(e)
+                return e
+
+            return "{order_type} order {order_number} for {symbol} (Vol: {volume}, Stop: {stop_price}, Side: {side}) created successfully.".format(
+                order_type=order_type,
+                order_number=stop_order.get_order_number(),
+                symbol=symbol,
+                volume=volume,
+                stop_price=stop_order.get_stop_price(),
+                side=side
+            )
+
+    def create_bracket_order(self, volume, price, side, symbol, take_profit_price, stop_loss_price,
+                             cum_sell_volume, cum_buy_volume, mkt_data, time_in_force="GTC", expire_time=None):
+        """
+        Create a limit entry order with a take-profit limit order and a stop-loss stop order.
+        The exits are placed by the matching engine once the entry fills, for the filled
+        volume, and cancel each other when one of them fills.
+        """
+        with lock:
+            try:
+                if time_in_force in ("IOC", "FOK"):
+                    return self._reject(OrderRejection.orderRejection(
+                        OrderRejection.rejectReason.IMMEDIATE_BRACKET, symbol, volume, price, side,
+                        subject="Bracket order", time_in_force=time_in_force,
+                    ))
+                timestamp = (mkt_data['TradeDateTime'] - timedelta(hours=7)).timestamp()
+                entry = Order.order.create(
+                    ownerPortfolio=self.portfolio,
+                    volume=volume,
+                    price=price,
+                    side=side,
+                    symbol=symbol,
+                    cum_sell_volume=cum_sell_volume,
+                    cum_buy_volume=cum_buy_volume,
+                    timestamp=timestamp,
+                    time_in_force=time_in_force,
+                    expire_time=expire_time,
+                )
+                if isinstance(entry, OrderRejection.orderRejection):
+                    return self._reject(entry)
+                if not (
+                    (side == "Buy" and stop_loss_price < price < take_profit_price)
+                    or (side == "Sell" and take_profit_price < price < stop_loss_price)
+                ):
+                    return self._reject(OrderRejection.orderRejection(
+                        OrderRejection.rejectReason.INVALID_BRACKET_PRICES, symbol, volume, price, side,
+                        subject="Bracket order", take_profit_price=take_profit_price, stop_loss_price=stop_loss_price,
+                    ))
+
+                # the exits are checked against the position when they fill or trigger
+                exit_side = "Sell" if side == "Buy" else "Buy"
+                take_profit = Order.order.create(
+                    ownerPortfolio=self.portfolio,
+                    volume=volume,
+                    price=take_profit_price,
+                    side=exit_side,
+                    symbol=symbol,
+                    cum_sell_volume=cum_sell_volume,
+                    cum_buy_volume=cum_buy_volume,
+                    timestamp=timestamp,
+                    check_position=False,
+                )
+                stop_loss = Order.order.create(
+                    ownerPortfolio=self.portfolio,
+                    volume=volume,
+                    price=stop_loss_price,
+                    side=exit_side,
+                    symbol=symbol,
+                    cum_sell_volume=cum_sell_volume,
+                    cum_buy_volume=cum_buy_volume,
+                    timestamp=timestamp,
+                    order_type="STOP",
+                    stop_price=stop_loss_price,
+                )
+                for exit_order in (take_profit, stop_loss):
+                    if isinstance(exit_order, OrderRejection.orderRejection):
+                        return self._reject(exit_order)
+                self.execution.addBracket(entry, [take_profit, stop_loss], mkt_data)
+
+            except ValueError as e:
+                self.error_logger.log_error(e)
+                return e
+            except FileNotFoundError as e:
+                self.error_logger.log_error(e)
+                return e
+            except KeyError as e:
+                self.error_logger.log_error(e)
+                return e
+
+            return "Bracket order {order_number} for {symbol} (Vol: {volume}, Price: {price}, Side: {side}, Take profit: {take_profit_number} at {take_profit_price}, Stop loss: {stop_loss_number} at {stop_loss_price}) created successfully.".format(
+                order_number=entry.get_order_number(),
+                symbol=symbol,
+                volume=volume,
+                price=price,
+                side=side,
+                take_profit_number=take_profit.get_order_number(),
+                take_profit_price=take_profit_price,
+                stop_loss_number=stop_loss.get_order_number(),
+                stop_loss_price=stop_loss_price,
+            )
+
+    def create_oco_group(self, order_numbers):
+        """
+        Link open orders (limit or stop) so that a fill of one of them cancels the others.
+        """
+        with lock:
+            order_numbers = list(order_numbers)
+            if len(set(order_numbers)) < 2:
+                e = ValueError(f"[ERROR] Cannot create OCO group {order_numbers}: it needs at least two different orders.")
+            elif any(self.execution.getOpenOrder(n) is None for n in order_numbers):
+                missing = [n for n in order_numbers if self.execution.getOpenOrder(n) is None]
+                e = ValueError(f"[ERROR] Cannot create OCO group {order_numbers}: {', '.join(missing)} not open.")
+            elif any(self.execution.Order_Groups.is_grouped(n) for n in order_numbers):
+                e = ValueError(f"[ERROR] Cannot create OCO group {order_numbers}: an order is already in an order group.")
+            else:
+                self.execution.addOcoGroup(order_numbers)
+                return f"OCO group {', '.join(order_numbers)} created successfully."
+            self.error_logger.log_error(e)
+            return e
+
+    def cancel_order(self, order_number):
+        """
+        Cancel a resting limit order or a pending stop order by its order number.
+        """
+        with lock:
+            cancelled = self.execution.cancelOrder(order_number)
+            if cancelled is None:
+                e = ValueError(f"[ERROR] Cannot cancel order {order_number}: it is not in the order book.")
+                self.error_logger.log_error(e)
+                return e
+            return f"Order {order_number} for {cancelled.get_symbol()} cancelled successfully."
+
+    def amend_order(self, order_number, price, volume, cum_sell_volume, cum_buy_volume, mkt_data):
+        """
+        Change the price and/or volume of a resting limit order. The amended order is
+        validated again like a new order; ``None`` keeps the current price or volume.
+        """
+        with lock:
+            resting = self.execution.getOrder(order_number)
+            if resting is None:
+                e = ValueError(f"[ERROR] Cannot amend order {order_number}: it is not in the order book.")
+                self.error_logger.log_error(e)
+                return e
+
+            price = resting.get_price() if price is None else price
+            volume = resting.get_volume() if volume is None else volume
+            symbol, side = resting.get_symbol(), resting.get_side()
+
+            # only the unfilled part of a partially filled order is validated
+            if volume <= resting.get_filled_volume():
+                code = OrderRejection.rejectReason.AMEND_BELOW_FILLED
+            else:
+                code = resting.validate_order(
+                    volume - resting.get_filled_volume(), side, symbol, self.portfolio, price, cum_sell_volume, cum_buy_volume,
+                    board=resting.get_board(),
+                )
+            if code is not OrderRejection.rejectReason.OK:
+                return self._reject(OrderRejection.orderRejection(
+                    code, symbol, volume, price, side,
+                    subject=f"Amend of order {order_number}", board=resting.get_board(),
+                    filled_volume=resting.get_filled_volume(),
+                ))
+
+            self.execution.amendOrder(order_number, price=price, volume=volume)
+            return f"Order {order_number} for {symbol} (Vol: {volume}, Price: {price}, Side: {side}) amended successfully."
+
+    def get_open_orders(self, symbol=None):
+        """
+        Returns the order info of the resting, pending stop and auction orders, optionally only for ``symbol``.
+        """
+        books = self.execution.openBooks()
+        if symbol is not None:
+            orders = [o for book in books for o in book.orders_for(symbol)]
+        else:
+            orders = [o for book in books for o in book]
+        return [
+            {
+                **o.get_order_info(),
+                "Filled Volume": o.get_filled_volume(),
+                "Time In Force": o.get_time_in_force(),
+                "Order Type": o.get_order_type(),
+                "Stop Price": o.get_stop_price(),
+                "Triggered": o not in self.execution.Trigger_Book,
+                "Board": o.get_board(),
+            }
+            for o in sorted(orders, key=lambda o: o.get_order_number())
+        ]
+
+    def expire_orders(self, trade_datetime):
+        """
+        Cancel the DAY/GTT orders that have expired at ``trade_datetime`` (tick time), e.g. at the end of a day.
+        Expiry also happens automatically in ``isMatch`` as the ticks advance.
+        Returns the order numbers of the expired orders.
+        """
+        with lock:
+            expired = self.execution.expireOrders(Order.order.to_timestamp(trade_datetime))
+            return [o.get_order_number() for o in expired]
+
     def get_strategy_runner(self):
         """
         Returns the strategy runner instance for executing strategies.
         """
         return Strategy_runner.strategy_runner(self)
+
+    def get_engine(self, strategy_class):
+        """
+        Returns a single-threaded engine that streams daily ticks through ``strategy_class``.
+        """
+        return Engine.engine(self, strategy_class)
     
     def save_portfolio(self):
         """ 
@@ -118,6 +572,12 @@ class tradeSim:
     def save_summary_csv(self, trading_date):
         self.portfolio.save_summary_csv(trading_date)
 
+    def save_equity_curve(self):
+        """
+        Save the intraday equity curve of the portfolio to CSV.
+        """
+        self.portfolio.save_equity_curve()
+
     def create_transaction_summarize(self, team_name):
         """
         Create a transaction summary for the team.
@@ -126,20 +586,26 @@ class tradeSim:
 
     def isOrderbooksEmpty(self):
         """
-        Check if the order book is empty.
+        Check if the order book and the pending stop orders are empty.
         """
-        return len(self.execution.Orders_Book) == 0
+        return self.execution.isOrderbooksEmpty()
     
     def isMatch(self, row):
         with lock:
-            return self.execution.isMatch(row)
+            result = self.execution.isMatch(row)
+            if self.execution.rejected_orders:
+                for e in self.execution.drainRejectedOrders():
+                    self.error_logger.log_error(e)
+            return result
     
         # update market prices in portfolio
-    def update_market_prices(self, price_update):
+    def update_market_prices(self, price_update, trade_datetime=None):
         """
         Update the market prices in the portfolio based on the provided price update.
+        ``trade_datetime`` is the tick time, it times the samples of the equity curve.
         """
-        self.portfolio.update_market_prices(price_update)
+        tick_time = None if trade_datetime is None else pd.Timestamp(trade_datetime).timestamp()
+        self.portfolio.update_market_prices(price_update, tick_time)
         
     def flushTransactionLog(self):
         self.execution.flushTransactionLog()
@@ -152,6 +618,13 @@ class ErrorLogger:
     def __init__(self, team_name, filename_suffix="error_log.txt"):
         self.error_log = []
         self.team_name = team_name
+        # messages, or rejection keys, in error_log since the last flush
+        self._logged = set()
+        # rejectReason -> number of rejected orders, and symbol -> rejectReason -> number
+        self.counts_by_code = Counter()
+        self.counts_by_symbol = defaultdict(Counter)
+        # the counts at the last flush, a flush summarizes the rejections since
+        self._flushed_by_symbol = {}
 
         folder = os.path.join("result", team_name)
         os.makedirs(folder, exist_ok=True)
@@ -164,20 +637,62 @@ class ErrorLogger:
                 f.write("-" * 80 + "\n")
 
     def log_error(self, error: Exception):
-        err_msg = str(error)
-        # Avoid duplicates within current runtime
-        if err_msg not in [e["message"] for e in self.error_log]:
-            self.error_log.append({
-                "timestamp": datetime.now(),
-                "message": err_msg
-            })
+        if isinstance(error, OrderRejection.orderRejection):
+            # every rejection is counted, but only formatted the first time it is seen
+            self.counts_by_code[error.code] += 1
+            self.counts_by_symbol[error.symbol][error.code] += 1
+            key = error.key()
+        else:
+            key = str(error)
+
+        # Avoid duplicates until the next flush
+        if key in self._logged:
+            return
+        self._logged.add(key)
+        self.error_log.append({
+            "timestamp": datetime.now(),
+            "message": str(error)
+        })
+
+    def get_rejection_counts(self):
+        """
+        Returns
+        -------
+        dict
+            {"by_code": {code name: count}, "by_symbol": {symbol: {code name: count}}} of the
+            rejected orders, including repeats that were not logged again.
+        """
+        return {
+            "by_code": {code.name: n for code, n in self.counts_by_code.most_common()},
+            "by_symbol": {
+                symbol: {code.name: n for code, n in counts.most_common()}
+                for symbol, counts in sorted(self.counts_by_symbol.items())
+            },
+        }
 
     def flush_logs(self):
-        if not self.error_log:
+        new_by_symbol = {
+            symbol: counts - self._flushed_by_symbol.get(symbol, Counter())
+            for symbol, counts in sorted(self.counts_by_symbol.items())
+        }
+        new_by_code = sum(new_by_symbol.values(), Counter())
+        if not self.error_log and not new_by_code:
             return
 
         with open(self.txt_file, "a", encoding="utf-8") as f:
             for e in self.error_log:
                 f.write(f"{e['timestamp']} | {e['message']}\n")
 
+            now = datetime.now()
+            for code, n in new_by_code.most_common():
+                symbols = ", ".join(
+                    f"{symbol}: {counts[code]}"
+                    for symbol, counts in new_by_symbol.items()
+                    if counts[code]
+                )
+                f.write(f"{now} | [SUMMARY] {n} orders rejected with {code.name} ({symbols})\n")
+
+        # written, a later flush only appends what was logged since
         self.error_log.clear()
+        self._logged.clear()
+        self._flushed_by_symbol = {symbol: Counter(counts) for symbol, counts in self.counts_by_symbol.items()}
@@ -18,8 +18,13 @@ class Transaction:
                 ])
                 writer.writeheader()
     
-    def create_transaction_log(self, order):
+    def create_transaction_log(self, order, volume=None):
+        """
+        Log a fill of ``order``; ``volume`` is the filled volume of a partial fill.
+        """
         order_info = order.get_order_info()
+        if volume is not None:
+            order_info["Volume"] = volume
         if order_info["Side"] == "Buy":
             order_info["Price"] += CommissionService.commissionService._get_slippage(order_info["Price"])
         elif order_info["Side"] == "Sell":
@@ -33,3 +38,5 @@ class Transaction:
                 'Order Number', 'owner', 'Volume', 'Price', 'Side', 'Symbol', 'Timestamp'
             ])
             writer.writerows(self.transaction_log)
+        # written, a later flush only appends the fills since
+        self.transaction_log.clear()
@@ -0,0 +1,143 @@
+import bisect
+import heapq
+from itertools import count
+
+
+class triggerBook:
+    """
+    Pending stop, stop-limit and trailing-stop orders indexed by symbol and side.
+
+    A sell stop triggers once the market falls to its stop price and a buy stop once the
+    market rises to it. Buy stops are stored with negated prices, so both sides trigger
+    when the (signed) market price is at or below the (signed) stop price and each side
+    is one list sorted by stop price: a tick only bisects to the stops it crossed.
+
+    Trailing stops also sit in a heap keyed by the best price seen since they were placed
+    (highest for sells, lowest for buys, negated). A tick only ratchets the trailing stops
+    whose mark it beats; a tick without a new extreme costs one heap peek.
+    """
+
+    def __init__(self):
+        # (symbol, side) -> ([(signed stop, seq), ...] sorted, [order, ...] in the same order)
+        self._books = {}
+        # (symbol, side) -> heap of (signed extreme price, seq, order number) of trailing stops
+        self._trailing = {}
+        # order number -> (symbol, side, (signed stop, seq))
+        self._entries = {}
+        self._seq = count()
+
+    @staticmethod
+    def _sign(side):
+        return 1 if side == "Sell" else -1
+
+    def add(self, order, last_price=None):
+        """
+        Add a stop order. ``last_price`` is the market price a trailing stop starts trailing from.
+        """
+        symbol, side = order.get_symbol(), order.get_side()
+        key = self._insert(order)
+        if order.get_order_type() == "TRAILING_STOP":
+            extreme = order.get_price() if last_price is None else last_price
+            heap = self._trailing.setdefault((symbol, side), [])
+            heapq.heappush(heap, (self._sign(side) * extreme, key[1], order.get_order_number()))
+
+    def _insert(self, order):
+        symbol, side = order.get_symbol(), order.get_side()
+        key = (self._sign(side) * order.get_stop_price(), next(self._seq))
+        keys, orders = self._books.setdefault((symbol, side), ([], []))
+        index = bisect.bisect_right(keys, key)
+        keys.insert(index, key)
+        orders.insert(index, order)
+        self._entries[order.get_order_number()] = (symbol, side, key)
+        return key
+
+    def remove(self, order_number):
+        """
+        Remove a pending order. Returns the order, or None if it is not pending.
+        Stale trailing heap entries are skipped when they are popped.
+        """
+        entry = self._entries.pop(order_number, None)
+        if entry is None:
+            return None
+
+        symbol, side, key = entry
+        keys, orders = self._books[(symbol, side)]
+        index = bisect.bisect_left(keys, key)
+        order = orders[index]
+        del keys[index]
+        del orders[index]
+        if not keys:
+            del self._books[(symbol, side)]
+            self._trailing.pop((symbol, side), None)
+        return order
+
+    def get(self, order_number):
+        entry = self._entries.get(order_number)
+        if entry is None:
+            return None
+        symbol, side, key = entry
+        keys, orders = self._books[(symbol, side)]
+        return orders[bisect.bisect_left(keys, key)]
+
+    def cancel(self, order_number):
+        return self.remove(order_number)
+
+    def _ratchet(self, book_key, signed_price, last_price):
+        heap = self._trailing.get(book_key)
+        while heap and heap[0][0] < signed_price:
+            _, seq, order_number = heapq.heappop(heap)
+            entry = self._entries.get(order_number)
+            if entry is None or entry[2][1] != seq:
+                continue  # cancelled, triggered or already re-queued
+
+            order = self.remove(order_number)
+            order.set_stop_price(order.trailing_stop_price(last_price))
+            key = self._insert(order)
+            heap = self._trailing.setdefault(book_key, heap)
+            heapq.heappush(heap, (signed_price, key[1], order_number))
+
+    def triggered(self, symbol, last_price):
+        """
+        Remove and return the orders of ``symbol`` triggered at ``last_price``, oldest first.
+        """
+        fired = []
+        for side in ("Buy", "Sell"):
+            book_key = (symbol, side)
+            if book_key not in self._books:
+                continue
+
+            signed_price = self._sign(side) * last_price
+            self._ratchet(book_key, signed_price, last_price)
+
+            keys, orders = self._books[book_key]
+            start = bisect.bisect_left(keys, (signed_price,))
+            if start == len(keys):
+                continue
+            fired.extend(zip(keys[start:], orders[start:]))
+            for order in orders[start:]:
+                del self._entries[order.get_order_number()]
+            del keys[start:]
+            del orders[start:]
+            if not keys:
+                del self._books[book_key]
+                self._trailing.pop(book_key, None)
+
+        fired.sort(key=lambda item: item[0][1])
+        return [order for _, order in fired]
+
+    def orders_for(self, symbol):
+        return [
+            order
+            for side in ("Buy", "Sell")
+            for order in self._books.get((symbol, side), ((), ()))[1]
+        ]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        for _, orders in list(self._books.values()):
+            yield from list(orders)
+
+    def __contains__(self, order):
+        return order.get_order_number() in self._entries
@@ -0,0 +1,133 @@
+import unittest
+import pandas as pd
+from tradeSim import TradeSim
+
+
+class TestAuction(unittest.TestCase):
+
+    def setUp(self):
+        self.tradeSim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        self.execution = self.tradeSim.execution
+
+    def mock_market_row(self, symbol, price, flag="Sell", time="2025-07-09 09:56:22", volume=1000):
+        return {
+            'ShareCode': symbol,
+            'LastPrice': price,
+            'Volume': volume,
+            'Flag': flag,
+            'TradeDateTime': pd.Timestamp(time),
+        }
+
+    def auction_order(self, symbol, side, volume=100, price=None, last_price=60.0):
+        return self.tradeSim.create_auction_order(
+            volume, side, symbol, 0, 0, self.mock_market_row(symbol, last_price, time="2025-07-09 09:55:00"), price=price
+        )
+
+    def volume(self, symbol):
+        return self.tradeSim.portfolio.get_total_stock_volume_by_symbol(symbol)
+
+    def test_auction_orders_clear_in_one_batch(self):
+        result = self.auction_order("AOT", "Buy")
+        self.assertIn("created successfully", str(result))
+        self.auction_order("PTT", "Buy", price=33.0, last_price=34.0)
+        self.auction_order("PTT", "Buy", price=35.0, last_price=34.0)
+
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 59.0, "OPEN1_E"))
+        self.tradeSim.isMatch(self.mock_market_row("PTT", 34.0, "OPEN1_E"))
+        # nothing is cleared until every symbol has printed its auction
+        self.assertEqual(self.volume("AOT"), 0)
+        self.assertEqual(len(self.execution.Auction_Book), 3)
+
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 59.25, "Buy", time="2025-07-09 09:56:23"))
+        self.assertEqual(self.volume("AOT"), 100)
+        self.assertEqual(self.volume("PTT"), 100)
+        # the auction order that did not cross is cancelled after the auction
+        self.assertEqual(len(self.execution.Auction_Book), 0)
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+        # every auction order fills at the auction price
+        lot = self.tradeSim.portfolio.get_stock_by_symbol("AOT")[0]
+        self.assertEqual(lot.get_mkt_price(), 59.0)
+
+    def test_auction_orders_wait_for_their_symbol(self):
+        self.auction_order("AOT", "Buy")
+        self.tradeSim.isMatch(self.mock_market_row("PTT", 34.0, "OPEN1_E"))
+        self.tradeSim.isMatch(self.mock_market_row("PTT", 34.25, "Buy", time="2025-07-09 09:56:23"))
+
+        self.assertEqual(len(self.execution.Auction_Book), 1)
+
+    def test_atc_is_cleared_at_end_of_stream(self):
+        self.auction_order("AOT", "Buy")
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 59.0, "ATC", time="2025-07-09 16:36:10"))
+        self.assertEqual(self.volume("AOT"), 0)
+
+        self.tradeSim.clear_auction()
+        self.assertEqual(self.volume("AOT"), 100)
+
+    def test_auction_share_of_print_volume(self):
+        self.execution.participation_rate = 0.1
+        self.auction_order("AOT", "Buy", volume=300)
+        self.auction_order("AOT", "Buy", volume=300)
+        first, second = sorted(self.execution.Auction_Book, key=lambda o: o.get_order_number())
+
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 59.0, "OPEN1_E", volume=4000))
+        self.tradeSim.clear_auction()
+        self.assertEqual(first.get_filled_volume(), 300)
+        self.assertEqual(second.get_filled_volume(), 100)
+
+    def test_continuous_orders_ignore_auction_prints(self):
+        self.tradeSim.create_order_to_limit(100, 60.0, "Buy", "AOT", 10000, 10000, self.mock_market_row("AOT", 60.0))
+
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 59.0, "OPEN2_E", time="2025-07-09 13:58:03"))
+        self.assertEqual(self.volume("AOT"), 0)
+
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 60.0, "Buy", time="2025-07-09 13:58:04"))
+        self.assertEqual(self.volume("AOT"), 100)
+
+
+class TestOddLotBoard(unittest.TestCase):
+
+    def setUp(self):
+        self.tradeSim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+
+    def mock_market_row(self, symbol, price, flag="Sell", volume=1000):
+        return {
+            'ShareCode': symbol,
+            'LastPrice': price,
+            'Volume': volume,
+            'Flag': flag,
+            'TradeDateTime': pd.Timestamp("2025-07-09 12:35:37"),
+        }
+
+    def place(self, volume, board, side="Buy", price=60.0):
+        return self.tradeSim.create_order_to_limit(
+            volume, price, side, "AOT", 10000, 10000, self.mock_market_row("AOT", price), board=board
+        )
+
+    def test_odd_lot_volume_rules(self):
+        self.assertIn("multiple of 100", str(self.place(50, "main")))
+        self.assertIn("between 1 and 99", str(self.place(100, "odd")))
+        self.assertIn("created successfully", str(self.place(50, "odd")))
+
+    def test_odd_lots_only_match_odd_ticks(self):
+        self.place(50, "odd")
+        self.place(100, "main")
+
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 60.0, "Odd", volume=30))
+        self.assertEqual(self.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT"), 50)
+        self.assertEqual([o["Board"] for o in self.tradeSim.get_open_orders("AOT")], ["main"])
+
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 60.0, "Sell"))
+        self.assertEqual(self.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT"), 150)
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+    def test_odd_lot_partial_fill(self):
+        self.tradeSim.execution.participation_rate = 0.5
+        self.place(50, "odd")
+
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 60.0, "Odd", volume=30))
+        self.assertEqual(self.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT"), 15)
+
+
+if __name__ == '__main__':
+    unittest.main()
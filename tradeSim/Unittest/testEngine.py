@@ -0,0 +1,83 @@
+import unittest
+import pandas as pd
+from tradeSim import TradeSim
+from strategy.Strategies_template import Strategy_template
+
+seen_rows = []
+
+
+class recording_strategy(Strategy_template):
+    def __init__(self, handler):
+        super().__init__("TEST_OWNER", "recording_strategy", handler)
+        self.count = 0
+
+    def on_data(self, row):
+        seen_rows.append((row["TradeDateTime"], row["ShareCode"]))
+        self.count += 1
+        if self.count == 1:
+            self.handler.create_order_to_limit(volume=100, price=row["LastPrice"], side="Buy", symbol=row["ShareCode"])
+
+
+def mock_ticks():
+    return pd.DataFrame({
+        "ShareCode": ["PTT", "PTT", "PTT", "AOT", "AOT", "AOT"],
+        "TradeDateTime": pd.to_datetime([
+            "2025-07-09 10:00:00", "2025-07-09 10:00:02", "2025-07-09 10:00:04",
+            "2025-07-09 10:00:01", "2025-07-09 10:00:02", "2025-07-09 10:00:05",
+        ]),
+        "LastPrice": [34.0, 34.25, 34.5, 58.0, 58.25, 58.5],
+        "Volume": [1000, 1000, 1000, 1000, 1000, 1000],
+        "Flag": ["Sell", "Sell", "Buy", "Sell", "Sell", "Buy"],
+    })
+
+
+class TestEngine(unittest.TestCase):
+
+    def setUp(self):
+        seen_rows.clear()
+        self.tradeSim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+
+    def test_ticks_are_merged_by_time(self):
+        processed = self.tradeSim.get_engine(recording_strategy).stream(mock_ticks())
+
+        self.assertEqual(processed, 6)
+        self.assertEqual([symbol for _, symbol in seen_rows], ["PTT", "AOT", "AOT", "PTT", "PTT", "AOT"])
+        self.assertEqual([t for t, _ in seen_rows], sorted(t for t, _ in seen_rows))
+
+    def test_one_handler_per_symbol(self):
+        engine = self.tradeSim.get_engine(recording_strategy)
+        engine.stream(mock_ticks())
+
+        self.assertEqual(sorted(engine.handlers), ["AOT", "PTT"])
+        self.assertEqual(engine.handlers["AOT"].strategy.count, 3)
+        self.assertEqual(engine.latest_prices["PTT"]["price"], 34.5)
+
+    def test_orders_are_matched_and_marked(self):
+        self.tradeSim.get_engine(recording_strategy).stream(mock_ticks())
+
+        stocks = {s["Symbol"]: s for s in self.tradeSim.portfolio.get_all_stocks_info()}
+        self.assertEqual(sorted(stocks), ["AOT", "PTT"])
+        self.assertEqual(stocks["AOT"]["Market Price"], 58.5)
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+    def test_stream_symbol_subset(self):
+        processed = self.tradeSim.get_engine(recording_strategy).stream(mock_ticks(), symbols=["AOT"])
+
+        self.assertEqual(processed, 3)
+        self.assertEqual({symbol for _, symbol in seen_rows}, {"AOT"})
+
+    def test_run_is_reproducible(self):
+        self.tradeSim.get_engine(recording_strategy).stream(mock_ticks())
+        first_run = list(seen_rows)
+        first_nav = self.tradeSim.portfolio.get_nav()
+
+        seen_rows.clear()
+        other_sim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        other_sim.get_engine(recording_strategy).stream(mock_ticks())
+
+        self.assertEqual(seen_rows, first_run)
+        self.assertEqual(other_sim.portfolio.get_nav(), first_nav)
+
+
+if __name__ == '__main__':
+    unittest.main()
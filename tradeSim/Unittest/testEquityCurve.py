@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from tradeSim import TradeSim
+from tradeSim import EquityCurve
+
+
+class TestEquityCurve(unittest.TestCase):
+
+    def test_sample_every_n_ticks(self):
+        curve = EquityCurve.equityCurve(capacity=10, every_ticks=3, every_seconds=None)
+        kept = [curve.record(100.0 + i, 110.0, -1.0) for i in range(7)]
+
+        self.assertEqual(kept, [True, False, False, True, False, False, True])
+        self.assertEqual(curve.to_array()[:, 1].tolist(), [100.0, 103.0, 106.0])
+
+    def test_sample_every_m_seconds(self):
+        curve = EquityCurve.equityCurve(capacity=10, every_seconds=60.0)
+        start = pd.Timestamp("2025-07-09 10:00:00").timestamp()
+        for second in (0, 20, 59, 60, 90, 125):
+            curve.record(100.0 + second, 200.0, 0.0, start + second)
+
+        frame = curve.to_frame()
+        self.assertEqual(frame["NAV"].tolist(), [100.0, 160.0, 225.0])
+        self.assertEqual(frame["Time"].iloc[1], pd.Timestamp("2025-07-09 10:01:00"))
+
+    def test_ring_buffer_keeps_newest(self):
+        curve = EquityCurve.equityCurve(capacity=4, every_ticks=1, every_seconds=None)
+        for i in range(10):
+            curve.record(float(i), 9.0, 0.0)
+
+        self.assertEqual(len(curve), 4)
+        self.assertEqual(curve.to_array()[:, 1].tolist(), [6.0, 7.0, 8.0, 9.0])
+
+    def test_portfolio_records_nav_and_drawdown(self):
+        sim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False,
+                                equity_curve=EquityCurve.equityCurve(every_ticks=1))
+        row = {
+            'ShareCode': "AOT",
+            'LastPrice': 50.0,
+            'Volume': 100000,
+            'Flag': 'Sell',
+            'TradeDateTime': pd.Timestamp("2025-07-09 10:00:00"),
+        }
+        sim.create_order_to_limit(10000, 50.0, "Buy", "AOT", 100000, 100000, row)
+        sim.isMatch(row)
+        for price in (50.0, 52.0, 49.0):
+            sim.update_market_prices({"AOT": price}, row["TradeDateTime"])
+
+        portfolio = sim.portfolio
+        frame = portfolio.get_equity_curve().to_frame()
+        self.assertEqual(len(frame), 3)
+        self.assertEqual(frame["NAV"].iloc[-1], portfolio.get_nav())
+        self.assertEqual(frame["Peak NAV"].iloc[-1], portfolio.get_max_nav())
+        self.assertAlmostEqual(frame["Drawdown (%)"].iloc[-1], (portfolio.get_nav() - portfolio.get_max_nav()) / portfolio.get_max_nav() * 100)
+        self.assertLess(portfolio.get_drawdown(), 0.0)
+        self.assertEqual(frame["Time"].iloc[0], pd.Timestamp("2025-07-09 10:00:00"))
+
+    def test_save_csv_appends(self):
+        curve = EquityCurve.equityCurve(every_ticks=1)
+        curve.record(100.0, 100.0, 0.0, pd.Timestamp("2025-07-09 10:00:00").timestamp())
+        with tempfile.TemporaryDirectory() as folder:
+            file_path = os.path.join(folder, "curve.csv")
+            curve.save_csv(file_path)
+            curve.save_csv(file_path)
+            frame = pd.read_csv(file_path)
+
+        self.assertEqual(list(frame.columns), list(EquityCurve.equityCurve.COLUMNS))
+        self.assertEqual(frame["Time"].tolist(), ["2025-07-09 10:00:00"] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -152,6 +152,21 @@ class TestExecution(unittest.TestCase):
 
         self.assertTrue(len(self.strategyHandler.get_all_stocks_info()) == 0)
 
+    def test_market_sell_logs_the_sold_volume(self):
+        self.strategyHandler.process_row(self.mock_market_row(price=30, volume=1000, flag='Sell'))
+        self.strategyHandler.create_order_at_market(volume=100, side='Buy', symbol=self.symbol)
+        held = self.strategyHandler.get_total_stock_volume_by_symbol(self.symbol)
+        cash = self.tradeSim.portfolio.get_cash_balance()
+
+        # an order over the holdings, as if they had been sold since it was checked
+        order = Order.order.create(self.tradeSim.portfolio, held + 100, 30.0, "Sell", self.symbol, 10000, 10000,
+                                   timestamp=self.timestamp, check_position=False)
+        self.tradeSim.execution._process_market_order(order)
+
+        self.assertEqual(self.tradeSim.execution.tranLog.transaction_log[-1]["Volume"], held)
+        self.assertEqual(self.strategyHandler.get_total_stock_volume_by_symbol(self.symbol), 0)
+        self.assertGreater(self.tradeSim.portfolio.get_cash_balance(), cash)
+
     def test_order_calculation_match_success_market(self):
         self.strategyHandler.process_row(self.mock_market_row(price=58, volume=1000, flag='Sell'))
         self.strategyHandler.create_order_at_market(volume=100, side='Buy', symbol=self.symbol)
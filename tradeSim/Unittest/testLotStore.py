@@ -0,0 +1,105 @@
+import unittest
+import pandas as pd
+from tradeSim import TradeSim
+from tradeSim import Portfolio
+from tradeSim import Stock
+from tradeSim import LotStore
+
+
+class TestLotStore(unittest.TestCase):
+
+    def setUp(self):
+        self.objects = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        self.array = TradeSim.tradeSim(team_name="TestTeam", load_existing=False, lot_store="array")
+
+    def mock_market_row(self, symbol, price, time):
+        return {
+            'ShareCode': symbol,
+            'LastPrice': price,
+            'Volume': 100000,
+            'Flag': 'Sell',
+            'TradeDateTime': pd.Timestamp(time),
+        }
+
+    def trade(self, volume, price, side, symbol="AOT", time="2025-07-09 12:35:37"):
+        row = self.mock_market_row(symbol, price, time)
+        for sim in (self.objects, self.array):
+            sim.create_order_to_limit(volume, price, side, symbol, 100000, 100000, row)
+            sim.isMatch(row)
+
+    def assert_same_portfolio(self):
+        objects, array = self.objects.portfolio, self.array.portfolio
+        self.assertEqual(objects.get_portfolio_info(), array.get_portfolio_info())
+        for expected, actual in zip(objects.get_all_stocks_info(), array.get_all_stocks_info()):
+            self.assertEqual(expected.keys(), actual.keys())
+            for key in expected:
+                if isinstance(expected[key], float):
+                    self.assertAlmostEqual(expected[key], actual[key], places=6)
+                else:
+                    self.assertEqual(expected[key], actual[key])
+        self.assertEqual(
+            [s.to_dict() for s in objects.get_stocks_list()],
+            [s.to_dict() for s in array.get_stocks_list()],
+        )
+
+    def test_array_store_matches_objects(self):
+        self.trade(100, 58.0, "Buy", time="2025-07-09 12:35:37")
+        self.trade(200, 34.0, "Buy", symbol="PTT", time="2025-07-09 12:35:38")
+        self.trade(300, 58.5, "Buy", time="2025-07-09 12:35:39")
+        for sim in (self.objects, self.array):
+            sim.update_market_prices({"AOT": 59.25, "PTT": 33.5})
+        self.assert_same_portfolio()
+
+        self.trade(200, 59.0, "Sell", time="2025-07-09 12:35:43")
+        self.trade(100, 33.75, "Sell", symbol="PTT", time="2025-07-09 12:35:44")
+        self.assert_same_portfolio()
+
+    def test_many_lots_sold_oldest_first(self):
+        for i in range(40):
+            self.trade(100, 58.0 + i * 0.25, "Buy", time=pd.Timestamp("2025-07-09 10:00:00") + pd.Timedelta(seconds=i))
+        self.trade(2500, 70.0, "Sell", time="2025-07-09 11:00:00")
+        for i in range(40, 60):
+            self.trade(100, 58.0 + i * 0.25, "Buy", time=pd.Timestamp("2025-07-09 12:00:00") + pd.Timedelta(seconds=i))
+
+        lots = self.array.portfolio.get_stock_by_symbol("AOT")
+        self.assertEqual(len(lots), 35)
+        self.assertEqual(
+            [lot.get_buy_price() for lot in lots],
+            [lot.get_buy_price() for lot in self.objects.portfolio.get_stock_by_symbol("AOT")],
+        )
+        self.assertEqual([lot.buy_time for lot in lots], sorted(lot.buy_time for lot in lots))
+        self.assert_same_portfolio()
+
+    def test_lots_are_stocks(self):
+        self.trade(100, 58.0, "Buy")
+        lot = self.array.portfolio.get_stock_by_symbol("AOT")[0]
+
+        self.assertIsInstance(lot, Stock.stock)
+        self.assertEqual(lot.get_symbol(), "AOT")
+        self.assertEqual(lot.get_stock_info(), self.objects.portfolio.get_stock_by_symbol("AOT")[0].get_stock_info())
+        # strategies still cannot sell a lot themselves
+        with self.assertRaises(ValueError):
+            lot.decreaseStockVolume(100)
+
+    def test_insert_keeps_time_order(self):
+        lots = LotStore.arrayLots("AOT", capacity=2)
+        lots.append(Stock.stock("AOT", 100, 58.0, 58.0, 3.0))
+        lots.append(Stock.stock("AOT", 100, 58.5, 58.5, 4.0))
+        # late fills of older orders go before the newer lots, the array grows past its capacity
+        position = Portfolio.position("AOT", lots)
+        position.add_lot(Stock.stock("AOT", 100, 57.0, 57.0, 1.0))
+        position.add_lot(Stock.stock("AOT", 100, 57.5, 57.5, 2.0))
+        self.assertEqual([lot.buy_time for lot in lots], [1.0, 2.0, 3.0, 4.0])
+
+        lots.popleft()
+        lots.mark(60.0, 58.0)
+        self.assertEqual([lot.get_market_value() for lot in lots], [6000.0] * 3)
+        self.assertEqual([lot.get_unrealized() for lot in lots], [200.0] * 3)
+
+    def test_invalid_lot_store(self):
+        with self.assertRaises(ValueError):
+            Portfolio.portfolio("TestTeam", lot_store="columns")
+
+
+if __name__ == '__main__':
+    unittest.main()
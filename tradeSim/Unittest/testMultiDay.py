@@ -0,0 +1,148 @@
+import unittest
+import os
+import shutil
+import pandas as pd
+from tradeSim import MultiDay
+from tradeSim import Portfolio
+from tradeSim import TradeSim
+from strategy.Strategies_template import Strategy_template
+
+TEAM = "MultiDayTeam"
+orders = []
+
+
+class buy_low_sell_high(Strategy_template):
+    """
+    Buys 100 shares IOC at prices below 58 and sells 100 IOC above 59, without any state.
+    """
+
+    def __init__(self, handler):
+        super().__init__(TEAM, "buy_low_sell_high", handler)
+
+    def on_data(self, row):
+        price = row["LastPrice"]
+        if price < 58.0:
+            self.handler.create_order_to_limit(100, price, "Buy", row["ShareCode"], time_in_force="IOC")
+        elif price > 59.0 and self.handler.check_port_has_stock(row["ShareCode"], 100):
+            self.handler.create_order_to_limit(100, price, "Sell", row["ShareCode"], time_in_force="IOC")
+
+
+class resting_orders(Strategy_template):
+    """
+    On its first tick places a DAY and a GTC buy below the market, that fill the next day.
+    """
+
+    def __init__(self, handler):
+        super().__init__(TEAM, "resting_orders", handler)
+        self.placed = False
+
+    def on_data(self, row):
+        if not self.placed:
+            self.placed = True
+            orders.append(self.handler.create_order_to_limit(100, 50.0, "Buy", row["ShareCode"], time_in_force="DAY"))
+            orders.append(self.handler.create_order_to_limit(200, 50.0, "Buy", row["ShareCode"]))
+
+
+def mock_day(day, prices):
+    n = len(prices)
+    return pd.DataFrame({
+        "ShareCode": ["AOT"] * n,
+        "TradeDateTime": pd.date_range(f"{day} 10:00:00", periods=n, freq="min"),
+        "LastPrice": prices,
+        "Volume": [1000] * n,
+        "Value": [price * 1000 for price in prices],
+        "Flag": ["Sell", "Buy"] * (n // 2),
+    })
+
+
+def mock_days():
+    return [
+        mock_day("2025-07-09", [58.0, 57.75, 57.5, 59.25, 59.5, 60.0]),
+        mock_day("2025-07-10", [59.0, 57.0, 56.5, 56.0, 55.5, 55.0]),
+        mock_day("2025-07-11", [58.5, 59.25, 57.75, 59.5, 60.25, 59.75]),
+    ]
+
+
+class TestMultiDay(unittest.TestCase):
+
+    def setUp(self):
+        orders.clear()
+        shutil.rmtree(os.path.join("result", TEAM), ignore_errors=True)
+
+    def tearDown(self):
+        shutil.rmtree(os.path.join("result", TEAM), ignore_errors=True)
+
+    def read_csv(self, suffix):
+        return pd.read_csv(os.path.join("result", TEAM, f"{TEAM}_{suffix}"))
+
+    def test_matches_saving_and_loading_every_day(self):
+        for ticks in mock_days():
+            sim = TradeSim.tradeSim(TEAM)
+            sim.get_engine(buy_low_sell_high).stream(ticks)
+            sim.save_portfolio()
+        daily = sim.portfolio
+        shutil.rmtree(os.path.join("result", TEAM))
+
+        runner = MultiDay.multiDayRunner(TEAM, buy_low_sell_high, load_existing=False)
+        runner.run(mock_days())
+        continuous = runner.tradeSim.portfolio
+
+        self.assertEqual(continuous.get_cash_balance(), daily.get_cash_balance())
+        self.assertEqual(continuous.get_realized(), daily.get_realized())
+        self.assertEqual(continuous.get_number_of_sells(), daily.get_number_of_sells())
+        self.assertEqual(continuous.get_number_of_wins(), daily.get_number_of_wins())
+        self.assertEqual(continuous.get_all_stocks_info(), daily.get_all_stocks_info())
+        self.assertEqual(runner.days, 3)
+
+    def test_drawdown_spans_days_and_survives_a_checkpoint(self):
+        runner = MultiDay.multiDayRunner(TEAM, buy_low_sell_high, checkpoint_every=1, load_existing=False)
+        days = mock_days()
+        runner.run_day(days[0])
+        peak = runner.tradeSim.portfolio.get_max_nav()
+        runner.run_day(days[1])
+        portfolio = runner.tradeSim.portfolio
+
+        # the peak of the first day is kept, the second day's trough is measured from it
+        self.assertEqual(portfolio.get_max_nav(), peak)
+        self.assertAlmostEqual(portfolio.get_max_draw_down(), (portfolio.get_min_nav() - peak) / peak * 100)
+
+        loaded = Portfolio.portfolio.load_from_file(TEAM)
+        self.assertEqual(loaded.get_max_nav(), peak)
+        self.assertEqual(loaded.get_min_nav(), portfolio.get_min_nav())
+        self.assertEqual(loaded.cashbalance_start, portfolio.get_cash_balance())
+
+    def test_day_orders_expire_and_gtc_orders_rest_overnight(self):
+        runner = MultiDay.multiDayRunner(TEAM, resting_orders, load_existing=False)
+        days = mock_days()
+        runner.run_day(days[0])
+        self.assertEqual([o["Volume"] for o in runner.tradeSim.get_open_orders()], [200])
+        self.assertEqual(runner.engine.handlers["AOT"].cum_buy_volume, 0)
+
+        runner.run_day(mock_day("2025-07-10", [51.0, 50.0, 50.5, 51.0]))
+        self.assertEqual(runner.tradeSim.get_open_orders(), [])
+        self.assertEqual(runner.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT"), 200)
+        self.assertEqual(len(orders), 2)
+
+    def test_persists_at_checkpoints_only(self):
+        runner = MultiDay.multiDayRunner(TEAM, buy_low_sell_high, checkpoint_every=2, load_existing=False)
+        days = mock_days()
+        runner.run_day(days[0])
+        self.assertFalse(os.path.exists(os.path.join("result", TEAM, f"{TEAM}_portfolio_summary.csv")))
+
+        runner.run_day(days[1])
+        self.assertEqual(len(self.read_csv("portfolio_summary.csv")), 2)
+        fills = len(self.read_csv("transaction_log.csv"))
+
+        runner.run([days[2]])
+        summary = self.read_csv("portfolio_summary.csv")
+        self.assertEqual(list(summary["Daily Ticks Time"].str[:10]), ["2025-07-09", "2025-07-10", "2025-07-11"])
+        self.assertEqual(summary["Cash Balance"].iloc[-1], round(runner.tradeSim.portfolio.get_cash_balance(), 2))
+        self.assertEqual(summary["cashbalance start"].iloc[1], summary["Cash Balance"].iloc[0])
+        transactions = self.read_csv("transaction_log.csv")
+        self.assertGreater(len(transactions), fills)
+        self.assertEqual(len(transactions), len(transactions.drop_duplicates()))
+        self.assertEqual(list(pd.to_datetime(self.read_csv("equity_curve.csv")["Time"]).dt.day.unique()), [9, 10, 11])
+
+
+if __name__ == '__main__':
+    unittest.main()
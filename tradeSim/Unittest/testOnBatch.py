@@ -0,0 +1,96 @@
+import unittest
+import pandas as pd
+from tradeSim import TradeSim
+from strategy.Strategies_template import Strategy_template
+
+BLOCK = 4
+blocks = []
+
+
+class every_block_on_data(Strategy_template):
+    """
+    Buys on the last tick of every block of BLOCK ticks, one on_data call per tick.
+    """
+
+    def __init__(self, handler):
+        super().__init__("TEST_OWNER", "every_block_on_data", handler)
+        self.count = 0
+
+    def on_data(self, row):
+        self.count += 1
+        if self.count % BLOCK == 0:
+            self.handler.create_order_to_limit(volume=100, price=row["LastPrice"], side="Buy", symbol=row["ShareCode"])
+
+
+class every_block_on_batch(Strategy_template):
+    batch_size = BLOCK
+
+    def __init__(self, handler):
+        super().__init__("TEST_OWNER", "every_block_on_batch", handler)
+
+    def on_data(self, row):
+        raise AssertionError("on_data is not called for batch strategies")
+
+    def on_batch(self, rows):
+        blocks.append((rows.size, rows["LastPrice"].tolist(), self.handler.cum_buy_volume, self.handler.cum_sell_volume))
+        if rows.size == BLOCK:
+            self.handler.create_order_to_limit(volume=100, price=rows["LastPrice"][-1], side="Buy", symbol=rows["ShareCode"][-1])
+
+
+def mock_ticks():
+    n = 10
+    times = pd.date_range("2025-07-09 10:00:00", periods=n, freq="s")
+    return pd.DataFrame({
+        "ShareCode": ["PTT"] * n + ["AOT"] * n,
+        "TradeDateTime": list(times) + list(times),
+        "LastPrice": [34.0 + 0.25 * i for i in range(n)] + [58.0 - 0.25 * i for i in range(n)],
+        "Volume": [1000] * (2 * n),
+        "Flag": ["Buy", "Sell"] * n,
+    })
+
+
+class TestOnBatch(unittest.TestCase):
+
+    def setUp(self):
+        blocks.clear()
+
+    def run_strategy(self, strategy_class):
+        sim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        sim.get_engine(strategy_class).stream(mock_ticks())
+        return sim
+
+    def test_blocks_of_consecutive_ticks(self):
+        self.run_strategy(every_block_on_batch)
+
+        self.assertEqual(sorted(size for size, _, _, _ in blocks), [2, 2, 4, 4, 4, 4])
+        ptt = [prices for _, prices, _, _ in blocks if prices[0] < 50]
+        self.assertEqual(ptt, [[34.0, 34.25, 34.5, 34.75], [35.0, 35.25, 35.5, 35.75], [36.0, 36.25]])
+        # cumulative volumes up to the block's last tick
+        self.assertEqual(blocks[0][2:], (2000, 2000))
+
+    def test_block_columns_are_read_only(self):
+        class writer(every_block_on_batch):
+            def on_batch(self, rows):
+                try:
+                    rows["LastPrice"][0] = 0.0
+                except ValueError as e:
+                    blocks.append(e)
+
+        self.run_strategy(writer)
+        self.assertTrue(blocks)
+        self.assertTrue(all(isinstance(e, ValueError) for e in blocks))
+
+    def test_orders_match_per_tick_strategy(self):
+        per_tick = self.run_strategy(every_block_on_data).portfolio
+        batched = self.run_strategy(every_block_on_batch).portfolio
+
+        self.assertEqual(per_tick.get_portfolio_info(), batched.get_portfolio_info())
+        self.assertEqual(
+            [s.to_dict() for s in per_tick.get_stocks_list()],
+            [s.to_dict() for s in batched.get_stocks_list()],
+        )
+        self.assertEqual(len(batched.get_stocks_list()), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
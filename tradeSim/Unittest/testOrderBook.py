@@ -0,0 +1,133 @@
+import unittest
+import pandas as pd
+from tradeSim import TradeSim
+
+
+class TestOrderBook(unittest.TestCase):
+
+    def setUp(self):
+        self.tradeSim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        self.book = self.tradeSim.execution.Orders_Book
+
+    def mock_market_row(self, symbol, price, volume=1000):
+        return {
+            'ShareCode': symbol,
+            'LastPrice': price,
+            'Volume': volume,
+            'Flag': 'Sell',
+            'TradeDateTime': pd.Timestamp("2025-07-09 12:35:37"),
+        }
+
+    def place(self, symbol, side, price, volume=100):
+        self.tradeSim.create_order_to_limit(volume, price, side, symbol, 10000, 10000, self.mock_market_row(symbol, price))
+
+    def test_orders_are_keyed_by_symbol(self):
+        self.place("AOT", "Buy", 58.0)
+        self.place("PTT", "Buy", 34.0)
+
+        self.tradeSim.isMatch(self.mock_market_row("PTT", 34.0))
+
+        self.assertEqual(self.tradeSim.execution.getOrderbooksSize(), 1)
+        self.assertEqual([o.get_symbol() for o in self.book], ["AOT"])
+
+    def test_non_marketable_order_keeps_resting(self):
+        self.place("AOT", "Buy", 58.0)
+
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 60.0))
+        self.assertEqual(self.tradeSim.execution.getOrderbooksSize(), 1)
+
+        # 58.25 is within the 0.25 slippage of the 58.0 limit
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 58.25))
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+    def test_sell_matches_only_at_or_above_threshold(self):
+        self.place("AOT", "Buy", 58.0, volume=200)
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 58.0))
+
+        self.place("AOT", "Sell", 60.0)
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 59.0))
+        self.assertEqual(self.tradeSim.execution.getOrderbooksSize(), 1)
+
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 59.75))
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+        self.assertEqual(self.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT"), 100)
+
+    def test_marketable_orders_are_returned_oldest_first(self):
+        self.place("AOT", "Buy", 59.0)
+        self.place("AOT", "Buy", 58.0)
+        self.place("AOT", "Buy", 60.0)
+        first, second, third = sorted(self.book, key=lambda o: o.get_order_number())
+
+        self.assertEqual(self.book.marketable("AOT", 58.0), [first, second, third])
+        self.assertEqual(self.book.marketable("AOT", 59.25), [first, third])
+        self.assertEqual(self.book.marketable("PTT", 58.0), [])
+
+    def test_remove_order(self):
+        self.place("AOT", "Buy", 58.0)
+        self.place("AOT", "Buy", 58.0)
+        first, second = sorted(self.book, key=lambda o: o.get_order_number())
+
+        self.assertTrue(self.book.remove(first))
+        self.assertFalse(self.book.remove(first))
+        self.assertEqual(list(self.book), [second])
+        self.assertNotIn(first, self.book)
+
+    def test_cancel_order(self):
+        self.place("AOT", "Buy", 58.0)
+        self.place("AOT", "Buy", 58.0)
+        first, second = sorted(self.book, key=lambda o: o.get_order_number())
+
+        result = self.tradeSim.cancel_order(first.get_order_number())
+        self.assertIn("cancelled successfully", str(result))
+        self.assertNotIn(first, self.book)
+        self.assertIsNone(self.book.get(first.get_order_number()))
+        self.assertEqual(self.book.marketable("AOT", 58.0), [second])
+
+        result = self.tradeSim.cancel_order(first.get_order_number())
+        self.assertIsInstance(result, ValueError)
+        self.assertIn("not in the order book", str(result))
+
+    def test_cancelled_slots_are_compacted(self):
+        for _ in range(self.book.COMPACT_MIN_DEAD + 1):
+            self.place("AOT", "Buy", 58.0)
+        orders = sorted(self.book, key=lambda o: o.get_order_number())
+
+        for order in orders[:-1]:
+            self.book.cancel(order.get_order_number())
+
+        keys, _ = self.book._books[("AOT", "Buy")]
+        self.assertEqual(len(keys), 1)
+        self.assertEqual(list(self.book), [orders[-1]])
+
+    def test_amend_price_loses_priority(self):
+        self.place("AOT", "Buy", 58.0)
+        self.place("AOT", "Buy", 58.0)
+        first, second = sorted(self.book, key=lambda o: o.get_order_number())
+
+        result = self.tradeSim.amend_order(first.get_order_number(), 58.5, None, 10000, 10000, self.mock_market_row("AOT", 58.0))
+        self.assertIn("amended successfully", str(result))
+        self.assertEqual(first.get_price(), 58.5)
+        self.assertEqual(self.book.marketable("AOT", 58.0), [second, first])
+        self.assertEqual(self.book.marketable("AOT", 58.5), [first])
+
+    def test_amend_volume_keeps_priority(self):
+        self.place("AOT", "Buy", 58.0, volume=300)
+        self.place("AOT", "Buy", 58.0)
+        first, second = sorted(self.book, key=lambda o: o.get_order_number())
+
+        self.tradeSim.amend_order(first.get_order_number(), None, 200, 10000, 10000, self.mock_market_row("AOT", 58.0))
+        self.assertEqual(first.get_volume(), 200)
+        self.assertEqual(self.book.marketable("AOT", 58.0), [first, second])
+
+    def test_invalid_amend_is_rejected(self):
+        self.place("AOT", "Buy", 58.0)
+        order = next(iter(self.book))
+
+        result = self.tradeSim.amend_order(order.get_order_number(), None, 150, 10000, 10000, self.mock_market_row("AOT", 58.0))
+        self.assertIsInstance(result, ValueError)
+        self.assertIn("Volume must be a multiple of 100.", str(result))
+        self.assertEqual(order.get_volume(), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+import pandas as pd
+from tradeSim import TradeSim
+
+
+class TestOrderGroup(unittest.TestCase):
+
+    def setUp(self):
+        self.tradeSim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        self.execution = self.tradeSim.execution
+
+    def mock_market_row(self, symbol, price, volume=1000):
+        return {
+            'ShareCode': symbol,
+            'LastPrice': price,
+            'Volume': volume,
+            'Flag': 'Sell',
+            'TradeDateTime': pd.Timestamp("2025-07-09 12:35:37"),
+        }
+
+    def tick(self, price, symbol="AOT", volume=1000):
+        self.tradeSim.isMatch(self.mock_market_row(symbol, price, volume))
+
+    def bracket(self, price=60.0, take_profit=62.0, stop_loss=58.0, volume=100, side="Buy"):
+        return self.tradeSim.create_bracket_order(
+            volume, price, side, "AOT", take_profit, stop_loss, 10000, 10000, self.mock_market_row("AOT", 61.0)
+        )
+
+    def open_order_types(self):
+        return sorted(o["Order Type"] for o in self.tradeSim.get_open_orders("AOT"))
+
+    def volume(self):
+        return self.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT")
+
+    def test_exits_are_placed_when_entry_fills(self):
+        result = self.bracket()
+        self.assertIn("created successfully", str(result))
+        self.assertEqual(self.open_order_types(), ["LIMIT"])
+
+        self.tick(60.0)
+        self.assertEqual(self.volume(), 100)
+        self.assertEqual(self.open_order_types(), ["LIMIT", "STOP"])
+        self.assertTrue(all(o["Side"] == "Sell" for o in self.tradeSim.get_open_orders("AOT")))
+
+    def test_take_profit_cancels_stop_loss(self):
+        self.bracket()
+        self.tick(60.0)
+
+        self.tick(62.0)
+        self.assertEqual(self.volume(), 0)
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+        self.assertEqual(len(self.execution.Order_Groups), 0)
+
+    def test_stop_loss_cancels_take_profit(self):
+        self.bracket()
+        self.tick(60.0)
+
+        self.tick(57.75)
+        self.assertEqual(self.volume(), 0)
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+        self.assertEqual(len(self.execution.Order_Groups), 0)
+
+    def test_cancelled_entry_drops_exits(self):
+        self.bracket()
+        entry = self.tradeSim.get_open_orders("AOT")[0]["Order Number"]
+
+        self.tradeSim.cancel_order(entry)
+        self.tick(60.0)
+        self.tick(57.0)
+        self.assertEqual(self.volume(), 0)
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+        self.assertEqual(len(self.execution.Order_Groups), 0)
+
+    def test_partial_entry_fills_grow_exits(self):
+        self.execution.participation_rate = 0.1
+        self.bracket(volume=300)
+
+        self.tick(60.0, volume=1000)
+        exits = [o for o in self.tradeSim.get_open_orders("AOT") if o["Side"] == "Sell"]
+        self.assertEqual([o["Volume"] for o in exits], [100, 100])
+
+        self.tick(60.0, volume=2000)
+        exits = [o for o in self.tradeSim.get_open_orders("AOT") if o["Side"] == "Sell"]
+        self.assertEqual([o["Volume"] for o in exits], [300, 300])
+        self.assertEqual(self.volume(), 300)
+
+        # a partial take profit reduces the stop loss by the same volume
+        self.tick(62.0, volume=1000)
+        stop_loss = [o for o in self.tradeSim.get_open_orders("AOT") if o["Order Type"] == "STOP"]
+        self.assertEqual(stop_loss[0]["Volume"], 200)
+        self.assertEqual(self.volume(), 200)
+
+    def test_fill_after_the_exits_left_gets_new_exits(self):
+        self.execution.participation_rate = 0.5
+        self.bracket(volume=200)
+
+        self.tick(60.0, volume=200)
+        self.tick(62.0, volume=200)
+        self.assertEqual(self.volume(), 0)
+        self.assertEqual(self.open_order_types(), ["LIMIT"])
+
+        # the rest of the entry fills after its take profit filled and cancelled the stop loss
+        self.tick(60.0, volume=200)
+        self.assertEqual(self.volume(), 100)
+        exits = [o for o in self.tradeSim.get_open_orders("AOT") if o["Side"] == "Sell"]
+        self.assertEqual(sorted((o["Order Type"], o["Volume"]) for o in exits), [("LIMIT", 100), ("STOP", 100)])
+
+        self.tick(57.75, volume=200)
+        self.assertEqual(self.volume(), 0)
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+        self.assertEqual(len(self.execution.Order_Groups), 0)
+
+    def test_take_profit_without_holdings_is_rejected(self):
+        self.bracket(price=58.0, take_profit=60.0, stop_loss=55.0)
+        self.tick(58.0)
+        self.tradeSim.create_order_to_limit(100, 59.0, "Sell", "AOT", 10000, 10000, self.mock_market_row("AOT", 58.0))
+        self.tick(59.0)
+        self.assertEqual(self.volume(), 0)
+        cash = self.tradeSim.portfolio.get_cash_balance()
+
+        self.tick(60.0)
+        self.assertEqual(self.volume(), 0)
+        self.assertEqual(self.tradeSim.portfolio.get_cash_balance(), cash)
+        self.assertEqual(self.open_order_types(), ["STOP"])
+        counts = self.tradeSim.error_logger.get_rejection_counts()["by_code"]
+        self.assertEqual(counts, {"INSUFFICIENT_HOLDINGS": 1})
+
+    def test_invalid_bracket_is_rejected(self):
+        result = self.bracket(take_profit=59.0, stop_loss=58.0)
+        self.assertIsInstance(result, ValueError)
+        self.assertIn("not being on either side", str(result))
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+    def test_oco_group(self):
+        for price in (58.0, 55.0):
+            self.tradeSim.create_order_to_limit(100, price, "Buy", "AOT", 10000, 10000, self.mock_market_row("AOT", 60.0))
+        first, second = [o["Order Number"] for o in self.tradeSim.get_open_orders("AOT")]
+
+        result = self.tradeSim.create_oco_group([first, second])
+        self.assertIn("created successfully", str(result))
+        self.assertIsInstance(self.tradeSim.create_oco_group([first, second]), ValueError)
+        self.assertIsInstance(self.tradeSim.create_oco_group([first, "ORD99999"]), ValueError)
+
+        self.tick(58.0)
+        self.assertEqual(self.volume(), 100)
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+        self.tick(55.0)
+        self.assertEqual(self.volume(), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
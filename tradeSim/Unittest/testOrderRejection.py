@@ -0,0 +1,134 @@
+import unittest
+import os
+import pandas as pd
+from tradeSim import TradeSim
+from tradeSim import Order
+from tradeSim.OrderRejection import rejectReason, orderRejection
+
+
+class TestOrderRejection(unittest.TestCase):
+
+    def setUp(self):
+        self.tradeSim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        self.logger = self.tradeSim.error_logger
+
+    def mock_market_row(self, symbol, price, time="2025-07-09 12:35:37"):
+        return {
+            'ShareCode': symbol,
+            'LastPrice': price,
+            'Volume': 1000,
+            'Flag': 'Sell',
+            'TradeDateTime': pd.Timestamp(time),
+        }
+
+    def place(self, volume, price, side, symbol, **kwargs):
+        return self.tradeSim.create_order_to_limit(
+            volume, price, side, symbol, 10000, 10000, self.mock_market_row(symbol, price), **kwargs
+        )
+
+    def test_validate_order_returns_reason_code(self):
+        portfolio = self.tradeSim.portfolio
+        Order.order.load_set50_symbols()
+        cases = [
+            ((150, "Buy", "AOT"), rejectReason.INVALID_LOT),
+            ((100, "Hold", "AOT"), rejectReason.INVALID_SIDE),
+            ((100, "Buy", "XYZ"), rejectReason.NOT_IN_SET50),
+            ((1000000, "Buy", "AOT"), rejectReason.INSUFFICIENT_CASH),
+            ((100, "Sell", "AOT"), rejectReason.INSUFFICIENT_HOLDINGS),
+            ((20000, "Buy", "AOT"), rejectReason.EXCEEDS_SELL_VOLUME),
+            ((100, "Buy", "AOT"), rejectReason.OK),
+        ]
+        for (volume, side, symbol), code in cases:
+            self.assertIs(
+                Order.order.validate_order(volume, side, symbol, portfolio, 58.0, 10000, 10000), code
+            )
+
+    def test_rejected_order_is_returned_not_raised(self):
+        result = self.place(150, 58.0, "Buy", "AOT")
+
+        self.assertIsInstance(result, orderRejection)
+        self.assertIsInstance(result, ValueError)
+        self.assertIs(result.code, rejectReason.INVALID_LOT)
+        self.assertEqual(
+            str(result),
+            "[ERROR] Order for AOT (Vol: 150, Price: 58.0, Side: Buy) skipped due to Volume must be a multiple of 100.",
+        )
+
+        result = self.place(100, 58.0, "Buy", "AOT", time_in_force="GTD")
+        self.assertIn("Invalid time in force 'GTD'", str(result))
+
+    def test_constructor_still_raises(self):
+        with self.assertRaises(orderRejection) as context:
+            Order.order(self.tradeSim.portfolio, 100, 58.0, "Buy", "XYZ", 10000, 10000)
+        self.assertIs(context.exception.code, rejectReason.NOT_IN_SET50)
+
+        created = Order.order.create(self.tradeSim.portfolio, 100, 58.0, "Buy", "AOT", 10000, 10000)
+        self.assertIsInstance(created, Order.order)
+
+    def test_logger_counts_repeated_rejections(self):
+        for _ in range(5):
+            self.place(100, 58.0, "Sell", "AOT")
+        for _ in range(2):
+            self.place(100, 34.0, "Sell", "PTT")
+        self.place(150, 58.0, "Buy", "AOT")
+
+        # repeats are counted but logged once
+        self.assertEqual(len(self.logger.error_log), 3)
+        counts = self.logger.get_rejection_counts()
+        self.assertEqual(counts["by_code"], {"INSUFFICIENT_HOLDINGS": 7, "INVALID_LOT": 1})
+        self.assertEqual(
+            counts["by_symbol"],
+            {"AOT": {"INSUFFICIENT_HOLDINGS": 5, "INVALID_LOT": 1}, "PTT": {"INSUFFICIENT_HOLDINGS": 2}},
+        )
+
+    def test_flush_writes_each_rejection_once(self):
+        if os.path.exists(self.logger.txt_file):
+            os.remove(self.logger.txt_file)
+        for _ in range(2):
+            self.place(100, 58.0, "Sell", "AOT")
+        self.logger.flush_logs()
+        self.assertEqual(self.logger.error_log, [])
+
+        self.place(100, 34.0, "Sell", "PTT")
+        self.logger.flush_logs()
+        self.logger.flush_logs()
+
+        with open(self.logger.txt_file, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertIn("AOT", lines[0])
+        self.assertTrue(lines[1].endswith("[SUMMARY] 2 orders rejected with INSUFFICIENT_HOLDINGS (AOT: 2)"))
+        self.assertIn("PTT", lines[2])
+        self.assertTrue(lines[3].endswith("[SUMMARY] 1 orders rejected with INSUFFICIENT_HOLDINGS (PTT: 1)"))
+
+    def test_repeated_rejection_is_written_again_after_a_flush(self):
+        if os.path.exists(self.logger.txt_file):
+            os.remove(self.logger.txt_file)
+        self.place(100, 58.0, "Sell", "AOT")
+        self.logger.flush_logs()
+        self.place(100, 58.0, "Sell", "AOT")
+        self.assertEqual(len(self.logger.error_log), 1)
+        self.logger.flush_logs()
+
+        with open(self.logger.txt_file, encoding="utf-8") as f:
+            messages = [line.split(" | ", 1)[1] for line in f.read().splitlines() if "[SUMMARY]" not in line]
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(messages[0], messages[1])
+
+    def test_amend_and_bracket_rejections_carry_codes(self):
+        self.place(100, 57.0, "Buy", "AOT")
+        order_number = self.tradeSim.get_open_orders()[0]["Order Number"]
+
+        result = self.tradeSim.amend_order(order_number, None, 150, 10000, 10000, self.mock_market_row("AOT", 58.0))
+        self.assertIs(result.code, rejectReason.INVALID_LOT)
+        self.assertIn(f"Amend of order {order_number}", str(result))
+
+        result = self.tradeSim.create_bracket_order(
+            100, 58.0, "Buy", "AOT", 57.0, 59.0, 10000, 10000, self.mock_market_row("AOT", 58.0)
+        )
+        self.assertIs(result.code, rejectReason.INVALID_BRACKET_PRICES)
+        self.assertIn("take profit 57.0 and stop loss 59.0", str(result))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import pandas as pd
+from tradeSim import TradeSim
+
+
+class TestPartialFill(unittest.TestCase):
+
+    def setUp(self):
+        self.tradeSim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False, participation_rate=0.1)
+        self.book = self.tradeSim.execution.Orders_Book
+        self.tranLog = self.tradeSim.execution.tranLog.transaction_log
+        self.tranLog.clear()
+
+    def mock_market_row(self, symbol, price, volume=1000):
+        return {
+            'ShareCode': symbol,
+            'LastPrice': price,
+            'Volume': volume,
+            'Flag': 'Sell',
+            'TradeDateTime': pd.Timestamp("2025-07-09 12:35:37"),
+        }
+
+    def place(self, symbol, side, price, volume, time_in_force="GTC"):
+        return self.tradeSim.create_order_to_limit(
+            volume, price, side, symbol, 100000, 100000, self.mock_market_row(symbol, price), time_in_force=time_in_force
+        )
+
+    def test_order_fills_up_to_share_of_tick_volume(self):
+        self.place("AOT", "Buy", 58.0, 500)
+        order = next(iter(self.book))
+
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 58.0, volume=2000))
+        self.assertEqual(order.get_filled_volume(), 200)
+        self.assertEqual(order.get_remaining_volume(), 300)
+        self.assertIn(order, self.book)
+
+        # 10% of 900 is rounded down to one board lot
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 58.0, volume=900))
+        self.assertEqual(order.get_filled_volume(), 200)
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 58.0, volume=1500))
+        self.assertEqual(order.get_filled_volume(), 300)
+
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 58.0, volume=100000))
+        self.assertTrue(order.is_filled())
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+        self.assertEqual(self.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT"), 500)
+        self.assertEqual([t["Volume"] for t in self.tranLog], [200, 100, 200])
+
+    def test_tick_volume_is_shared_oldest_first(self):
+        self.place("AOT", "Buy", 58.0, 300)
+        self.place("AOT", "Buy", 58.0, 300)
+        first, second = sorted(self.book, key=lambda o: o.get_order_number())
+
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 58.0, volume=4000))
+        self.assertEqual(first.get_filled_volume(), 300)
+        self.assertEqual(second.get_filled_volume(), 100)
+        self.assertEqual(list(self.book), [second])
+
+    def test_partial_sell_realizes_filled_volume(self):
+        self.place("AOT", "Buy", 58.0, 400, time_in_force="IOC")
+        self.assertEqual(self.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT"), 100)
+
+        self.tradeSim.execution.participation_rate = 1
+        self.place("AOT", "Buy", 58.0, 300)
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 58.0, volume=1000))
+        self.tradeSim.execution.participation_rate = 0.1
+
+        self.place("AOT", "Sell", 60.0, 400)
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 60.0, volume=2000))
+        self.assertEqual(self.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT"), 200)
+        self.assertEqual(self.tranLog[-1]["Volume"], 200)
+        self.assertEqual(self.tranLog[-1]["Side"], "Sell")
+
+    def test_ioc_cancels_unfilled_rest(self):
+        result = self.place("AOT", "Buy", 58.0, 400, time_in_force="IOC")
+        self.assertIn("partially filled (100 of 400)", str(result))
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+    def test_fok_needs_whole_volume(self):
+        result = self.place("AOT", "Buy", 58.0, 400, time_in_force="FOK")
+        self.assertIn("could not be filled", str(result))
+        self.assertEqual(self.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT"), 0)
+
+        result = self.place("AOT", "Buy", 58.0, 100, time_in_force="FOK")
+        self.assertIn("successfully", str(result))
+
+    def test_amend_below_filled_volume_is_rejected(self):
+        self.place("AOT", "Buy", 58.0, 500)
+        order = next(iter(self.book))
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 58.0, volume=2000))
+
+        result = self.tradeSim.amend_order(order.get_order_number(), None, 200, 100000, 100000, self.mock_market_row("AOT", 58.0))
+        self.assertIsInstance(result, ValueError)
+        self.assertIn("filled volume", str(result))
+
+        result = self.tradeSim.amend_order(order.get_order_number(), None, 300, 100000, 100000, self.mock_market_row("AOT", 58.0))
+        self.assertIn("amended successfully", str(result))
+        self.assertEqual(order.get_remaining_volume(), 100)
+
+    def test_invalid_participation_rate(self):
+        with self.assertRaises(ValueError):
+            TradeSim.tradeSim(team_name="TestTeam", load_existing=False, participation_rate=1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
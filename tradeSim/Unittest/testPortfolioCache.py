@@ -0,0 +1,73 @@
+import unittest
+from unittest import mock
+import pandas as pd
+from tradeSim import TradeSim
+from tradeSim import Portfolio
+
+
+class TestPortfolioCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tradeSim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        self.portfolio = self.tradeSim.portfolio
+
+    def trade(self, volume, price, side, symbol="AOT"):
+        row = {
+            'ShareCode': symbol,
+            'LastPrice': price,
+            'Volume': 100000,
+            'Flag': 'Sell',
+            'TradeDateTime': pd.Timestamp("2025-07-09 12:35:37"),
+        }
+        self.tradeSim.create_order_to_limit(volume, price, side, symbol, 100000, 100000, row)
+        self.tradeSim.isMatch(row)
+
+    def builds(self, name):
+        return mock.patch.object(
+            Portfolio.portfolio, name, autospec=True, side_effect=getattr(Portfolio.portfolio, name)
+        )
+
+    def test_repeated_reads_are_cached(self):
+        self.trade(100, 58.0, "Buy")
+        self.tradeSim.update_market_prices({"AOT": 59.0})
+
+        with self.builds("_build_portfolio_info") as info, self.builds("_build_all_stocks_info") as stocks:
+            for _ in range(5):
+                self.portfolio.get_portfolio_info()
+                self.portfolio.get_all_stocks_info()
+            # a price of a symbol that is not held or a price that did not change
+            self.tradeSim.update_market_prices({"PTT": 34.0})
+            self.tradeSim.update_market_prices({"AOT": 59.0})
+            self.portfolio.get_portfolio_info()
+            self.portfolio.get_all_stocks_info()
+
+        self.assertEqual(info.call_count, 1)
+        self.assertEqual(stocks.call_count, 1)
+
+    def test_fill_and_price_update_invalidate(self):
+        self.trade(100, 58.0, "Buy")
+        self.assertEqual(self.portfolio.get_all_stocks_info()[0]["Actual Volume"], 100)
+
+        self.trade(200, 58.0, "Buy")
+        self.assertEqual(self.portfolio.get_all_stocks_info()[0]["Actual Volume"], 300)
+        self.assertEqual(self.portfolio.get_portfolio_info()["Cash Balance"], round(self.portfolio.get_cash_balance(), 2))
+
+        self.tradeSim.update_market_prices({"AOT": 60.0})
+        self.assertEqual(self.portfolio.get_all_stocks_info()[0]["Market Value"], 18000.0)
+        self.assertEqual(self.portfolio.get_portfolio_info()["Net Asset Value"], round(self.portfolio.get_nav(), 2))
+
+        self.trade(300, 60.0, "Sell")
+        self.assertEqual(self.portfolio.get_all_stocks_info(), [])
+        self.assertEqual(self.portfolio.get_portfolio_info()["Number of Sells"], self.portfolio.get_number_of_sells())
+
+    def test_callers_get_copies(self):
+        self.trade(100, 58.0, "Buy")
+        self.portfolio.get_portfolio_info()["Cash Balance"] = 0
+        self.portfolio.get_all_stocks_info()[0]["Actual Volume"] = 0
+
+        self.assertNotEqual(self.portfolio.get_portfolio_info()["Cash Balance"], 0)
+        self.assertEqual(self.portfolio.get_all_stocks_info()[0]["Actual Volume"], 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import pandas as pd
+from tradeSim import TradeSim
+
+
+class TestPosition(unittest.TestCase):
+
+    def setUp(self):
+        self.tradeSim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        self.portfolio = self.tradeSim.portfolio
+
+    def mock_market_row(self, symbol, price, time="2025-07-09 12:35:37"):
+        return {
+            'ShareCode': symbol,
+            'LastPrice': price,
+            'Volume': 100000,
+            'Flag': 'Sell',
+            'TradeDateTime': pd.Timestamp(time),
+        }
+
+    def trade(self, volume, price, side, symbol="AOT", time="2025-07-09 12:35:37"):
+        row = self.mock_market_row(symbol, price, time)
+        self.tradeSim.create_order_to_limit(volume, price, side, symbol, 100000, 100000, row)
+        self.tradeSim.isMatch(row)
+
+    def lots_sum(self, symbol, field):
+        return sum(getattr(s, field)() for s in self.portfolio.get_stock_by_symbol(symbol))
+
+    def test_position_adds_up_lots(self):
+        self.trade(100, 58.0, "Buy", time="2025-07-09 12:35:37")
+        self.trade(200, 58.25, "Buy", time="2025-07-09 12:35:39")
+        self.trade(300, 58.5, "Buy", time="2025-07-09 12:35:41")
+        self.trade(200, 59.0, "Sell", time="2025-07-09 12:35:43")
+
+        position = self.portfolio.get_position("AOT")
+        self.assertEqual(position["Volume"], 400)
+        self.assertAlmostEqual(position["Total Cost"], self.lots_sum("AOT", "get_amount_cost"))
+        self.assertAlmostEqual(position["Market Value"], self.lots_sum("AOT", "get_market_value"))
+        self.assertAlmostEqual(position["Realized P&L"], self.portfolio.get_realized())
+
+        self.trade(400, 59.0, "Sell", time="2025-07-09 12:35:45")
+        self.assertIsNone(self.portfolio.get_position("AOT"))
+
+    def test_price_update_only_touches_the_position(self):
+        self.trade(100, 58.0, "Buy")
+        self.trade(200, 34.0, "Buy", symbol="PTT")
+        cash = self.portfolio.get_cash_balance()
+
+        self.tradeSim.update_market_prices({"AOT": 60.0})
+
+        self.assertEqual(self.portfolio.get_position("AOT")["Market Value"], 6000.0)
+        self.assertAlmostEqual(self.portfolio.get_nav(), cash + 6000.0 + 200 * 34.0)
+        # the lots follow when they are read
+        self.assertIn("AOT", self.portfolio._stale)
+        self.assertEqual(self.portfolio.stocksList[0].get_mkt_price(), 60.0)
+        lot = self.portfolio.get_stock_by_symbol("AOT")[0]
+        self.assertEqual(lot.get_mkt_price(), 60.0)
+        self.assertEqual(lot.get_market_value(), 6000.0)
+
+    def test_sell_does_not_record_nav_without_proceeds(self):
+        self.trade(1000, 58.0, "Buy")
+        self.tradeSim.update_market_prices({"AOT": 58.0})
+        nav = self.portfolio.get_nav()
+
+        self.trade(1000, 58.0, "Sell")
+        self.tradeSim.update_market_prices({"AOT": 58.0})
+
+        # the NAV only drops by the commission and slippage of the sale
+        self.assertGreater(self.portfolio.get_min_nav(), nav - 1000)
+        self.assertAlmostEqual(self.portfolio.get_nav(), self.portfolio.get_cash_balance())
+
+    def test_sell_consumes_oldest_lots_first(self):
+        self.trade(100, 58.0, "Buy", time="2025-07-09 12:35:37")
+        self.trade(200, 59.0, "Buy", time="2025-07-09 12:35:39")
+        self.trade(300, 60.0, "Buy", time="2025-07-09 12:35:41")
+
+        self.trade(200, 61.0, "Sell", time="2025-07-09 12:35:43")
+
+        lots = self.portfolio.get_stock_by_symbol("AOT")
+        self.assertEqual([lot.get_actual_vol() for lot in lots], [100, 300])
+        self.assertEqual([lot.get_mkt_price() for lot in lots], [59.0, 60.0])
+        self.assertTrue(self.portfolio.has_stock("AOT", 400))
+        self.assertFalse(self.portfolio.has_stock("AOT", 500))
+        self.assertEqual(self.portfolio.get_total_stock_volume_by_symbol("AOT"), 400)
+        self.assertEqual(self.portfolio.get_All_stock_count_by_symbol(), {"AOT": 2})
+
+    def test_late_fill_of_older_order_is_sold_first(self):
+        # a resting order placed first but filled after a newer order is still the older lot
+        self.tradeSim.create_order_to_limit(100, 57.0, "Buy", "AOT", 100000, 100000,
+                                            self.mock_market_row("AOT", 58.0, "2025-07-09 12:00:00"))
+        self.trade(200, 58.0, "Buy", time="2025-07-09 12:01:00")
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 57.0, "2025-07-09 12:02:00"))
+
+        lots = self.portfolio.get_stock_by_symbol("AOT")
+        self.assertEqual([lot.get_actual_vol() for lot in lots], [100, 200])
+        self.assertEqual([lot.get_symbol() for lot in self.portfolio.stocksList], ["AOT", "AOT"])
+
+        self.trade(100, 58.0, "Sell", time="2025-07-09 12:03:00")
+        self.assertEqual([lot.get_actual_vol() for lot in self.portfolio.get_stock_by_symbol("AOT")], [200])
+
+    def test_stocks_list_is_in_time_order_across_symbols(self):
+        self.trade(100, 58.0, "Buy", time="2025-07-09 12:00:00")
+        self.trade(100, 34.0, "Buy", symbol="PTT", time="2025-07-09 12:01:00")
+        self.trade(100, 58.0, "Buy", time="2025-07-09 12:02:00")
+
+        self.assertEqual([lot.get_symbol() for lot in self.portfolio.stocksList], ["AOT", "PTT", "AOT"])
+        self.assertEqual(self.portfolio.get_portfolio_info()["Number of Stocks"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import numpy as np
+import pandas as pd
+from tradeSim import TradeSim
+from tradeSim import SignalEngine
+from strategy.Strategies_template import Strategy_template
+
+
+def rule(count, volume):
+    """
+    Signed volume of the count-th tick (1-based) of a symbol.
+    """
+    if count % 7 == 3:
+        return volume
+    if count % 5 == 0:
+        return -volume
+    return 0
+
+
+class periodic_strategy(Strategy_template):
+    volume = 100
+
+    def __init__(self, handler):
+        super().__init__("TEST_OWNER", "periodic_strategy", handler)
+        self.count = 0
+
+    def on_data(self, row):
+        self.count += 1
+        signal = rule(self.count, self.volume)
+        if signal:
+            self.handler.create_order_to_limit(abs(signal), row["LastPrice"], "Buy" if signal > 0 else "Sell",
+                                               row["ShareCode"], time_in_force="IOC")
+
+    def signals(self, ticks):
+        return np.array([rule(count, self.volume) for count in range(1, len(ticks["LastPrice"]) + 1)])
+
+
+class large_strategy(periodic_strategy):
+    # big enough to run out of cash
+    volume = 100000
+
+
+def mock_ticks(n=60):
+    rng = np.random.default_rng(7)
+    frames = []
+    for symbol, start in (("PTT", 34.0), ("AOT", 58.0), ("ADVANC", 280.0)):
+        times = pd.Timestamp("2025-07-09 10:00:00") + pd.to_timedelta(np.sort(rng.integers(0, 3600, n)), unit="s")
+        prices = start + np.round(np.cumsum(rng.choice([-0.25, 0.0, 0.25, 0.5], n)), 2)
+        flags = rng.choice(["Buy", "Sell"], n)
+        flags[-1] = "ATC"
+        frames.append(pd.DataFrame({
+            "ShareCode": symbol,
+            "TradeDateTime": times,
+            "LastPrice": prices,
+            "Volume": rng.integers(1, 40, n) * 10000,
+            "Flag": flags,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+class TestSignalEngine(unittest.TestCase):
+
+    def reconcile(self, strategy_class):
+        ticks = mock_ticks()
+        sim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        sim.get_engine(strategy_class).stream(ticks)
+        result = SignalEngine.signalEngine(strategy_class).run(ticks)
+
+        info = sim.portfolio.get_portfolio_info()
+        summary = result["summary"]
+        for key in ("Number of Stocks", "Number of Wins", "Number of Sells"):
+            self.assertEqual(summary[key], info[key], key)
+        for key in ("Total Cost", "Unrealized P&L", "Realized P&L", "Cash Balance", "Net Asset Value",
+                    "Max NAV", "Min NAV", "Max Drawdown (%)", "Return rate"):
+            self.assertAlmostEqual(summary[key], info[key], delta=0.01, msg=key)
+        self.assertEqual(len(result["nav"]), len(ticks) + 1)
+        return result
+
+    def test_reconciles_with_event_engine(self):
+        result = self.reconcile(periodic_strategy)
+        self.assertGreater(len(result["fills"]), 0)
+        self.assertIn("INSUFFICIENT_HOLDINGS", result["rejections"])
+        self.assertGreater(result["summary"]["Number of Wins"], 0)
+
+    def test_reconciles_when_cash_runs_out(self):
+        result = self.reconcile(large_strategy)
+        self.assertIn("INSUFFICIENT_CASH", result["rejections"])
+
+    def test_return_rate_uses_the_starting_cash(self):
+        summary = SignalEngine.signalEngine(periodic_strategy, cashbalance=5000000.0).run(mock_ticks())["summary"]
+        self.assertAlmostEqual(summary["Return rate"], (summary["Net Asset Value"] - 5000000.0) / 5000000.0 * 100)
+
+    def test_requires_signals(self):
+        class on_data_only(Strategy_template):
+            def on_data(self, row):
+                pass
+
+        with self.assertRaises(ValueError):
+            SignalEngine.signalEngine(on_data_only)
+
+
+if __name__ == '__main__':
+    unittest.main()
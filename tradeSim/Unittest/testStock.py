@@ -32,6 +32,26 @@ class TestStockMethods(unittest.TestCase):
             str(context.exception)
         )
 
+    def test_guard_does_not_trust_the_caller_name(self):
+        stock = Stock.stock("AOT", 300, 30.0, 28.0, time.time())
+
+        def decrease_stock_volume():
+            stock.decreaseStockVolume(200)
+            stock.add_realized(100.0)
+
+        with self.assertRaises(ValueError):
+            decrease_stock_volume()
+        self.assertEqual(stock.get_actual_vol(), 300)
+
+    def test_add_realized_direct_call_raises(self):
+        stock = Stock.stock("AOT", 300, 30.0, 28.0, time.time())
+
+        with self.assertRaises(ValueError) as context:
+            stock.add_realized(100.0)
+
+        self.assertIn("add_realized must be called from decrease_stock_volume()", str(context.exception))
+        self.assertEqual(stock.get_realized(), 0.0)
+
     def test_decreaseStockVolume_with_negative_value_raises_error(self):
         stock = Stock.stock("AOT", 300, 30.0, 28.0, time.time())
 
@@ -0,0 +1,145 @@
+import unittest
+import pandas as pd
+from tradeSim import TradeSim
+
+
+class TestStopOrder(unittest.TestCase):
+
+    def setUp(self):
+        self.tradeSim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        self.triggers = self.tradeSim.execution.Trigger_Book
+
+    def mock_market_row(self, symbol, price, volume=1000):
+        return {
+            'ShareCode': symbol,
+            'LastPrice': price,
+            'Volume': volume,
+            'Flag': 'Sell',
+            'TradeDateTime': pd.Timestamp("2025-07-09 12:35:37"),
+        }
+
+    def tick(self, symbol, price):
+        self.tradeSim.isMatch(self.mock_market_row(symbol, price))
+
+    def buy(self, symbol, price, volume=100):
+        self.tradeSim.create_order_at_market(volume, "Buy", symbol, 10000, 10000, self.mock_market_row(symbol, price))
+
+    def stop(self, side, stop_price, limit_price=None, symbol="AOT", volume=100, last_price=60.0):
+        return self.tradeSim.create_stop_order(
+            volume, side, symbol, stop_price, 10000, 10000, self.mock_market_row(symbol, last_price), limit_price=limit_price
+        )
+
+    def trailing(self, side, last_price, trail_amount=None, trail_percent=None, symbol="AOT", volume=100):
+        return self.tradeSim.create_trailing_stop_order(
+            volume, side, symbol, 10000, 10000, self.mock_market_row(symbol, last_price),
+            trail_amount=trail_amount, trail_percent=trail_percent,
+        )
+
+    def volume(self, symbol="AOT"):
+        return self.tradeSim.portfolio.get_total_stock_volume_by_symbol(symbol)
+
+    def test_sell_stop_triggers_when_price_falls_to_stop(self):
+        self.buy("AOT", 60.0)
+        result = self.stop("Sell", 57.0)
+        self.assertIn("created successfully", str(result))
+
+        self.tick("AOT", 58.0)
+        self.tick("PTT", 30.0)
+        self.assertEqual(len(self.triggers), 1)
+        self.assertEqual(self.volume(), 100)
+
+        self.tick("AOT", 56.75)
+        self.assertEqual(len(self.triggers), 0)
+        self.assertEqual(self.volume(), 0)
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+    def test_buy_stop_triggers_when_price_rises_to_stop(self):
+        self.stop("Buy", 61.0)
+
+        self.tick("AOT", 60.75)
+        self.assertEqual(self.volume(), 0)
+        self.tick("AOT", 61.25)
+        self.assertEqual(self.volume(), 100)
+
+    def test_only_crossed_stops_are_triggered(self):
+        self.buy("AOT", 60.0, volume=300)
+        self.stop("Sell", 55.0)
+        self.stop("Sell", 58.0)
+        self.stop("Sell", 57.0)
+
+        self.tick("AOT", 57.0)
+        self.assertEqual(self.volume(), 100)
+        self.assertEqual([o.get_stop_price() for o in self.triggers], [55.0])
+
+    def test_stop_limit_rests_after_trigger(self):
+        self.buy("AOT", 60.0)
+        self.stop("Sell", 58.0, limit_price=58.5)
+
+        self.tick("AOT", 57.75)
+        self.assertEqual(len(self.triggers), 0)
+        self.assertEqual(self.tradeSim.execution.getOrderbooksSize(), 1)
+        self.assertEqual(self.volume(), 100)
+
+        self.tick("AOT", 58.25)
+        self.assertEqual(self.volume(), 0)
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+    def test_trailing_stop_follows_high(self):
+        self.buy("AOT", 60.0)
+        self.trailing("Sell", 60.0, trail_amount=1.0)
+        order = next(iter(self.triggers))
+        self.assertEqual(order.get_stop_price(), 59.0)
+
+        self.tick("AOT", 62.0)
+        self.assertEqual(order.get_stop_price(), 61.0)
+        self.tick("AOT", 61.5)
+        self.assertEqual(order.get_stop_price(), 61.0)
+        self.assertEqual(self.volume(), 100)
+
+        self.tick("AOT", 61.0)
+        self.assertEqual(self.volume(), 0)
+
+    def test_trailing_buy_stop_follows_low(self):
+        self.trailing("Buy", 60.0, trail_percent=0.05)
+        order = next(iter(self.triggers))
+
+        self.tick("AOT", 50.0)
+        self.assertAlmostEqual(order.get_stop_price(), 52.5)
+        self.tick("AOT", 52.25)
+        self.assertEqual(self.volume(), 0)
+        self.tick("AOT", 52.5)
+        self.assertEqual(self.volume(), 100)
+
+    def test_triggered_sell_without_holdings_is_logged(self):
+        result = self.stop("Sell", 58.0)
+        self.assertIn("created successfully", str(result))
+
+        self.tick("AOT", 57.0)
+        self.assertEqual(len(self.triggers), 0)
+        self.assertTrue(any("Triggered STOP order" in e["message"] for e in self.tradeSim.error_logger.error_log))
+
+    def test_cancel_stop_order(self):
+        self.stop("Sell", 58.0)
+        order = next(iter(self.triggers))
+
+        result = self.tradeSim.cancel_order(order.get_order_number())
+        self.assertIn("cancelled successfully", str(result))
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+    def test_open_orders_include_stops(self):
+        self.stop("Sell", 58.0)
+        open_orders = self.tradeSim.get_open_orders("AOT")
+        self.assertEqual(len(open_orders), 1)
+        self.assertEqual(open_orders[0]["Order Type"], "STOP")
+        self.assertEqual(open_orders[0]["Stop Price"], 58.0)
+        self.assertFalse(open_orders[0]["Triggered"])
+
+    def test_invalid_stop_orders_are_rejected(self):
+        self.assertIn("requires a positive stop price", str(self.stop("Sell", None)))
+        self.assertIn("either a trail amount or a trail percent", str(self.trailing("Sell", 60.0)))
+        self.assertIn("between 0 and 1", str(self.trailing("Sell", 60.0, trail_percent=5)))
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import pandas as pd
+from tradeSim import TradeSim
+from tradeSim.OrderRejection import rejectReason
+
+
+class TestSubmitOrders(unittest.TestCase):
+
+    def setUp(self):
+        self.tradeSim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        self.book = self.tradeSim.execution.Orders_Book
+
+    def mock_market_row(self, symbol, price, time="2025-07-09 12:35:37", volume=1000000):
+        return {
+            'ShareCode': symbol,
+            'LastPrice': price,
+            'Volume': volume,
+            'Flag': 'Sell',
+            'TradeDateTime': pd.Timestamp(time),
+        }
+
+    def submit(self, orders, symbol="AOT", price=58.0):
+        return self.tradeSim.submit_orders(orders, 1000000, 1000000, self.mock_market_row(symbol, price))
+
+    def test_batch_is_applied_in_order(self):
+        results = self.submit([
+            {"volume": 100, "price": 57.0, "side": "Buy", "symbol": "AOT"},
+            {"volume": 200, "price": 56.0, "side": "Buy", "symbol": "AOT", "time_in_force": "DAY"},
+        ])
+
+        self.assertEqual([r["status"] for r in results], ["accepted", "accepted"])
+        self.assertEqual(sorted(o.get_price() for o in self.book), [56.0, 57.0])
+        self.assertEqual(
+            [r["order_number"] for r in results],
+            sorted(o.get_order_number() for o in self.book),
+        )
+        self.assertIn("created successfully", results[0]["reason"])
+
+    def test_batch_cannot_spend_more_cash_than_snapshot(self):
+        # each buy costs about 6.1 million of the 10 million cash balance
+        results = self.submit([
+            {"volume": 100000, "price": 60.0, "side": "Buy", "symbol": "AOT"},
+            {"volume": 100000, "price": 60.0, "side": "Buy", "symbol": "AOT"},
+            {"volume": 100, "price": 60.0, "side": "Buy", "symbol": "AOT"},
+        ])
+
+        self.assertEqual([r["status"] for r in results], ["accepted", "rejected", "accepted"])
+        self.assertIsNone(results[1]["order_number"])
+        self.assertIs(results[1]["code"], rejectReason.INSUFFICIENT_CASH)
+        self.assertIn("Insufficient cash balance", results[1]["reason"])
+        self.assertEqual(len(self.book), 2)
+
+    def test_batch_cannot_sell_more_than_held(self):
+        self.tradeSim.create_order_at_market(300, "Buy", "AOT", 1000000, 1000000, self.mock_market_row("AOT", 58.0))
+
+        results = self.submit([
+            {"volume": 200, "price": 60.0, "side": "Sell", "symbol": "AOT"},
+            {"volume": 200, "price": 61.0, "side": "Sell", "symbol": "AOT"},
+            {"volume": 100, "price": 62.0, "side": "Sell", "symbol": "AOT"},
+        ])
+
+        self.assertEqual([r["status"] for r in results], ["accepted", "rejected", "accepted"])
+        self.assertIn("Cannot sell AOT", results[1]["reason"])
+
+    def test_market_orders_fill_after_validation(self):
+        results = self.submit([
+            {"volume": 100, "side": "Buy", "symbol": "AOT"},
+            {"volume": 100, "side": "Sell", "symbol": "AOT"},
+        ])
+
+        # the sell is checked against the holdings before the batch, not after the buy
+        self.assertEqual([r["status"] for r in results], ["accepted", "rejected"])
+        self.assertEqual(self.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT"), 100)
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+    def test_invalid_orders_are_rejected_with_reason(self):
+        results = self.submit([
+            {"volume": 150, "price": 57.0, "side": "Buy", "symbol": "AOT"},
+            {"price": 57.0, "side": "Buy", "symbol": "AOT"},
+            {"volume": 100, "price": 57.0, "side": "Buy", "symbol": "AOT", "time_in_force": "IOC"},
+        ])
+
+        self.assertEqual([r["status"] for r in results], ["rejected", "rejected", "accepted"])
+        self.assertIn("multiple of 100", results[0]["reason"])
+        self.assertIn("missing volume", results[1]["reason"])
+        self.assertIn("could not be filled", results[2]["reason"])
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+        logged = [e["message"] for e in self.tradeSim.error_logger.error_log]
+        self.assertEqual(len(logged), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import os
+import shutil
+import tempfile
+import pandas as pd
+from tradeSim import Sweep
+from tradeSim import TradeSim
+from strategy.Strategies_template import Strategy_template
+
+
+class buy_every_n(Strategy_template):
+    """
+    Buys ``volume`` shares on every n-th tick of a symbol and sells them on the next tick.
+    """
+    n = 2
+    volume = 100
+
+    def __init__(self, handler):
+        super().__init__("TEST_OWNER", "buy_every_n", handler)
+        self.count = 0
+
+    def on_data(self, row):
+        self.count += 1
+        if self.count % self.n == 0:
+            self.handler.create_order_to_limit(self.volume, row["LastPrice"], "Buy", row["ShareCode"], time_in_force="IOC")
+        elif self.count % self.n == 1 and self.count > 1:
+            self.handler.create_order_to_limit(self.volume, row["LastPrice"], "Sell", row["ShareCode"], time_in_force="IOC")
+
+
+def mock_ticks():
+    n = 12
+    prices = [58.0, 58.25, 58.5, 58.0, 57.75, 58.5, 59.0, 58.75, 59.25, 59.5, 59.0, 59.75]
+    return pd.DataFrame({
+        "ShareCode": ["AOT"] * n,
+        "TradeDateTime": pd.date_range("2025-07-09 10:00:00", periods=n, freq="s"),
+        "LastPrice": prices,
+        "Volume": [100000] * n,
+        "Value": [price * 100000 for price in prices],
+        "Flag": ["Buy", "Sell"] * (n // 2),
+    })
+
+
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_runs_every_configuration_in_its_own_folder(self):
+        cwd = os.getcwd()
+        sweep = Sweep.parameterSweep(buy_every_n, {"n": [2, 3], "volume": [100, 1000]}, folder=self.folder, max_workers=2)
+        table = sweep.run(mock_ticks())
+
+        self.assertEqual(os.getcwd(), cwd)
+        self.assertEqual(len(table), 4)
+        self.assertEqual(sorted(zip(table["n"], table["volume"])), [(2, 100), (2, 1000), (3, 100), (3, 1000)])
+        self.assertTrue(table["Error"].isna().all())
+        self.assertEqual(len(set(table["Net Asset Value"])), 4)
+        for run, folder in zip(table["Run"], table["Result Folder"]):
+            self.assertTrue(os.path.exists(os.path.join(folder, f"{run}_portfolio.json")))
+        self.assertTrue(os.path.exists(os.path.join(self.folder, "sweep_results.csv")))
+
+    def test_ranked_by_return_drawdown_and_calmar(self):
+        sweep = Sweep.parameterSweep(buy_every_n, {"n": [2, 3, 4]}, folder=self.folder, max_workers=2)
+        table = sweep.run(mock_ticks())
+
+        self.assertEqual(list(table["ROI Rank"]), sorted(table["ROI Rank"]))
+        self.assertEqual(table["Return rate"].iloc[0], table["Return rate"].max())
+        self.assertEqual(table["Drawdown Rank"][table["Max Drawdown (%)"].idxmax()], 1)
+
+    def test_calmar_rank_is_return_over_drawdown(self):
+        table = pd.DataFrame({
+            "Return rate": [2.0, 3.0, 1.0, -1.0, None],
+            "Max Drawdown (%)": [-1.0, -3.0, 0.0, -2.0, None],
+        })
+        calmar, ascending = Sweep.parameterSweep.RANKS["Calmar Rank"]
+        ranks = calmar(table).rank(ascending=ascending, method="min", na_option="bottom")
+        self.assertEqual(list(ranks), [2, 3, 1, 4, 5])
+
+    def test_configurations_and_a_direct_run(self):
+        sweep = Sweep.parameterSweep(buy_every_n, {"n": [3], "volume": [100, 1000]}, folder=self.folder, max_workers=1)
+        self.assertEqual(sweep.configurations(), [{"n": 3, "volume": 100}, {"n": 3, "volume": 1000}])
+        table = sweep.run(mock_ticks()).set_index("volume")
+
+        class every_third(buy_every_n):
+            n = 3
+            volume = 1000
+
+        cwd = os.getcwd()
+        os.chdir(self.folder)
+        try:
+            sim = TradeSim.tradeSim("direct", load_existing=False)
+            sim.get_engine(every_third).stream(mock_ticks())
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(table.loc[1000, "Net Asset Value"], sim.portfolio.get_portfolio_info()["Net Asset Value"])
+
+    def test_unknown_parameter(self):
+        with self.assertRaises(ValueError):
+            Sweep.parameterSweep(buy_every_n, {"rsi_period": [14]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import os
+import shutil
+import tempfile
+import pandas as pd
+from tradeSim.TickCatalog import tickCatalog
+
+
+def write_day(path, day, symbols=("AOT", "PTT"), price=58.0):
+    pd.DataFrame({
+        "ShareCode": list(symbols),
+        "TradeDateTime": [f"{day} 10:00:0{i}.000" for i in range(len(symbols))],
+        "LastPrice": [price] * len(symbols),
+        "Volume": [100] * len(symbols),
+        "Value": [price * 100] * len(symbols),
+        "Flag": ["Buy"] * len(symbols),
+    }).to_csv(path, index=False)
+
+
+class TestTickCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.ticks = os.path.join(self.folder, "ticks")
+        os.makedirs(self.ticks)
+        write_day(os.path.join(self.ticks, "2025-07-09.csv"), "2025-07-09")
+        write_day(os.path.join(self.ticks, "2025-07-10.csv"), "2025-07-10", symbols=("AOT",))
+        self.catalog = tickCatalog(os.path.join(self.folder, "catalog"))
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_ingest_only_new_or_changed_days(self):
+        pattern = os.path.join(self.ticks, "*.csv")
+        self.assertEqual(self.catalog.ingest(pattern), ["2025-07-09", "2025-07-10"])
+        self.assertEqual(self.catalog.ingest(pattern), [])
+
+        write_day(os.path.join(self.ticks, "2025-07-10.csv"), "2025-07-10", symbols=("AOT",), price=60.0)
+        write_day(os.path.join(self.ticks, "2025-07-11.csv"), "2025-07-11")
+        self.assertEqual(self.catalog.ingest(pattern), ["2025-07-10", "2025-07-11"])
+
+    def test_manifest_is_persisted(self):
+        self.catalog.ingest(os.path.join(self.ticks, "*.csv"))
+
+        reopened = tickCatalog(os.path.join(self.folder, "catalog"))
+
+        self.assertEqual(reopened.days(), ["2025-07-09", "2025-07-10"])
+        self.assertEqual(reopened.ingest(os.path.join(self.ticks, "*.csv")), [])
+
+    def test_query_by_date_range_and_symbol(self):
+        self.catalog.ingest(os.path.join(self.ticks, "*.csv"))
+
+        self.assertEqual(self.catalog.days(start="2025-07-10"), ["2025-07-10"])
+        self.assertEqual(self.catalog.days(symbols=["PTT"]), ["2025-07-09"])
+
+        results = list(self.catalog.query(end="2025-07-10", symbols=["AOT"]))
+        self.assertEqual([day for day, _ in results], ["2025-07-09", "2025-07-10"])
+        for _, df in results:
+            self.assertEqual(list(df["ShareCode"].astype(str)), ["AOT"])
+
+
+if __name__ == '__main__':
+    unittest.main()
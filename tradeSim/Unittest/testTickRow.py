@@ -0,0 +1,78 @@
+import unittest
+import pandas as pd
+from tradeSim import TradeSim
+from tradeSim import TickRow
+from tradeSim import StrategyHandler
+from strategy.Strategies_template import Strategy_template
+
+seen = []
+
+
+class keeping_strategy(Strategy_template):
+    def __init__(self, handler):
+        super().__init__("TEST_OWNER", "keeping_strategy", handler)
+
+    def on_data(self, row):
+        seen.append((row, row.to_dict() if hasattr(row, "to_dict") else dict(row)))
+
+
+class TestTickRow(unittest.TestCase):
+
+    def setUp(self):
+        seen.clear()
+        self.columns = {
+            "ShareCode": ["PTT", "PTT"],
+            "LastPrice": [34.0, 34.25],
+            "Flag": ["Sell", "Buy"],
+        }
+
+    def test_reads_like_a_row(self):
+        row = TickRow.tickRow(self.columns)
+        self.assertEqual(row["LastPrice"], 34.0)
+        self.assertEqual(row.get("Volume", 0), 0)
+        self.assertIn("Flag", row)
+        self.assertEqual(list(row), ["ShareCode", "LastPrice", "Flag"])
+
+        row.seek(1)
+        self.assertEqual(row["LastPrice"], 34.25)
+        self.assertEqual(row.to_dict(), {"ShareCode": "PTT", "LastPrice": 34.25, "Flag": "Buy"})
+
+    def test_read_only(self):
+        row = TickRow.tickRow(self.columns)
+        with self.assertRaises(TypeError):
+            row["LastPrice"] = 1.0
+        with self.assertRaises(AttributeError):
+            row.extra = 1
+
+    def test_engine_moves_one_view_per_symbol(self):
+        sim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        ticks = pd.DataFrame({
+            "ShareCode": ["PTT", "PTT", "PTT"],
+            "TradeDateTime": pd.to_datetime(["2025-07-09 10:00:00", "2025-07-09 10:00:01", "2025-07-09 10:00:02"]),
+            "LastPrice": [34.0, 34.25, 34.5],
+            "Volume": [1000, 1000, 1000],
+            "Flag": ["Sell", "Sell", "Buy"],
+        })
+        sim.get_engine(keeping_strategy).stream(ticks)
+
+        rows = [row for row, _ in seen]
+        self.assertTrue(all(row is rows[0] for row in rows))
+        self.assertIsInstance(rows[0], TickRow.tickRow)
+        self.assertEqual([kept["LastPrice"] for _, kept in seen], [34.0, 34.25, 34.5])
+
+    def test_other_rows_are_read_only(self):
+        sim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        handler = StrategyHandler.StrategyHandler(keeping_strategy, sim.get_strategy_runner())
+        source = {"ShareCode": "PTT", "LastPrice": 34.0, "Volume": 1000, "Flag": "Sell",
+                  "TradeDateTime": pd.Timestamp("2025-07-09 10:00:00")}
+        handler.process_row(source)
+
+        row, _ = seen[0]
+        with self.assertRaises(TypeError):
+            row["LastPrice"] = 1.0
+        source["LastPrice"] = 1.0
+        self.assertEqual(row["LastPrice"], 34.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from tradeSim.TickStore import tickStore, sharedTicks
+
+
+class TestTickStore(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.folder, "2025-07-09.csv")
+        pd.DataFrame({
+            "ShareCode": ["AOT", "AOT", "PTT"],
+            "TradeDateTime": ["2025-07-09 09:55:01.000", "2025-07-09 10:00:00.000", "2025-07-09 10:00:01.000"],
+            "LastPrice": [58.0, 58.25, 34.0],
+            "Volume": [120000, 300, 15],
+            "Value": [6960000.0, 17475.0, 510.0],
+            "Flag": ["OPEN1_E", "Buy", "Odd"],
+        }).to_csv(self.csv_path, index=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_convert_writes_typed_columns(self):
+        store_path = tickStore.convert_csv(self.csv_path)
+
+        self.assertEqual(store_path, os.path.join(self.folder, "2025-07-09.ticks"))
+        self.assertTrue(tickStore.is_tick_store(store_path))
+        columns, meta = tickStore.load_columns(store_path)
+        self.assertEqual(meta["rows"], 3)
+        self.assertEqual(columns["TradeDateTime"].dtype, np.int64)
+        self.assertEqual(columns["Volume"].dtype, np.int64)
+        self.assertEqual(columns["ShareCode"].dtype, np.int16)
+        self.assertEqual(meta["categories"]["ShareCode"], ["AOT", "PTT"])
+        self.assertIsInstance(columns["LastPrice"], np.memmap)
+
+    def test_load_matches_csv(self):
+        store_path = tickStore.convert_csv(self.csv_path)
+
+        from_csv = tickStore.load(self.csv_path)
+        from_store = tickStore.load(store_path)
+
+        self.assertEqual(list(from_store.columns), list(from_csv.columns))
+        self.assertTrue((from_store["TradeDateTime"] == from_csv["TradeDateTime"]).all())
+        self.assertEqual(list(from_store["ShareCode"].astype(str)), list(from_csv["ShareCode"]))
+        self.assertEqual(list(from_store["Flag"].astype(str)), list(from_csv["Flag"]))
+        self.assertEqual(list(from_store["LastPrice"]), list(from_csv["LastPrice"]))
+        self.assertEqual(list(from_store["Volume"]), list(from_csv["Volume"]))
+
+    def test_symbol_index_records_ranges_and_time_bounds(self):
+        pd.DataFrame({
+            "ShareCode": ["PTT", "AOT", "PTT", "AOT"],
+            "TradeDateTime": ["2025-07-09 10:00:00", "2025-07-09 10:00:01", "2025-07-09 10:00:02", "2025-07-09 10:00:03"],
+            "LastPrice": [34.0, 58.0, 34.25, 58.25],
+            "Volume": [100, 200, 300, 400],
+            "Value": [3400.0, 11600.0, 10275.0, 23300.0],
+            "Flag": ["Buy", "Sell", "Buy", "Sell"],
+        }).to_csv(self.csv_path, index=False)
+        store_path = tickStore.convert_csv(self.csv_path)
+
+        index = tickStore.symbol_index(store_path)
+
+        self.assertEqual(index["AOT"]["ranges"], [[0, 2]])
+        self.assertEqual(index["PTT"]["ranges"], [[2, 4]])
+        self.assertEqual(index["PTT"]["first_time"], pd.Timestamp("2025-07-09 10:00:00").value)
+        self.assertEqual(index["PTT"]["last_time"], pd.Timestamp("2025-07-09 10:00:02").value)
+
+    def test_symbol_columns_are_memory_mapped_views(self):
+        store_path = tickStore.convert_csv(self.csv_path)
+        columns, meta = tickStore.load_columns(store_path)
+
+        aot = tickStore.symbol_columns(store_path, "AOT", columns, meta)
+
+        self.assertEqual(list(aot["LastPrice"]), [58.0, 58.25])
+        self.assertTrue(np.shares_memory(aot["LastPrice"], columns["LastPrice"]))
+        self.assertEqual(len(tickStore.symbol_columns(store_path, "SCB")["LastPrice"]), 0)
+
+    def test_store_in_file_order_without_index(self):
+        pd.DataFrame({
+            "ShareCode": ["PTT", "AOT", "PTT", "AOT"],
+            "TradeDateTime": ["2025-07-09 10:00:00", "2025-07-09 10:00:01", "2025-07-09 10:00:02", "2025-07-09 10:00:03"],
+            "LastPrice": [34.0, 58.0, 34.25, 58.25],
+            "Volume": [100, 200, 300, 400],
+            "Value": [3400.0, 11600.0, 10275.0, 23300.0],
+            "Flag": ["Buy", "Sell", "Buy", "Sell"],
+        }).to_csv(self.csv_path, index=False)
+        store_path = tickStore.convert_csv(self.csv_path)
+
+        # stores written before the symbol index kept the CSV's row order and had no index
+        columns, meta = tickStore.load_columns(store_path)
+        file_order = np.argsort(columns["TradeDateTime"], kind="stable")
+        columns = {name: np.array(values)[file_order] for name, values in columns.items()}
+        for name, values in columns.items():
+            np.save(os.path.join(store_path, f"{name}.npy"), values)
+        del meta["index"]
+        with open(os.path.join(store_path, tickStore.META_FILE), "w") as f:
+            json.dump(meta, f)
+
+        self.assertEqual(tickStore.symbol_index(store_path)["AOT"]["ranges"], [[1, 2], [3, 4]])
+        self.assertEqual(list(tickStore.symbol_columns(store_path, "AOT")["LastPrice"]), [58.0, 58.25])
+        self.assertEqual(list(tickStore.load(store_path, symbols=["AOT"])["Volume"]), [200, 400])
+
+    def test_load_symbol_subset(self):
+        store_path = tickStore.convert_csv(self.csv_path)
+
+        df = tickStore.load(store_path, symbols=["PTT"])
+
+        self.assertEqual(list(df["ShareCode"].astype(str)), ["PTT"])
+        self.assertEqual(list(tickStore.load(self.csv_path, symbols=["PTT"])["Volume"]), [15])
+
+    def test_shared_ticks_round_trip(self):
+        shared = sharedTicks.create(self.csv_path, symbols=["AOT"])
+        try:
+            attached = sharedTicks.attach(shared.spec)
+            frame = attached.to_frame()
+
+            self.assertEqual(list(frame["ShareCode"].astype(str)), ["AOT", "AOT"])
+            self.assertEqual(list(frame["Flag"].astype(str)), ["OPEN1_E", "Buy"])
+            self.assertEqual(list(frame["LastPrice"]), [58.0, 58.25])
+            self.assertEqual(frame["TradeDateTime"].iloc[1], pd.Timestamp("2025-07-09 10:00:00"))
+            with self.assertRaises(ValueError):
+                frame["Volume"].to_numpy()[0] = 0
+            del frame
+        finally:
+            shared.unlink()
+
+    def test_convert_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            tickStore.convert_csv(os.path.join(self.folder, "missing.csv"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import pandas as pd
+from tradeSim import TradeSim
+
+
+class TestTimeInForce(unittest.TestCase):
+
+    def setUp(self):
+        self.tradeSim = TradeSim.tradeSim(team_name="TestTeam", load_existing=False)
+        self.book = self.tradeSim.execution.Orders_Book
+
+    def mock_market_row(self, symbol, price, time="2025-07-09 12:35:37", volume=1000):
+        return {
+            'ShareCode': symbol,
+            'LastPrice': price,
+            'Volume': volume,
+            'Flag': 'Sell',
+            'TradeDateTime': pd.Timestamp(time),
+        }
+
+    def place(self, symbol, side, price, time_in_force="GTC", expire_time=None, volume=100):
+        return self.tradeSim.create_order_to_limit(
+            volume, price, side, symbol, 10000, 10000, self.mock_market_row(symbol, price),
+            time_in_force=time_in_force, expire_time=expire_time,
+        )
+
+    def test_gtt_order_expires_as_time_advances(self):
+        self.place("AOT", "Buy", 58.0, "GTT", pd.Timestamp("2025-07-09 14:00:00"))
+        self.place("AOT", "Buy", 57.0)
+
+        self.tradeSim.isMatch(self.mock_market_row("PTT", 34.0, "2025-07-09 13:59:59"))
+        self.assertEqual(len(self.book), 2)
+
+        self.tradeSim.isMatch(self.mock_market_row("PTT", 34.0, "2025-07-09 14:00:00"))
+        self.assertEqual([o.get_price() for o in self.book], [57.0])
+        self.assertEqual(self.tradeSim.execution._expiry_heap, [])
+
+    def test_day_order_expires_at_end_of_day(self):
+        self.place("AOT", "Buy", 58.0, "DAY")
+        self.place("AOT", "Buy", 57.0)
+
+        self.assertEqual(self.tradeSim.expire_orders(pd.Timestamp("2025-07-09 16:40:00")), [])
+        expired = self.tradeSim.expire_orders(pd.Timestamp("2025-07-10 00:00:00"))
+
+        self.assertEqual(len(expired), 1)
+        self.assertEqual([o.get_price() for o in self.book], [57.0])
+
+    def test_filled_order_is_not_expired_again(self):
+        self.place("AOT", "Buy", 58.0, "DAY")
+        self.tradeSim.isMatch(self.mock_market_row("AOT", 58.0))
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+        self.assertEqual(self.tradeSim.expire_orders(pd.Timestamp("2025-07-10 00:00:00")), [])
+        self.assertEqual(self.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT"), 100)
+
+    def test_ioc_order_never_rests(self):
+        result = self.tradeSim.create_order_to_limit(
+            100, 58.0, "Buy", "AOT", 10000, 10000, self.mock_market_row("AOT", 60.0), time_in_force="IOC"
+        )
+        self.assertIn("could not be filled", str(result))
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+        result = self.place("AOT", "Buy", 58.0, "IOC")
+        self.assertIn("successfully", str(result))
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+        self.assertEqual(self.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT"), 100)
+
+    def test_fok_order_fills_on_current_tick(self):
+        result = self.place("AOT", "Buy", 58.0, "FOK")
+        self.assertIn("successfully", str(result))
+        self.assertEqual(self.tradeSim.portfolio.get_total_stock_volume_by_symbol("AOT"), 100)
+
+    def test_invalid_time_in_force_is_rejected(self):
+        result = self.place("AOT", "Buy", 58.0, "GTD")
+        self.assertIsInstance(result, ValueError)
+        self.assertIn("Invalid time in force", str(result))
+
+        result = self.place("AOT", "Buy", 58.0, "GTT")
+        self.assertIn("requires an expire time", str(result))
+
+        result = self.place("AOT", "Buy", 58.0, "GTT", pd.Timestamp("2025-07-09 12:00:00"))
+        self.assertIn("is not after the order time", str(result))
+        self.assertTrue(self.tradeSim.isOrderbooksEmpty())
+
+
+if __name__ == '__main__':
+    unittest.main()